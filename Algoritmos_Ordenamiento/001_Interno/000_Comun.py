@@ -0,0 +1,98 @@
+# ==============================================================================
+# 17. Utilidades Comunes de los Algoritmos Internos
+#
+# Piezas que comparten los algoritmos de 001_Interno. Cada algoritmo carga este
+# archivo con importlib (008 y 010, con el cargar_modulo que ya usan para
+# cargar otros módulos):
+#   - ordenar_con_clave: 'key'/'reverse' (como en sorted()) sobre un algoritmo
+#     que sólo sabe ordenar valores (decorar-ordenar-desdecorar).
+#   - insercion_binaria: el núcleo de Inserción binaria con el que QuickSort,
+#     MergeSort y los de cubetas terminan los tramos pequeños.
+#   - como_vista y FORMATOS_*: entrada por protocolo de búfer (array.array,
+#     memoryview, numpy.ndarray).
+# ==============================================================================
+
+from bisect import bisect_right
+
+# Formatos de memoryview (struct) que se ordenan como enteros y como reales
+FORMATOS_ENTEROS = 'bBhHiIlLqQ'
+FORMATOS_REALES = 'fd'
+
+# --- Ordenamiento por Clave (decorar-ordenar-desdecorar) ---
+
+def ordenar_con_clave(lista, key, reverse, ordenar):
+    """
+    Aplica 'key'/'reverse' a un algoritmo que sólo sabe ordenar valores.
+    Calcula cada clave una sola vez, ordena el arreglo compacto de claves con
+    'ordenar' y reconstruye la permutación de índices: las posiciones originales
+    de cada clave se consumen en orden, así que el resultado es estable también
+    con reverse=True, sin invertir dos veces. Cada elemento se toca una única
+    vez, al construir la lista resultante.
+    """
+    claves = list(lista) if key is None else [key(elemento) for elemento in lista]
+    return ordenar_con_claves_calculadas(lista, claves, reverse, ordenar)
+
+def ordenar_con_claves_calculadas(lista, claves, reverse, ordenar):
+    """ordenar_con_clave con las claves de cada elemento ya calculadas."""
+    try:
+        # Posiciones originales de cada clave, de atrás hacia adelante para
+        # poder consumirlas en orden con pop()
+        posiciones = {}
+        for indice in range(len(claves) - 1, -1, -1):
+            posiciones.setdefault(claves[indice], []).append(indice)
+    except TypeError:
+        # Claves no hashables: se ordenan pares (clave, índice)
+        if reverse:
+            pares = ordenar([(clave, -indice) for indice, clave in enumerate(claves)])
+            return [lista[-indice] for _, indice in reversed(pares)]
+        pares = ordenar([(clave, indice) for indice, clave in enumerate(claves)])
+        return [lista[indice] for _, indice in pares]
+
+    claves_ordenadas = ordenar(claves)
+    if reverse:
+        claves_ordenadas = reversed(claves_ordenadas)
+    return [lista[posiciones[clave].pop()] for clave in claves_ordenadas]
+
+# --- Inserción Binaria ---
+
+def insercion_binaria(lista, inicio, fin, ordenado_hasta):
+    """
+    Inserción binaria: lista[inicio:ordenado_hasta] ya está ordenada y se le
+    insertan los elementos de lista[ordenado_hasta:fin]. La posición se busca
+    con bisect y el hueco se abre moviendo el bloque con una sola asignación.
+    """
+    # Iteramos sobre los elementos que faltan por insertar
+    for i in range(ordenado_hasta, fin):
+        # Guardamos el valor actual para insertarlo en la posición correcta
+        valor_actual = lista[i]
+        # Búsqueda binaria de la posición; bisect_right deja los iguales
+        # delante, por lo que la ordenación es estable
+        posicion = bisect_right(lista, valor_actual, inicio, i)
+
+        if posicion < i:
+            # Desplazamos en bloque una posición a la derecha los elementos
+            # mayores que valor_actual
+            lista[posicion + 1:i + 1] = lista[posicion:i]
+            # Insertamos el valor_actual en su posición correcta
+            lista[posicion] = valor_actual
+
+# --- Entrada por Protocolo de Búfer (array.array, memoryview, NumPy) ---
+
+def como_vista(datos):
+    """
+    Devuelve una memoryview 1-D escribible sobre 'datos' si éste implementa el
+    protocolo de búfer (array.array, bytearray, memoryview, numpy.ndarray...)
+    o None si no (p. ej. una lista). Escribir en la vista escribe en el
+    original, con su mismo tipo y sus mismos saltos (strides).
+    """
+    if isinstance(datos, list):
+        return None
+    try:
+        vista = memoryview(datos)
+    except TypeError:
+        return None
+    if vista.readonly:
+        raise TypeError("No se puede ordenar in-place un búfer de sólo lectura.")
+    if vista.ndim != 1:
+        raise ValueError("Sólo se pueden ordenar búferes unidimensionales.")
+    return vista
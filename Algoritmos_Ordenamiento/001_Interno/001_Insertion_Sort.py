@@ -1,30 +1,40 @@
 # ==============================================================================
 # 1. Ordenamiento por Inserción (Insertion Sort)
+#
+# Variante de Inserción binaria: la posición de cada elemento se busca con
+# bisect (O(log n) comparaciones) y el bloque mayor se desplaza con una sola
+# asignación de slice en lugar de mover los elementos uno a uno.
+# Su núcleo (insercion_binaria, en 000_Comun.py) es el que usan QuickSort y
+# MergeSort para ordenar las particiones pequeñas.
 # ==============================================================================
 
-def insertion_sort(lista):
+import importlib.util
+import os
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+def insertion_sort(lista, lo=0, hi=None, key=None, reverse=False):
     """
     Ordena una lista utilizando el algoritmo de Inserción.
-    Construye la lista ordenada un elemento a la vez.
+    Construye la lista ordenada un elemento a la vez. Si se indican 'lo' y
+    'hi', sólo ordena (in-place) el subrango lista[lo:hi].
+    'key' y 'reverse' se comportan como en sorted().
     """
-    # Iteramos sobre la lista, comenzando desde el segundo elemento (índice 1)
-    for i in range(1, len(lista)):
-        # Guardamos el valor actual para insertarlo en la posición correcta
-        valor_actual = lista[i]
-        # Inicializamos la posición para la comparación
-        posicion = i
+    if hi is None:
+        hi = len(lista)
+    if key is not None or reverse:
+        lista[lo:hi] = _comun.ordenar_con_clave(lista[lo:hi], key, reverse, insertion_sort)
+        return lista
+    if hi - lo > 1:
+        _comun.insercion_binaria(lista, lo, hi, lo + 1)
 
-        # Movemos los elementos de la sublista ordenada que son mayores que
-        # valor_actual una posición a la derecha.
-        while posicion > 0 and lista[posicion - 1] > valor_actual:
-            # Desplazamos el elemento a la derecha
-            lista[posicion] = lista[posicion - 1]
-            # Movemos la posición de comparación a la izquierda
-            posicion = posicion - 1
-
-        # Insertamos el valor_actual en su posición correcta en la sublista ordenada
-        lista[posicion] = valor_actual
-    
     return lista
 
 # Ejemplo de Uso
@@ -33,3 +43,7 @@ if __name__ == '__main__':
     print("Datos originales:", datos)
     lista_ordenada = insertion_sort(datos)
     print("Insertion Sort:", lista_ordenada)
+
+    datos = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    print("Datos originales:", datos)
+    print("Insertion Sort de [2:7]:", insertion_sort(datos, 2, 7))
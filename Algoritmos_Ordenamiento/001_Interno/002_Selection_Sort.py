@@ -1,12 +1,37 @@
 # ==============================================================================
 # 2. Ordenamiento por Selección (Selection Sort)
+#
+# Incluye iter_sorted: una Selección perezosa por torneo (Tree Selection Sort)
+# que entrega los elementos en orden a medida que se piden. Construir el
+# torneo cuesta O(n) y cada siguiente mínimo O(log n), así que quien consume
+# sólo los k primeros paga O(n + k log n) en lugar de la ordenación completa.
 # ==============================================================================
 
-def selection_sort(lista):
+import importlib.util
+import os
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+def selection_sort(lista, key=None, reverse=False, observador=None):
     """
     Ordena una lista utilizando el algoritmo de Selección.
     Encuentra el elemento mínimo y lo coloca al principio de la sublista no ordenada.
+    Admite 'key' y 'reverse' como sorted(); con ellos el orden es estable.
+    Con un 'observador' (ver 009_Instrumentacion.py) informa de sus
+    comparaciones e intercambios al terminar.
     """
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(
+            lista, key, reverse, lambda claves: selection_sort(claves, observador=observador))
+        return lista
+
     # Iteramos sobre toda la lista
     for i in range(len(lista)):
         # Asumimos que el elemento actual es el mínimo
@@ -21,12 +46,73 @@ def selection_sort(lista):
         # Intercambiamos el elemento mínimo encontrado con el elemento en la posición 'i'
         # Esto coloca el elemento mínimo en la sublista ordenada
         lista[i], lista[indice_minimo] = lista[indice_minimo], lista[i]
-    
+
+    if observador is not None:
+        # Selección hace siempre n·(n-1)/2 comparaciones y un intercambio por posición
+        n = len(lista)
+        observador.registrar('selection_sort', comparaciones=n * (n - 1) // 2,
+                             intercambios=n)
+
     return lista
 
+# --- Selección Perezosa por Torneo ---
+
+def iter_sorted(datos, key=None, reverse=False):
+    """
+    Generador que produce los elementos de 'datos' (cualquier iterable) en
+    orden, uno a uno y bajo demanda. 'key' y 'reverse' se comportan como en
+    sorted(), y el orden es estable. No modifica 'datos'.
+    Usa un árbol de torneo: cada nodo interno guarda el índice del ganador
+    (el menor, o el mayor con reverse) de sus dos hijos. Tras entregar al
+    campeón se retira su hoja y sólo se rejuega el camino hasta la raíz.
+    """
+    elementos = list(datos)
+    n = len(elementos)
+    if n == 0:
+        return
+    claves = elementos if key is None else [key(elemento) for elemento in elementos]
+
+    VACIO = -1
+
+    def ganador(a, b):
+        # Gana el menor (o el mayor con reverse); ante empate, el que llegó antes
+        if a == VACIO:
+            return b
+        if b == VACIO:
+            return a
+        if reverse:
+            antes = not claves[b] < claves[a] if b < a else claves[a] < claves[b]
+            return b if antes else a
+        antes = claves[b] < claves[a] if a < b else not claves[a] < claves[b]
+        return b if antes else a
+
+    # 1. Construir el torneo en O(n): las hojas n..2n-1 son los índices de los
+    # elementos y cada nodo interno p juega entre sus hijos 2p y 2p+1
+    arbol = [VACIO] * n + list(range(n))
+    for p in range(n - 1, 0, -1):
+        arbol[p] = ganador(arbol[2 * p], arbol[2 * p + 1])
+
+    # 2. Entregar al campeón, retirar su hoja y rejugar su camino: O(log n)
+    for _ in range(n):
+        # Con n == 1 la hoja 1 es a la vez la raíz
+        campeon = arbol[1]
+        yield elementos[campeon]
+        p = n + campeon
+        arbol[p] = VACIO
+        p //= 2
+        while p >= 1:
+            arbol[p] = ganador(arbol[2 * p], arbol[2 * p + 1])
+            p //= 2
+
 # Ejemplo de Uso
 if __name__ == '__main__':
     datos = [64, 25, 12, 22, 11]
     print("Datos originales:", datos)
     lista_ordenada = selection_sort(datos)
     print("Selection Sort:", lista_ordenada)
+
+    # Primera página de un listado grande sin ordenarlo entero
+    import random
+    from itertools import islice
+    registros = [random.randint(0, 10**6) for _ in range(100000)]
+    print("Primeros 5 (iter_sorted):", list(islice(iter_sorted(registros), 5)))
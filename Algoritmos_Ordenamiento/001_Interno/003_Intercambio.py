@@ -2,12 +2,36 @@
 # 3. Ordenamiento por Intercambio (Bubble Sort)
 # ==============================================================================
 
-def bubble_sort(lista):
+import importlib.util
+import os
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+def bubble_sort(lista, key=None, reverse=False, observador=None):
     """
     Ordena una lista utilizando el algoritmo de Intercambio (Burbuja).
     Compara repetidamente pares de elementos adyacentes y los intercambia si están en el orden incorrecto.
+    'key' y 'reverse' se comportan como en sorted().
+    Con un 'observador' (ver 009_Instrumentacion.py) informa de sus
+    pasadas, comparaciones e intercambios al terminar.
     """
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(
+            lista, key, reverse, lambda claves: bubble_sort(claves, observador=observador))
+        return lista
+
     n = len(lista)
+    if observador is not None:
+        # Cada intercambio adyacente deshace exactamente una inversión, así que
+        # se cuentan antes de ordenar (en O(n log n)) en lugar de en el bucle
+        intercambios = _contar_inversiones(lista)
     # Bucle principal para controlar el número de pasadas
     for i in range(n - 1):
         # Bandera para optimización: si no hay intercambios en una pasada, la lista está ordenada
@@ -25,9 +49,46 @@ def bubble_sort(lista):
         # Si no hubo intercambios en esta pasada, la lista ya está ordenada
         if not intercambiado:
             break
-            
+
+    if observador is not None:
+        # La pasada i compara n - 1 - i pares; 'i' es la última pasada hecha
+        pasadas = i + 1 if n > 1 else 0
+        observador.registrar('bubble_sort', pasadas=pasadas,
+                             comparaciones=pasadas * (n - 1) - pasadas * (pasadas - 1) // 2,
+                             intercambios=intercambios)
+
     return lista
 
+def _contar_inversiones(lista):
+    """
+    Cuenta los pares (i < j) con lista[i] > lista[j] mediante un MergeSort
+    sobre una copia: al tomar un elemento del run derecho, todos los que
+    quedan en el izquierdo forman inversión con él.
+    """
+    actual = list(lista)
+    n = len(actual)
+    inversiones = 0
+    ancho = 1
+    while ancho < n:
+        siguiente = []
+        for inicio in range(0, n, 2 * ancho):
+            izquierda = actual[inicio:inicio + ancho]
+            derecha = actual[inicio + ancho:inicio + 2 * ancho]
+            i = j = 0
+            while i < len(izquierda) and j < len(derecha):
+                if derecha[j] < izquierda[i]:
+                    siguiente.append(derecha[j])
+                    inversiones += len(izquierda) - i
+                    j += 1
+                else:
+                    siguiente.append(izquierda[i])
+                    i += 1
+            siguiente.extend(izquierda[i:])
+            siguiente.extend(derecha[j:])
+        actual = siguiente
+        ancho *= 2
+    return inversiones
+
 # Ejemplo de Uso
 if __name__ == '__main__':
     datos = [64, 25, 12, 22, 11]
@@ -1,50 +1,283 @@
 # ==============================================================================
 # 4. Ordenamiento de Árbol (Tree Sort)
+#
+# El árbol es un AVL (autobalanceado), por lo que su altura es O(log n) incluso
+# con la entrada ya ordenada. La inserción y el recorrido son iterativos, y las
+# claves repetidas comparten un único nodo, que guarda cada elemento repetido
+# en orden de llegada (el ordenamiento es estable).
+#
+# La misma estructura se expone como contenedor ordenado reutilizable
+# (ArbolOrdenado): inserción y borrado O(log n), rango/selección, iteración
+# perezosa por rangos y carga masiva O(n) desde una lista ya ordenada.
 # ==============================================================================
 
-# Implementación usando un Árbol Binario de Búsqueda (BST)
+import importlib.util
+import os
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+# --- Árbol Binario de Búsqueda balanceado (AVL) ---
+
 class Nodo:
-    """Clase auxiliar para representar un nodo del Árbol Binario de Búsqueda."""
+    """Clase auxiliar para representar un nodo del árbol AVL."""
+    # __slots__ evita el diccionario por instancia: cada nodo ocupa mucho menos
+    __slots__ = ('valor', 'izquierda', 'derecha', 'altura', 'cuenta', 'tamano', 'repetidos')
+
     def __init__(self, valor):
         self.valor = valor
         self.izquierda = None
         self.derecha = None
+        # Altura del subárbol que cuelga de este nodo (una hoja tiene altura 1)
+        self.altura = 1
+        # Número de veces que se ha insertado este valor
+        self.cuenta = 1
+        # Número de elementos (contando repeticiones) del subárbol
+        self.tamano = 1
+        # Elementos insertados después de 'valor' que son iguales a él (pueden
+        # ser objetos distintos, como 1 y 1.0), en orden de llegada; None si no hay
+        self.repetidos = None
+
+    def elementos(self):
+        """Los elementos del nodo en orden de inserción (valor y sus repetidos)."""
+        if self.repetidos is None:
+            return (self.valor,)
+        return (self.valor, *self.repetidos)
+
+def _altura(nodo):
+    """Altura de un subárbol (0 si está vacío)."""
+    return nodo.altura if nodo is not None else 0
+
+def _tamano(nodo):
+    """Número de elementos de un subárbol (0 si está vacío)."""
+    return nodo.tamano if nodo is not None else 0
+
+def _actualizar_altura(nodo):
+    """Recalcula la altura y el tamaño de un nodo a partir de los de sus hijos."""
+    nodo.altura = 1 + max(_altura(nodo.izquierda), _altura(nodo.derecha))
+    nodo.tamano = nodo.cuenta + _tamano(nodo.izquierda) + _tamano(nodo.derecha)
+
+def _rotar_derecha(nodo):
+    """Rotación simple a la derecha. Devuelve la nueva raíz del subárbol."""
+    pivote = nodo.izquierda
+    nodo.izquierda = pivote.derecha
+    pivote.derecha = nodo
+    _actualizar_altura(nodo)
+    _actualizar_altura(pivote)
+    return pivote
+
+def _rotar_izquierda(nodo):
+    """Rotación simple a la izquierda. Devuelve la nueva raíz del subárbol."""
+    pivote = nodo.derecha
+    nodo.derecha = pivote.izquierda
+    pivote.izquierda = nodo
+    _actualizar_altura(nodo)
+    _actualizar_altura(pivote)
+    return pivote
+
+def _rebalancear(nodo):
+    """
+    Restaura la propiedad AVL (|altura izq. - altura der.| <= 1) en 'nodo'
+    con una rotación simple o doble. Devuelve la nueva raíz del subárbol.
+    """
+    _actualizar_altura(nodo)
+    balance = _altura(nodo.izquierda) - _altura(nodo.derecha)
+
+    if balance > 1:
+        # Caso izquierda-derecha: primero se rota el hijo izquierdo
+        if _altura(nodo.izquierda.izquierda) < _altura(nodo.izquierda.derecha):
+            nodo.izquierda = _rotar_izquierda(nodo.izquierda)
+        return _rotar_derecha(nodo)
+
+    if balance < -1:
+        # Caso derecha-izquierda: primero se rota el hijo derecho
+        if _altura(nodo.derecha.derecha) < _altura(nodo.derecha.izquierda):
+            nodo.derecha = _rotar_derecha(nodo.derecha)
+        return _rotar_izquierda(nodo)
 
-def insertar_nodo(raiz, valor):
-    """Inserta un nuevo valor en el BST."""
+    return nodo
+
+def insertar_nodo(raiz, valor, observador=None):
+    """
+    Inserta un nuevo valor en el árbol AVL y devuelve la raíz (que puede
+    cambiar por las rotaciones). Es iterativo: guarda el camino recorrido y lo
+    deshace de abajo hacia arriba rebalanceando.
+    Con un 'observador' informa de los nodos visitados, los nodos creados y
+    los rebalanceos de cada inserción, y de la profundidad máxima alcanzada.
+    """
     # Si la raíz es nula, creamos un nuevo nodo
     if raiz is None:
+        if observador is not None:
+            observador.registrar('insertar_nodo', nodos_creados=1)
         return Nodo(valor)
-    # Si el valor es menor, vamos a la izquierda
-    if valor < raiz.valor:
-        raiz.izquierda = insertar_nodo(raiz.izquierda, valor)
-    # Si el valor es mayor o igual, vamos a la derecha
-    else:
-        raiz.derecha = insertar_nodo(raiz.derecha, valor)
+
+    # 1. Descender hasta el hueco donde va el valor, recordando el camino
+    camino = []
+    nodo = raiz
+    while True:
+        camino.append(nodo)
+        # Si el valor es menor, vamos a la izquierda
+        if valor < nodo.valor:
+            if nodo.izquierda is None:
+                nodo.izquierda = Nodo(valor)
+                break
+            nodo = nodo.izquierda
+        # Si el valor es mayor, vamos a la derecha
+        elif nodo.valor < valor:
+            if nodo.derecha is None:
+                nodo.derecha = Nodo(valor)
+                break
+            nodo = nodo.derecha
+        # Si es igual, el elemento se guarda en el mismo nodo: el árbol no crece
+        else:
+            if nodo.repetidos is None:
+                nodo.repetidos = []
+            nodo.repetidos.append(valor)
+            nodo.cuenta += 1
+            for ancestro in camino:
+                ancestro.tamano += 1
+            if observador is not None:
+                observador.registrar('insertar_nodo', nodos_visitados=len(camino),
+                                     repetidos=1)
+                observador.maximo('insertar_nodo', 'profundidad', len(camino))
+            return raiz
+
+    # 2. Subir por el camino actualizando alturas y rebalanceando
+    for i in range(len(camino) - 1, -1, -1):
+        nodo = camino[i]
+        altura_previa = nodo.altura
+        nuevo = _rebalancear(nodo)
+
+        # Enganchamos el subárbol (posiblemente rotado) a su padre
+        if i == 0:
+            raiz = nuevo
+        elif camino[i - 1].izquierda is nodo:
+            camino[i - 1].izquierda = nuevo
+        else:
+            camino[i - 1].derecha = nuevo
+
+        # Si la altura del subárbol no cambió, a los ancestros sólo les
+        # crece el tamaño en uno
+        if nuevo.altura == altura_previa:
+            for ancestro in camino[:i]:
+                ancestro.tamano += 1
+            break
+
+    if observador is not None:
+        # En una inserción AVL hay como mucho un rebalanceo, y tras él la
+        # altura del subárbol no cambia: es el último nodo revisado
+        observador.registrar('insertar_nodo', nodos_visitados=len(camino),
+                             nodos_creados=1, rebalanceos=int(nuevo is not nodo))
+        observador.maximo('insertar_nodo', 'profundidad', len(camino))
+
     return raiz
 
+def eliminar_nodo(raiz, valor):
+    """
+    Elimina una aparición de 'valor' del árbol AVL.
+    Devuelve (raiz, eliminado), donde 'eliminado' indica si el valor existía.
+    """
+    # 1. Buscar el nodo, recordando el camino
+    camino = []
+    nodo = raiz
+    while nodo is not None:
+        if valor < nodo.valor:
+            camino.append(nodo)
+            nodo = nodo.izquierda
+        elif nodo.valor < valor:
+            camino.append(nodo)
+            nodo = nodo.derecha
+        else:
+            break
+    if nodo is None:
+        return raiz, False
+
+    # 2. Si el valor está repetido, basta con quitar el último repetido
+    if nodo.cuenta > 1:
+        nodo.repetidos.pop()
+        nodo.cuenta -= 1
+        nodo.tamano -= 1
+        for ancestro in camino:
+            ancestro.tamano -= 1
+        return raiz, True
+
+    # 3. Con dos hijos, el nodo toma el valor de su sucesor y se elimina éste
+    if nodo.izquierda is not None and nodo.derecha is not None:
+        camino.append(nodo)
+        sucesor = nodo.derecha
+        while sucesor.izquierda is not None:
+            camino.append(sucesor)
+            sucesor = sucesor.izquierda
+        nodo.valor, nodo.cuenta, nodo.repetidos = sucesor.valor, sucesor.cuenta, sucesor.repetidos
+        nodo = sucesor
+
+    # 4. El nodo a quitar tiene como mucho un hijo, que ocupa su lugar
+    reemplazo = nodo.izquierda if nodo.izquierda is not None else nodo.derecha
+    if not camino:
+        return reemplazo, True
+    if camino[-1].izquierda is nodo:
+        camino[-1].izquierda = reemplazo
+    else:
+        camino[-1].derecha = reemplazo
+
+    # 5. Subir por todo el camino recalculando tamaños y rebalanceando
+    for i in range(len(camino) - 1, -1, -1):
+        nodo = camino[i]
+        nuevo = _rebalancear(nodo)
+        if i == 0:
+            raiz = nuevo
+        elif camino[i - 1].izquierda is nodo:
+            camino[i - 1].izquierda = nuevo
+        else:
+            camino[i - 1].derecha = nuevo
+
+    return raiz, True
+
 def recorrido_inorden(raiz, lista_ordenada):
     """
-    Realiza un recorrido In-Orden (izquierda, raíz, derecha) del BST.
-    Este recorrido produce los elementos en orden ascendente.
+    Realiza un recorrido In-Orden (izquierda, raíz, derecha) del árbol.
+    Este recorrido produce los elementos en orden ascendente. Usa una pila
+    explícita en lugar de recursión.
     """
-    if raiz:
-        # 1. Recorrer subárbol izquierdo
-        recorrido_inorden(raiz.izquierda, lista_ordenada)
-        # 2. Visitar la raíz (agregar el valor a la lista)
-        lista_ordenada.append(raiz.valor)
-        # 3. Recorrer subárbol derecho
-        recorrido_inorden(raiz.derecha, lista_ordenada)
-
-def tree_sort(lista):
+    pila = []
+    nodo = raiz
+    while pila or nodo is not None:
+        # 1. Bajar todo lo posible por la izquierda
+        while nodo is not None:
+            pila.append(nodo)
+            nodo = nodo.izquierda
+        # 2. Visitar el nodo (agregar el valor y sus repetidos, en orden de llegada)
+        nodo = pila.pop()
+        lista_ordenada.append(nodo.valor)
+        if nodo.repetidos is not None:
+            lista_ordenada.extend(nodo.repetidos)
+        # 3. Continuar con el subárbol derecho
+        nodo = nodo.derecha
+
+def tree_sort(lista, key=None, reverse=False, observador=None):
     """
     Ordena una lista utilizando el algoritmo de Ordenamiento de Árbol.
-    Construye un BST y luego realiza un recorrido In-Orden.
+    Construye un árbol AVL y luego realiza un recorrido In-Orden.
+    Con 'key'/'reverse' (como en sorted()) el árbol se construye sólo con las
+    claves, calculadas una vez por elemento.
+    Con un 'observador' (ver 009_Instrumentacion.py) cronometra por separado
+    las fases 'construccion' y 'recorrido'.
     """
     if not lista:
         return []
+    if key is not None or reverse:
+        return _comun.ordenar_con_clave(
+            lista, key, reverse, lambda claves: tree_sort(claves, observador=observador))
+    if observador is not None:
+        return _tree_sort_observado(lista, observador)
 
-    # 1. Construir el Árbol Binario de Búsqueda (BST)
+    # 1. Construir el árbol AVL
     raiz = None
     for elemento in lista:
         # Insertamos cada elemento de la lista en el árbol
@@ -53,12 +286,175 @@ def tree_sort(lista):
     # 2. Realizar el recorrido In-Orden para obtener la lista ordenada
     lista_ordenada = []
     recorrido_inorden(raiz, lista_ordenada)
-    
+
+    return lista_ordenada
+
+def _tree_sort_observado(lista, observador):
+    """tree_sort con las inserciones y las fases informadas al 'observador'."""
+    raiz = None
+    with observador.fase('construccion'):
+        for elemento in lista:
+            raiz = insertar_nodo(raiz, elemento, observador)
+
+    lista_ordenada = []
+    with observador.fase('recorrido'):
+        recorrido_inorden(raiz, lista_ordenada)
+    observador.registrar('recorrido_inorden', elementos=len(lista_ordenada))
+
     return lista_ordenada
 
+# --- Contenedor Ordenado (Índice Incremental) ---
+
+class ArbolOrdenado:
+    """
+    Contenedor ordenado basado en el árbol AVL de tree_sort.
+    Mantiene una vista ordenada que admite inserciones y borrados sin volver
+    a ordenar: insertar/eliminar/rango/seleccionar cuestan O(log n).
+    """
+
+    def __init__(self, datos=None):
+        self.raiz = None
+        if datos is not None:
+            for valor in datos:
+                self.insertar(valor)
+
+    @classmethod
+    def desde_ordenada(cls, lista_ordenada):
+        """
+        Construye el contenedor en O(n) a partir de una lista ya ordenada,
+        agrupando los valores repetidos y creando un árbol perfectamente balanceado.
+        """
+        # 1. Agrupar las repeticiones consecutivas: [[valor, repetido, ...], ...]
+        grupos = []
+        for valor in lista_ordenada:
+            if grupos and not (grupos[-1][0] < valor or valor < grupos[-1][0]):
+                grupos[-1].append(valor)
+            else:
+                grupos.append([valor])
+
+        # 2. Construir el árbol tomando como raíz el grupo central
+        # (la recursión sólo alcanza profundidad log2(n))
+        def construir(inicio, fin):
+            if inicio >= fin:
+                return None
+            medio = (inicio + fin) // 2
+            nodo = Nodo(grupos[medio][0])
+            if len(grupos[medio]) > 1:
+                nodo.repetidos = grupos[medio][1:]
+                nodo.cuenta = len(grupos[medio])
+            nodo.izquierda = construir(inicio, medio)
+            nodo.derecha = construir(medio + 1, fin)
+            _actualizar_altura(nodo)
+            return nodo
+
+        arbol = cls()
+        arbol.raiz = construir(0, len(grupos))
+        return arbol
+
+    def __len__(self):
+        return _tamano(self.raiz)
+
+    def __contains__(self, valor):
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor:
+                nodo = nodo.izquierda
+            elif nodo.valor < valor:
+                nodo = nodo.derecha
+            else:
+                return True
+        return False
+
+    def __iter__(self):
+        """Iteración perezosa en orden ascendente."""
+        return self.irange()
+
+    def insertar(self, valor):
+        """Inserta un valor (se admiten repetidos)."""
+        self.raiz = insertar_nodo(self.raiz, valor)
+
+    def eliminar(self, valor):
+        """Elimina una aparición de 'valor'. Lanza ValueError si no existe."""
+        self.raiz, eliminado = eliminar_nodo(self.raiz, valor)
+        if not eliminado:
+            raise ValueError(f"{valor!r} no está en el árbol")
+
+    def rango(self, valor):
+        """Número de elementos estrictamente menores que 'valor'."""
+        menores = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if valor < nodo.valor:
+                nodo = nodo.izquierda
+            elif nodo.valor < valor:
+                menores += _tamano(nodo.izquierda) + nodo.cuenta
+                nodo = nodo.derecha
+            else:
+                return menores + _tamano(nodo.izquierda)
+        return menores
+
+    def seleccionar(self, k):
+        """Devuelve el k-ésimo menor elemento (k empieza en 0; admite negativos)."""
+        total = len(self)
+        if k < 0:
+            k += total
+        if not 0 <= k < total:
+            raise IndexError("índice fuera de rango")
+
+        nodo = self.raiz
+        while True:
+            izquierda = _tamano(nodo.izquierda)
+            if k < izquierda:
+                nodo = nodo.izquierda
+            elif k < izquierda + nodo.cuenta:
+                return nodo.elementos()[k - izquierda]
+            else:
+                k -= izquierda + nodo.cuenta
+                nodo = nodo.derecha
+
+    def irange(self, minimo=None, maximo=None):
+        """
+        Generador de los elementos v con minimo <= v <= maximo, en orden.
+        Un límite None significa "sin límite". Desciende directamente hasta el
+        primer elemento del rango, así que cuesta O(log n + k) para k resultados.
+        """
+        # 1. Apilar el camino hacia el primer elemento >= minimo
+        pila = []
+        nodo = self.raiz
+        while nodo is not None:
+            if minimo is not None and nodo.valor < minimo:
+                nodo = nodo.derecha
+            else:
+                pila.append(nodo)
+                nodo = nodo.izquierda
+
+        # 2. Recorrido In-Orden con pila explícita hasta superar 'maximo'
+        while pila:
+            nodo = pila.pop()
+            if maximo is not None and maximo < nodo.valor:
+                return
+            yield from nodo.elementos()
+            nodo = nodo.derecha
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierda
+
 # Ejemplo de Uso
 if __name__ == '__main__':
     datos = [64, 25, 12, 22, 11, 90, 37]
     print("Datos originales:", datos)
     lista_ordenada = tree_sort(datos)
     print("Tree Sort:", lista_ordenada)
+
+    # Los elementos iguales pero distintos se conservan, en orden de llegada
+    iguales = tree_sort([1.0, 1, True, 0])
+    assert iguales == [0, 1.0, 1, True]
+    assert [type(x) for x in iguales] == [int, float, int, bool]
+    print("Iguales pero distintos:", iguales)
+
+    indice = ArbolOrdenado.desde_ordenada(lista_ordenada)
+    indice.insertar(50)
+    indice.eliminar(12)
+    print("Índice ordenado:", list(indice))
+    print("Elementos en [20, 60]:", list(indice.irange(20, 60)))
+    print("Rango de 37:", indice.rango(37), "- Mediana:", indice.seleccionar(len(indice) // 2))
@@ -1,38 +1,209 @@
 # ==============================================================================
 # 5. QuickSort
+#
+# Implementado como IntroSort: pivote por mediana de tres (o "ninther" de Tukey
+# en particiones grandes), Insertion Sort para particiones pequeñas, recursión
+# sólo sobre la parte más pequeña (profundidad O(log n)) y HeapSort como
+# respaldo cuando la profundidad supera 2·log2(n). Garantiza O(n log n).
+# Si las muestras del pivote contienen valores repetidos se usa una partición
+# de tres vías (bandera holandesa), por lo que k claves distintas cuestan O(n log k).
+# Ordena también in-place objetos con protocolo de búfer (array.array,
+# bytearray, memoryview, numpy.ndarray) a través de una memoryview.
+#
+# Sobre la misma partición se construyen las consultas de selección, que no
+# necesitan ordenar toda la entrada: nth_element (IntroSelect, O(n) garantizado
+# con la mediana de medianas), partial_sort (O(n + k log k)) y top_k (montículo
+# acotado de k elementos sobre cualquier iterable).
 # ==============================================================================
 
-def quick_sort(lista):
+import importlib.util
+import os
+from array import array
+from itertools import islice
+
+# Por debajo de este tamaño la partición se ordena con Insertion Sort
+UMBRAL_INSERCION = 16
+# A partir de este tamaño el pivote se elige con el "ninther" (mediana de medianas de tres)
+UMBRAL_NINTHER = 40
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+def quick_sort(lista, key=None, reverse=False, observador=None):
     """
     Función principal para QuickSort.
-    Utiliza la estrategia de 'divide y vencerás' de forma recursiva.
+    Utiliza la estrategia de 'divide y vencerás' con los refinamientos de IntroSort.
+    'key' y 'reverse' se comportan como en sorted(); al usarlos el resultado
+    es además estable.
+    Con un 'observador' (ver 009_Instrumentacion.py) informa de cada partición
+    y de la profundidad de recursión, y separa el tiempo de las fases
+    'particion', 'insercion' y 'recursion' (el resto del control del bucle).
+    'lista' puede ser también un objeto con protocolo de búfer de números
+    (array.array, bytearray, memoryview, numpy.ndarray), que se ordena in-place
+    conservando su tipo, sus saltos (strides) y su disposición en memoria.
     """
+    vista = _comun.como_vista(lista)
+    if vista is not None:
+        formato = vista.format.lstrip('@')
+        if formato not in _comun.FORMATOS_ENTEROS + _comun.FORMATOS_REALES:
+            raise TypeError(f"Formato de búfer no admitido: {vista.format!r}")
+        if key is not None or reverse:
+            # Se ordena por clave y se escribe el resultado de vuelta en el búfer
+            valores = _comun.ordenar_con_clave(
+                vista.tolist(), key, reverse,
+                lambda claves: quick_sort(claves, observador=observador))
+            vista[:] = array(formato, valores)
+        else:
+            # La memoryview se ordena como una lista: mismos índices y slices
+            _quick_sort_vista(vista, observador)
+        return lista
+
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(
+            lista, key, reverse, lambda claves: quick_sort(claves, observador=observador))
+        return lista
+
+    n = len(lista)
+    if n < 2:
+        return lista
+    # Límite de profundidad: 2·log2(n). Al superarlo se cambia a HeapSort.
+    profundidad_maxima = 2 * n.bit_length()
     # Llamada a la función auxiliar que realiza el ordenamiento
-    return _quick_sort_aux(lista, 0, len(lista) - 1)
-
-def _quick_sort_aux(lista, inicio, fin):
-    """Función auxiliar recursiva de QuickSort."""
-    # Condición de parada: si el inicio es menor que el fin, hay elementos para ordenar
-    if inicio < fin:
-        # 1. Particionar: Obtener el índice del pivote después de la partición
-        indice_pivote = _particion(lista, inicio, fin)
-        
-        # 2. Conquistar (recursión): Ordenar la sublista izquierda (elementos menores al pivote)
-        _quick_sort_aux(lista, inicio, indice_pivote - 1)
-        
-        # 3. Conquistar (recursión): Ordenar la sublista derecha (elementos mayores al pivote)
-        _quick_sort_aux(lista, indice_pivote + 1, fin)
-    
+    if observador is not None:
+        with observador.fase('recursion'):
+            return _quick_sort_aux(lista, 0, n - 1, profundidad_maxima, observador)
+    return _quick_sort_aux(lista, 0, n - 1, profundidad_maxima)
+
+def _quick_sort_vista(vista, observador=None):
+    """quick_sort in-place sobre una memoryview (sin conversión a lista)."""
+    n = len(vista)
+    if n < 2:
+        return vista
+    if observador is not None:
+        with observador.fase('recursion'):
+            return _quick_sort_aux(vista, 0, n - 1, 2 * n.bit_length(), observador)
+    return _quick_sort_aux(vista, 0, n - 1, 2 * n.bit_length())
+
+def _quick_sort_aux(lista, inicio, fin, profundidad=None, observador=None, nivel=0):
+    """
+    Función auxiliar de QuickSort.
+    Recurre sólo sobre la sublista más pequeña e itera sobre la más grande,
+    de modo que la pila de llamadas nunca supera O(log n) niveles.
+    'nivel' es la profundidad de la llamada actual (sólo se usa para informar
+    al 'observador').
+    """
+    if profundidad is None:
+        profundidad = 2 * (fin - inicio + 1).bit_length()
+    if observador is not None:
+        observador.maximo('quick_sort', 'profundidad', nivel)
+
+    # Mientras la partición sea grande, la dividimos
+    while fin - inicio + 1 > UMBRAL_INSERCION:
+        # Si la recursión se ha degenerado, HeapSort garantiza O(n log n)
+        if profundidad == 0:
+            if observador is not None:
+                observador.registrar('heap_sort', elementos=fin - inicio + 1)
+            _heap_sort_rango(lista, inicio, fin)
+            return lista
+        profundidad -= 1
+
+        # 1. Particionar: Obtener el rango [menor, mayor] que ocupa el pivote
+        if observador is None:
+            menor, mayor = _partir(lista, inicio, fin)
+        else:
+            with observador.fase('particion'):
+                menor, mayor = _partir(lista, inicio, fin, observador)
+
+        # 2. Conquistar: recursión sobre la parte pequeña, iteración sobre la grande
+        if menor - inicio < fin - mayor:
+            _quick_sort_aux(lista, inicio, menor - 1, profundidad, observador, nivel + 1)
+            inicio = mayor + 1
+        else:
+            _quick_sort_aux(lista, mayor + 1, fin, profundidad, observador, nivel + 1)
+            fin = menor - 1
+
+    # 3. Las particiones pequeñas se terminan con Inserción binaria
+    if fin > inicio:
+        if observador is None:
+            _comun.insercion_binaria(lista, inicio, fin + 1, inicio + 1)
+        else:
+            with observador.fase('insercion'):
+                _comun.insercion_binaria(lista, inicio, fin + 1, inicio + 1)
+            observador.registrar('insercion_binaria', elementos=fin - inicio + 1)
+
     # Devolvemos la lista (ya ordenada in-place)
     return lista
 
-def _particion(lista, inicio, fin):
+def _partir(lista, inicio, fin, observador=None):
+    """
+    Elige el pivote y particiona lista[inicio..fin] con la partición adecuada.
+    Devuelve el rango [menor, mayor] que ocupan los iguales al pivote.
+    """
+    indice_pivote, hay_repetidos = _seleccionar_pivote(lista, inicio, fin)
+    if hay_repetidos:
+        # Muchas claves iguales: los iguales al pivote quedan fuera de la recursión
+        return _particion_tres_vias(lista, inicio, fin, indice_pivote, observador)
+    indice = _particion(lista, inicio, fin, indice_pivote, observador)
+    return indice, indice
+
+def _mediana_de_tres(lista, a, b, c):
+    """Devuelve el índice (a, b o c) cuyo valor es la mediana de los tres."""
+    va, vb, vc = lista[a], lista[b], lista[c]
+    if va < vb:
+        if vb < vc:
+            return b
+        return c if va < vc else a
+    if va < vc:
+        return a
+    return c if vb < vc else b
+
+def _seleccionar_pivote(lista, inicio, fin):
+    """
+    Elige el índice del pivote.
+    Mediana de tres (inicio, medio, fin) o, en particiones grandes, el "ninther":
+    la mediana de las medianas de tres grupos repartidos por el rango.
+    Devuelve (índice, hay_repetidos), donde 'hay_repetidos' indica que alguna
+    de las muestras se repite (señal de una entrada con muchos duplicados).
+    """
+    medio = (inicio + fin) // 2
+    if fin - inicio + 1 < UMBRAL_NINTHER:
+        muestras = (inicio, medio, fin)
+        indice = _mediana_de_tres(lista, inicio, medio, fin)
+    else:
+        paso = (fin - inicio + 1) // 8
+        muestras = (inicio, inicio + paso, inicio + 2 * paso,
+                    medio - paso, medio, medio + paso,
+                    fin - 2 * paso, fin - paso, fin)
+        m1 = _mediana_de_tres(lista, inicio, inicio + paso, inicio + 2 * paso)
+        m2 = _mediana_de_tres(lista, medio - paso, medio, medio + paso)
+        m3 = _mediana_de_tres(lista, fin - 2 * paso, fin - paso, fin)
+        indice = _mediana_de_tres(lista, m1, m2, m3)
+
+    # Contamos cuántas muestras son iguales al pivote elegido
+    pivote = lista[indice]
+    iguales = 0
+    for k in muestras:
+        if not (lista[k] < pivote or pivote < lista[k]):
+            iguales += 1
+    return indice, iguales > 1
+
+def _particion(lista, inicio, fin, indice_pivote=None, observador=None):
     """
     Función de partición de QuickSort.
     Selecciona un pivote y reordena la sublista para que todos los elementos
     menores que el pivote estén a su izquierda y los mayores a su derecha.
     """
-    # Seleccionamos el último elemento como pivote
+    # Elegimos el pivote (si no nos lo dan) y lo llevamos al final de la sublista
+    indice = indice_pivote
+    if indice is None:
+        indice, _ = _seleccionar_pivote(lista, inicio, fin)
+    lista[indice], lista[fin] = lista[fin], lista[indice]
     pivote = lista[fin]
     # 'i' es el índice del elemento más pequeño encontrado hasta ahora
     i = inicio - 1
@@ -49,13 +220,237 @@ def _particion(lista, inicio, fin):
     # Intercambiamos el pivote (lista[fin]) con el elemento en lista[i + 1]
     # Esto coloca el pivote en su posición final
     lista[i + 1], lista[fin] = lista[fin], lista[i + 1]
-    
+
+    if observador is not None:
+        # Una comparación por elemento y un intercambio por cada menor o igual
+        # al pivote, más los dos que llevan el pivote al final y a su sitio
+        observador.registrar('_particion', elementos=fin - inicio + 1,
+                             comparaciones=fin - inicio,
+                             intercambios=i + 1 - inicio + 2)
+
     # Devolvemos la posición final del pivote
     return i + 1
 
+def _particion_tres_vias(lista, inicio, fin, indice_pivote, observador=None):
+    """
+    Partición de tres vías (bandera holandesa de Dijkstra).
+    Deja lista[inicio..menor-1] < pivote, lista[menor..mayor] == pivote y
+    lista[mayor+1..fin] > pivote. Devuelve (menor, mayor).
+    """
+    pivote = lista[indice_pivote]
+    menor, i, mayor = inicio, inicio, fin
+
+    while i <= mayor:
+        valor = lista[i]
+        if valor < pivote:
+            # Va a la zona de menores
+            lista[menor], lista[i] = valor, lista[menor]
+            menor += 1
+            i += 1
+        elif pivote < valor:
+            # Va a la zona de mayores; el elemento traído de 'mayor' aún no se ha revisado
+            lista[i], lista[mayor] = lista[mayor], valor
+            mayor -= 1
+        else:
+            # Igual al pivote: se queda en la zona central
+            i += 1
+
+    if observador is not None:
+        # Los menores cuestan una comparación y los demás dos; menores y
+        # mayores cuestan además un intercambio cada uno
+        menores = menor - inicio
+        observador.registrar('_particion_tres_vias', elementos=fin - inicio + 1,
+                             comparaciones=menores + 2 * (fin - inicio + 1 - menores),
+                             intercambios=menores + fin - mayor)
+
+    return menor, mayor
+
+def _heap_sort_rango(lista, inicio, fin):
+    """Ordena lista[inicio..fin] (ambos inclusive) con HeapSort (respaldo de IntroSort)."""
+    n = fin - inicio + 1
+
+    def hundir(raiz, limite):
+        # Hundimos el elemento de 'raiz' hasta restaurar la propiedad de montículo máximo
+        valor = lista[inicio + raiz]
+        hijo = 2 * raiz + 1
+        while hijo < limite:
+            if hijo + 1 < limite and lista[inicio + hijo] < lista[inicio + hijo + 1]:
+                hijo += 1
+            if not valor < lista[inicio + hijo]:
+                break
+            lista[inicio + raiz] = lista[inicio + hijo]
+            raiz = hijo
+            hijo = 2 * raiz + 1
+        lista[inicio + raiz] = valor
+
+    # 1. Construir el montículo máximo
+    for raiz in range(n // 2 - 1, -1, -1):
+        hundir(raiz, n)
+
+    # 2. Extraer repetidamente el máximo al final del rango
+    for ultimo in range(n - 1, 0, -1):
+        lista[inicio], lista[inicio + ultimo] = lista[inicio + ultimo], lista[inicio]
+        hundir(0, ultimo)
+
+# --- Selección: nth_element, partial_sort y top_k ---
+
+def nth_element(lista, n):
+    """
+    Reordena 'lista' in-place para que lista[n] sea el elemento que ocuparía
+    esa posición si la lista estuviera ordenada, con todos los anteriores
+    menores o iguales y todos los posteriores mayores o iguales (como
+    std::nth_element), y lo devuelve. Admite índices negativos.
+    nth_element(lista, len(lista) // 2) da la mediana en O(n).
+    """
+    vista = _comun.como_vista(lista)
+    datos = lista if vista is None else vista
+    total = len(datos)
+    if n < 0:
+        n += total
+    if not 0 <= n < total:
+        raise IndexError("Índice fuera de rango.")
+
+    _introselect(datos, 0, total - 1, n)
+    return datos[n]
+
+def partial_sort(lista, k):
+    """
+    Ordena in-place sólo los k menores elementos: al terminar lista[:k] son
+    los k menores en orden y el resto queda en orden arbitrario.
+    Cuesta O(n + k log k): una selección de la posición k-1 y un QuickSort
+    del prefijo.
+    """
+    vista = _comun.como_vista(lista)
+    datos = lista if vista is None else vista
+    n = len(datos)
+    k = min(k, n)
+    if k <= 0:
+        return lista
+
+    # 1. Llevar los k menores al principio
+    if k < n:
+        _introselect(datos, 0, n - 1, k - 1)
+    # 2. Ordenar sólo ese prefijo
+    if k > 1:
+        _quick_sort_aux(datos, 0, k - 1)
+    return lista
+
+def top_k(iterable, k, key=None):
+    """
+    Devuelve una lista con los k menores elementos de 'iterable', ordenados
+    (como heapq.nsmallest; a igual clave, en su orden de llegada).
+    Recorre la entrada una sola vez manteniendo un montículo máximo de k
+    entradas, así que sirve para flujos que no caben en memoria: O(n log k)
+    de tiempo y O(k) de memoria.
+    """
+    if k <= 0:
+        return []
+    iterador = iter(iterable)
+
+    # 1. Los primeros k elementos forman el montículo. Cada entrada es
+    # (clave, orden de llegada, elemento): el orden desempata, de modo que
+    # los elementos nunca se comparan entre sí
+    monticulo = [(elemento if key is None else key(elemento), orden, elemento)
+                 for orden, elemento in enumerate(islice(iterador, k))]
+    for raiz in range(len(monticulo) // 2 - 1, -1, -1):
+        _hundir_maximo(monticulo, raiz, len(monticulo))
+
+    # 2. Cada elemento menor que el máximo del montículo lo sustituye
+    orden = len(monticulo)
+    for elemento in iterador:
+        clave = elemento if key is None else key(elemento)
+        if clave < monticulo[0][0]:
+            monticulo[0] = (clave, orden, elemento)
+            _hundir_maximo(monticulo, 0, k)
+        orden += 1
+
+    # 3. Ordenar las k entradas (HeapSort sobre el propio montículo)
+    if len(monticulo) > 1:
+        _heap_sort_rango(monticulo, 0, len(monticulo) - 1)
+    return [elemento for _, _, elemento in monticulo]
+
+def _hundir_maximo(monticulo, raiz, limite):
+    """Hunde monticulo[raiz] hasta restaurar la propiedad de montículo máximo en [0, limite)."""
+    valor = monticulo[raiz]
+    hijo = 2 * raiz + 1
+    while hijo < limite:
+        if hijo + 1 < limite and monticulo[hijo] < monticulo[hijo + 1]:
+            hijo += 1
+        if not valor < monticulo[hijo]:
+            break
+        monticulo[raiz] = monticulo[hijo]
+        raiz = hijo
+        hijo = 2 * raiz + 1
+    monticulo[raiz] = valor
+
+def _introselect(lista, inicio, fin, k, mediana_de_medianas=False):
+    """
+    IntroSelect: reordena lista[inicio..fin] para que lista[k] quede en su
+    posición final, con los menores o iguales delante y los mayores o
+    iguales detrás. Es un QuickSelect con los mismos pivotes y particiones
+    que quick_sort (O(n) en promedio) que, si cada dos particiones el rango
+    no se ha reducido a la mitad, pasa a elegir el pivote por mediana de
+    medianas, lo que garantiza O(n) en el peor caso.
+    """
+    tamano_control = fin - inicio + 1
+    particiones = 0
+
+    while fin - inicio + 1 > UMBRAL_INSERCION:
+        # 1. Particionar. Con la mediana de medianas la partición es siempre
+        # de tres vías, para que las claves repetidas no la desequilibren.
+        if mediana_de_medianas:
+            indice_pivote = _mediana_de_medianas(lista, inicio, fin)
+            menor, mayor = _particion_tres_vias(lista, inicio, fin, indice_pivote)
+        else:
+            menor, mayor = _partir(lista, inicio, fin)
+
+        # 2. Continuar sólo por el lado que contiene la posición k
+        if k < menor:
+            fin = menor - 1
+        elif k > mayor:
+            inicio = mayor + 1
+        else:
+            return
+
+        # 3. Vigilar que los pivotes de muestra sigan siendo buenos
+        particiones += 1
+        if not mediana_de_medianas and particiones % 2 == 0:
+            if fin - inicio + 1 > tamano_control // 2:
+                mediana_de_medianas = True
+            tamano_control = fin - inicio + 1
+
+    # 4. El rango pequeño que queda se ordena por Inserción binaria
+    if fin > inicio:
+        _comun.insercion_binaria(lista, inicio, fin + 1, inicio + 1)
+
+def _mediana_de_medianas(lista, inicio, fin):
+    """
+    Pivote de Blum-Floyd-Pratt-Rivest-Tarjan: ordena cada grupo de 5, lleva
+    las medianas al principio del rango y selecciona recursivamente la
+    mediana de ellas. Devuelve su índice. Al menos un 30% del rango queda a
+    cada lado del pivote.
+    """
+    num_medianas = 0
+    for grupo in range(inicio, fin + 1, 5):
+        ultimo = min(grupo + 4, fin)
+        _comun.insercion_binaria(lista, grupo, ultimo + 1, grupo + 1)
+        mediana = (grupo + ultimo) // 2
+        destino = inicio + num_medianas
+        lista[destino], lista[mediana] = lista[mediana], lista[destino]
+        num_medianas += 1
+
+    medio = inicio + (num_medianas - 1) // 2
+    _introselect(lista, inicio, inicio + num_medianas - 1, medio, mediana_de_medianas=True)
+    return medio
+
 # Ejemplo de Uso
 if __name__ == '__main__':
     datos = [64, 25, 12, 22, 11, 90, 37]
     print("Datos originales:", datos)
     lista_ordenada = quick_sort(datos)
     print("QuickSort:", lista_ordenada)
+
+    datos = [64, 25, 12, 22, 11, 90, 37]
+    print("Mediana:", nth_element(datos, len(datos) // 2))
+    print("Los 3 menores (partial_sort):", partial_sort(datos, 3)[:3])
+    print("Las 3 palabras más cortas:", top_k(['pera', 'kiwi', 'manzana', 'uva', 'sandía'], 3, key=len))
@@ -1,49 +1,627 @@
 # ==============================================================================
 # 6. MergeSort
+#
+# Versión ascendente (bottom-up) e iterativa: en lugar de dividir la lista
+# recursivamente con slicing, ordena runs cortos con Inserción binaria y los
+# fusiona con ancho creciente (32, 64, 128, ...) alternando entre la lista y
+# un único búfer auxiliar de tamaño n.
+#
+# Incluye además tim_sort, una variante adaptativa (clase TimSort) que
+# aprovecha los runs naturales de la entrada: en datos casi ordenados es ~O(n).
+#
+# merge_sort_en_sitio es un MergeSort estable por bloques que fusiona in-place
+# con sólo O(√n) de memoria auxiliar, para máquinas con poca RAM.
+#
+# merge_sort ordena también in-place objetos con protocolo de búfer
+# (array.array, bytearray, memoryview, numpy.ndarray): fusiona directamente
+# sobre una memoryview, con un búfer auxiliar compacto del mismo formato.
 # ==============================================================================
 
-def merge_sort(lista):
+import importlib.util
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from math import isqrt
+
+# Ancho de los runs que se ordenan por Inserción antes de empezar a fusionar
+ANCHO_RUN_INICIAL = 32
+# Tras esta cantidad de victorias seguidas de un mismo run se entra en modo galope
+MIN_GALOPE = 7
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+def merge_sort(lista, key=None, reverse=False, observador=None):
     """
     Ordena una lista utilizando el algoritmo de MergeSort.
-    Utiliza la estrategia de 'divide y vencerás' para dividir y luego fusionar.
-    """
-    if len(lista) > 1:
-        # 1. Dividir: Encontrar el punto medio de la lista
-        mitad = len(lista) // 2
-        sublista_izquierda = lista[:mitad]
-        sublista_derecha = lista[mitad:]
-
-        # 2. Conquistar (recursión): Ordenar ambas mitades
-        merge_sort(sublista_izquierda)
-        merge_sort(sublista_derecha)
-
-        # 3. Fusionar (Merge): Fusionar las dos sublistas ordenadas
-        i = j = k = 0
-        
-        # Copiar datos de las sublistas temporales a la lista original (lista)
-        while i < len(sublista_izquierda) and j < len(sublista_derecha):
-            # Comparamos el elemento más pequeño de cada sublista
-            if sublista_izquierda[i] < sublista_derecha[j]:
-                lista[k] = sublista_izquierda[i]
-                i += 1
-            else:
-                lista[k] = sublista_derecha[j]
-                j += 1
+    Fusiona pares de runs adyacentes de ancho creciente, sin recursión y
+    reservando un solo búfer auxiliar para toda la ordenación.
+    'key' y 'reverse' se comportan como en sorted().
+    Con un 'observador' (ver 009_Instrumentacion.py) informa de cada fusión y
+    separa el tiempo de las fases 'runs_iniciales' y 'fusion'.
+    'lista' puede ser también un objeto con protocolo de búfer de números
+    (array.array, bytearray, memoryview, numpy.ndarray), que se ordena in-place
+    conservando su tipo, sus saltos (strides) y su disposición en memoria.
+    """
+    vista = _comun.como_vista(lista)
+    if vista is not None:
+        _merge_sort_bufer(vista, key, reverse, observador)
+        return lista
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(
+            lista, key, reverse, lambda claves: merge_sort(claves, observador=observador))
+        return lista
+    if observador is not None:
+        return _merge_sort_observado(lista, observador)
+    return _merge_sort_ascendente(lista)
+
+def _merge_sort_ascendente(lista):
+    """
+    Núcleo de merge_sort: MergeSort ascendente in-place sobre una lista o
+    sobre una memoryview.
+    """
+    n = len(lista)
+    if n < 2:
+        return lista
+
+    # Único búfer auxiliar: en cada pasada se lee de 'origen' y se escribe en 'destino'
+    origen = lista
+    destino = _bufer_auxiliar(lista, n)
+
+    # Los runs iniciales se ordenan in-place con Inserción binaria. Su ancho
+    # (ANCHO_RUN_INICIAL o la mitad) se elige para que el número de pasadas
+    # sea par y la última escriba directamente sobre 'lista'
+    ancho = ANCHO_RUN_INICIAL
+    if _numero_pasadas(n, ancho) % 2 == 1:
+        ancho //= 2
+    for inicio in range(0, n, ancho):
+        _comun.insercion_binaria(lista, inicio, min(inicio + ancho, n), inicio + 1)
+
+    while ancho < n:
+        # 1. Fusionar cada par de runs adyacentes de longitud 'ancho'
+        for inicio in range(0, n, 2 * ancho):
+            medio = min(inicio + ancho, n)
+            fin = min(inicio + 2 * ancho, n)
+            _fusionar(origen, destino, inicio, medio, fin)
+
+        # 2. Intercambiar los papeles (ping-pong) en lugar de copiar de vuelta
+        origen, destino = destino, origen
+        ancho *= 2
+
+    return lista
+
+def _numero_pasadas(n, ancho):
+    """Número de pasadas de fusión necesarias partiendo de runs de 'ancho'."""
+    pasadas = 0
+    while ancho < n:
+        ancho *= 2
+        pasadas += 1
+    return pasadas
+
+def _merge_sort_observado(lista, observador):
+    """
+    merge_sort con las fases y las fusiones informadas al 'observador'.
+    Sigue exactamente los mismos pasos que merge_sort.
+    """
+    n = len(lista)
+    if n < 2:
+        return lista
+
+    origen = lista
+    destino = _bufer_auxiliar(lista, n)
+
+    ancho = ANCHO_RUN_INICIAL
+    if _numero_pasadas(n, ancho) % 2 == 1:
+        ancho //= 2
+    with observador.fase('runs_iniciales'):
+        for inicio in range(0, n, ancho):
+            _comun.insercion_binaria(lista, inicio, min(inicio + ancho, n), inicio + 1)
+    observador.registrar('merge_sort', runs_iniciales=-(-n // ancho),
+                         pasadas=_numero_pasadas(n, ancho))
+
+    with observador.fase('fusion'):
+        while ancho < n:
+            for inicio in range(0, n, 2 * ancho):
+                medio = min(inicio + ancho, n)
+                fin = min(inicio + 2 * ancho, n)
+                _fusionar(origen, destino, inicio, medio, fin, observador)
+            origen, destino = destino, origen
+            ancho *= 2
+
+    return lista
+
+def _fusionar(origen, destino, inicio, medio, fin, observador=None):
+    """
+    Fusiona origen[inicio:medio] y origen[medio:fin] (ya ordenados) en
+    destino[inicio:fin]. Es estable: ante empate se toma el run izquierdo.
+    Con un 'observador' informa al terminar de las comparaciones y de los
+    elementos movidos.
+    """
+    # Si el último de la izquierda no supera al primero de la derecha,
+    # los dos runs ya están en orden y basta con copiarlos
+    if medio >= fin or origen[medio - 1] <= origen[medio]:
+        destino[inicio:fin] = origen[inicio:fin]
+        if observador is not None:
+            observador.registrar('_fusionar', comparaciones=int(medio < fin),
+                                 movimientos=fin - inicio, omitidas=1)
+        return
+
+    i, j, k = inicio, medio, inicio
+
+    # Copiar el menor de los dos frentes mientras ambos runs tengan elementos.
+    # Los frentes se guardan en variables: cada elemento se lee una sola vez
+    # (en una memoryview, cada lectura crea un objeto nuevo)
+    izquierdo, derecho = origen[i], origen[j]
+    while True:
+        if derecho < izquierdo:
+            destino[k] = derecho
             k += 1
+            j += 1
+            if j == fin:
+                break
+            derecho = origen[j]
+        else:
+            destino[k] = izquierdo
+            k += 1
+            i += 1
+            if i == medio:
+                break
+            izquierdo = origen[i]
+
+    # Copiar en bloque lo que quede de cualquiera de los dos runs
+    if i < medio:
+        destino[k:fin] = origen[i:medio]
+    else:
+        destino[k:fin] = origen[j:fin]
 
-        # Comprobar si quedan elementos en la sublista izquierda y copiarlos
-        while i < len(sublista_izquierda):
-            lista[k] = sublista_izquierda[i]
+    if observador is not None:
+        # Una comparación por cada elemento copiado dentro del bucle, más la inicial
+        observador.registrar('_fusionar', comparaciones=k - inicio + 1,
+                             movimientos=fin - inicio)
+
+# --- MergeSort In-Place por Bloques (memoria auxiliar O(√n)) ---
+
+def merge_sort_en_sitio(lista, key=None, reverse=False):
+    """
+    MergeSort estable que no reserva un búfer de tamaño n: cada fusión se
+    hace in-place por bloques (al estilo de WikiSort) con una caché de
+    ~√n elementos y una etiqueta por bloque, es decir, O(√n) de memoria
+    auxiliar y O(n log n) de tiempo.
+    'key' y 'reverse' se comportan como en sorted() (las claves calculadas
+    ocupan, eso sí, O(n)).
+    """
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(lista, key, reverse, merge_sort_en_sitio)
+        return lista
+
+    n = len(lista)
+    if n < 2:
+        return lista
+
+    # 1. Runs iniciales ordenados in-place con Inserción binaria
+    for inicio in range(0, n, ANCHO_RUN_INICIAL):
+        _comun.insercion_binaria(lista, inicio, min(inicio + ANCHO_RUN_INICIAL, n), inicio + 1)
+
+    # 2. Fusiones in-place de ancho creciente, todas con la misma caché de √n
+    tamano_bloque = max(ANCHO_RUN_INICIAL, isqrt(n))
+    cache = [None] * tamano_bloque
+    ancho = ANCHO_RUN_INICIAL
+    while ancho < n:
+        for inicio in range(0, n - ancho, 2 * ancho):
+            medio = inicio + ancho
+            fin = min(inicio + 2 * ancho, n)
+            # Los runs ya en orden no necesitan fusión
+            if lista[medio] < lista[medio - 1]:
+                _fusionar_por_bloques(lista, inicio, medio, fin, cache)
+        ancho *= 2
+
+    return lista
+
+def _fusionar_por_bloques(lista, inicio, medio, fin, cache):
+    """
+    Fusiona in-place y de forma estable A = lista[inicio:medio] y
+    B = lista[medio:fin] usando sólo la caché (de s = len(cache) elementos).
+    A se parte en un bloque inicial irregular y bloques de s elementos que
+    "ruedan" hacia la derecha intercambiándose con los bloques de B. Cada vez
+    que el menor bloque de A debe ir antes que los últimos valores de B
+    adelantados, se "suelta": el bloque de A soltado antes se fusiona (desde
+    la caché) con los valores de B que lo siguen y el nuevo se coloca delante
+    de los valores de B que le corresponde preceder.
+    """
+    s = len(cache)
+    # A cabe en la caché: fusión directa
+    if medio - inicio <= s:
+        cache[:medio - inicio] = lista[inicio:medio]
+        _fusionar_desde_cache(lista, cache, medio - inicio, inicio, medio, fin)
+        return
+
+    # 1. El bloque irregular de A es el primer "A soltado"; el resto son bloques
+    # completos. 'etiquetas' guarda el orden original de cada bloque de A en su
+    # hueco actual, para desempatar bloques con el mismo primer valor.
+    irregular = (medio - inicio) % s
+    ultimo_a, largo_a = inicio, irregular
+    cache[:largo_a] = lista[inicio:inicio + largo_a]
+    ultimo_b_fin = ultimo_b_inicio = inicio + irregular
+    bloques_a_inicio, bloques_a_fin = inicio + irregular, medio
+    etiquetas = list(range((medio - inicio) // s))
+    bloque_b_inicio, bloque_b_fin = medio, min(medio + s, fin)
+
+    while True:
+        # El menor de los bloques de A que quedan por soltar
+        minimo = 0
+        for hueco in range(1, len(etiquetas)):
+            posicion = bloques_a_inicio + hueco * s
+            primero = lista[bloques_a_inicio + minimo * s]
+            if lista[posicion] < primero or (
+                    not primero < lista[posicion] and etiquetas[hueco] < etiquetas[minimo]):
+                minimo = hueco
+        posicion_minimo = bloques_a_inicio + minimo * s
+
+        if (ultimo_b_fin > ultimo_b_inicio and
+                not lista[ultimo_b_fin - 1] < lista[posicion_minimo]) or \
+                bloque_b_inicio == bloque_b_fin:
+            # 2. Soltar el menor bloque de A
+            # Valores de B ya adelantados que deben ir detrás de él (A gana los empates)
+            corte_b = bisect_left(lista, lista[posicion_minimo], ultimo_b_inicio, ultimo_b_fin)
+            restantes_b = ultimo_b_fin - corte_b
+
+            # Llevar el menor bloque al primer hueco de los bloques de A
+            if minimo != 0:
+                _intercambiar_bloques(lista, bloques_a_inicio, posicion_minimo, s)
+                etiquetas[0], etiquetas[minimo] = etiquetas[minimo], etiquetas[0]
+
+            # Fusionar el A soltado antes (en la caché) con los valores de B que lo siguen
+            _fusionar_desde_cache(lista, cache, largo_a, ultimo_a, ultimo_a + largo_a, corte_b)
+
+            # Colocar el nuevo bloque delante de los 'restantes_b' valores de B
+            # (pasa a la caché, ya que será el próximo en fusionarse)
+            cache[:s] = lista[bloques_a_inicio:bloques_a_inicio + s]
+            _desplazar_derecha(lista, corte_b, ultimo_b_fin, s)
+            lista[corte_b:corte_b + s] = cache[:s]
+
+            ultimo_a, largo_a = corte_b, s
+            ultimo_b_inicio, ultimo_b_fin = corte_b + s, corte_b + s + restantes_b
+            bloques_a_inicio += s
+            etiquetas.pop(0)
+            if not etiquetas:
+                break
+        elif bloque_b_fin - bloque_b_inicio < s:
+            # 3. Último bloque de B (incompleto): rotarlo delante de los bloques de A
+            largo_b = bloque_b_fin - bloque_b_inicio
+            resto = lista[bloque_b_inicio:bloque_b_fin]
+            _desplazar_derecha(lista, bloques_a_inicio, bloques_a_fin, largo_b)
+            lista[bloques_a_inicio:bloques_a_inicio + largo_b] = resto
+            ultimo_b_inicio, ultimo_b_fin = bloques_a_inicio, bloques_a_inicio + largo_b
+            bloques_a_inicio += largo_b
+            bloques_a_fin += largo_b
+            bloque_b_inicio = bloque_b_fin
+        else:
+            # 4. Rodar: el primer bloque de A se intercambia con el siguiente de B
+            _intercambiar_bloques(lista, bloques_a_inicio, bloque_b_inicio, s)
+            etiquetas.append(etiquetas.pop(0))
+            ultimo_b_inicio, ultimo_b_fin = bloques_a_inicio, bloques_a_inicio + s
+            bloques_a_inicio += s
+            bloques_a_fin += s
+            bloque_b_inicio = bloques_a_fin
+            bloque_b_fin = min(bloque_b_inicio + s, fin)
+
+    # 5. Fusionar el último A soltado con todos los valores de B que quedan
+    _fusionar_desde_cache(lista, cache, largo_a, ultimo_a, ultimo_a + largo_a, fin)
+
+def _fusionar_desde_cache(lista, cache, largo, destino, inicio_b, fin_b):
+    """
+    Fusiona cache[:largo] (una copia de lista[destino:inicio_b]) con
+    lista[inicio_b:fin_b], escribiendo desde 'destino'. La escritura nunca
+    adelanta a la lectura de B, así que no hace falta más memoria. Ante
+    empate gana la caché (el run izquierdo).
+    """
+    i, j, k = 0, inicio_b, destino
+    while i < largo and j < fin_b:
+        if lista[j] < cache[i]:
+            lista[k] = lista[j]
+            j += 1
+        else:
+            lista[k] = cache[i]
             i += 1
+        k += 1
+    # Lo que quede de B ya está en su sitio; lo que quede de la caché va al final
+    if i < largo:
+        lista[k:k + largo - i] = cache[i:largo]
+
+def _intercambiar_bloques(lista, a, b, largo):
+    """Intercambia lista[a:a+largo] con lista[b:b+largo] (bloques disjuntos)."""
+    lista[a:a + largo], lista[b:b + largo] = lista[b:b + largo], lista[a:a + largo]
+
+def _desplazar_derecha(lista, inicio, fin, salto):
+    """
+    Mueve lista[inicio:fin] a lista[inicio+salto:fin+salto] por trozos de
+    'salto' elementos, de derecha a izquierda, para no copiar de una vez
+    todo el rango. Lo que había en lista[fin:fin+salto] se pierde.
+    """
+    trozo_fin = fin
+    while trozo_fin > inicio:
+        trozo_inicio = max(inicio, trozo_fin - salto)
+        lista[trozo_inicio + salto:trozo_fin + salto] = lista[trozo_inicio:trozo_fin]
+        trozo_fin = trozo_inicio
+
+# --- Entrada por Protocolo de Búfer (array.array, memoryview, NumPy) ---
+
+def _bufer_auxiliar(datos, n):
+    """
+    Búfer auxiliar de n posiciones para las fusiones: una lista para una
+    lista, o una memoryview sobre un array.array del mismo formato (8 bytes o
+    menos por elemento, en lugar de un objeto Python) para una memoryview.
+    """
+    if isinstance(datos, memoryview):
+        return memoryview(array(datos.format.lstrip('@'), bytes(datos.itemsize * n)))
+    return [None] * n
+
+def _merge_sort_bufer(vista, key, reverse, observador):
+    """merge_sort in-place sobre la memoryview de un objeto con protocolo de búfer."""
+    formato = vista.format.lstrip('@')
+    if formato not in _comun.FORMATOS_ENTEROS + _comun.FORMATOS_REALES:
+        raise TypeError(f"Formato de búfer no admitido: {vista.format!r}")
+
+    if key is not None or reverse:
+        # Con 'key'/'reverse' se ordena por clave y se escribe el resultado de vuelta
+        valores = _comun.ordenar_con_clave(vista.tolist(), key, reverse,
+                                           lambda claves: merge_sort(claves, observador=observador))
+        vista[:] = array(formato, valores)
+    elif observador is not None:
+        _merge_sort_observado(vista, observador)
+    else:
+        _merge_sort_ascendente(vista)
+
+# --- MergeSort Adaptativo (TimSort) ---
+
+def tim_sort(lista, key=None, reverse=False):
+    """
+    Ordena una lista con un MergeSort adaptativo basado en runs naturales.
+    Detecta runs ascendentes y estrictamente descendentes (que invierte), extiende
+    los cortos hasta 'minrun' con inserción binaria y los fusiona respetando los
+    invariantes de la pila de runs, usando galope durante la fusión.
+    'key' y 'reverse' se comportan como en sorted().
+    """
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(lista, key, reverse, tim_sort)
+        return lista
+
+    n = len(lista)
+    if n < 2:
+        return lista
+
+    minrun = _calcular_minrun(n)
+    # Pila de runs pendientes de fusionar: (inicio, longitud)
+    pila = []
+
+    inicio = 0
+    while inicio < n:
+        # 1. Detectar el siguiente run natural
+        longitud = _contar_run(lista, inicio, n)
+
+        # 2. Si es corto, extenderlo hasta minrun con inserción binaria
+        if longitud < minrun:
+            forzado = min(minrun, n - inicio)
+            _comun.insercion_binaria(lista, inicio, inicio + forzado, inicio + longitud)
+            longitud = forzado
+
+        # 3. Apilarlo y fusionar mientras no se cumplan los invariantes
+        pila.append((inicio, longitud))
+        _colapsar_pila(lista, pila)
+        inicio += longitud
+
+    # 4. Fusionar todos los runs que queden en la pila
+    while len(pila) > 1:
+        i = len(pila) - 2
+        if i > 0 and pila[i - 1][1] < pila[i + 1][1]:
+            i -= 1
+        _fusionar_en_pila(lista, pila, i)
+
+    return lista
+
+def _calcular_minrun(n):
+    """
+    Calcula la longitud mínima de run (entre 32 y 64) de modo que n / minrun
+    sea una potencia de dos o algo ligeramente menor, para fusiones equilibradas.
+    """
+    resto = 0
+    while n >= 64:
+        resto |= n & 1
+        n >>= 1
+    return n + resto
+
+def _contar_run(lista, inicio, fin):
+    """
+    Devuelve la longitud del run natural que empieza en 'inicio'.
+    Si el run es estrictamente descendente lo invierte in-place (la desigualdad
+    estricta garantiza que la inversión no rompa la estabilidad).
+    """
+    k = inicio + 1
+    if k == fin:
+        return 1
+
+    if lista[k] < lista[inicio]:
+        # Run estrictamente descendente
+        while k + 1 < fin and lista[k + 1] < lista[k]:
+            k += 1
+        lista[inicio:k + 1] = reversed(lista[inicio:k + 1])
+    else:
+        # Run ascendente (no decreciente)
+        while k + 1 < fin and not lista[k + 1] < lista[k]:
             k += 1
 
-        # Comprobar si quedan elementos en la sublista derecha y copiarlos
-        while j < len(sublista_derecha):
-            lista[k] = sublista_derecha[j]
+    return k + 1 - inicio
+
+def _colapsar_pila(lista, pila):
+    """
+    Fusiona runs de la cima de la pila hasta que se cumplan los invariantes
+    |A| > |B| + |C| y |B| > |C| (C es la cima). Así las longitudes crecen como
+    Fibonacci y la pila nunca supera O(log n) runs.
+    """
+    while len(pila) > 1:
+        i = len(pila) - 2
+        if (i > 0 and pila[i - 1][1] <= pila[i][1] + pila[i + 1][1]) or \
+           (i > 1 and pila[i - 2][1] <= pila[i - 1][1] + pila[i][1]):
+            # Se fusiona B con el menor de sus vecinos
+            if pila[i - 1][1] < pila[i + 1][1]:
+                i -= 1
+        elif pila[i][1] > pila[i + 1][1]:
+            # Invariantes satisfechos
+            break
+        _fusionar_en_pila(lista, pila, i)
+
+def _fusionar_en_pila(lista, pila, i):
+    """Fusiona los runs pila[i] y pila[i + 1] (adyacentes en la lista)."""
+    inicio_a, longitud_a = pila[i]
+    _, longitud_b = pila[i + 1]
+    _fusionar_runs(lista, inicio_a, inicio_a + longitud_a, inicio_a + longitud_a + longitud_b)
+    pila[i] = (inicio_a, longitud_a + longitud_b)
+    del pila[i + 1]
+
+def _fusionar_runs(lista, inicio, medio, fin):
+    """
+    Fusiona lista[inicio:medio] y lista[medio:fin].
+    Antes de fusionar recorta los extremos que ya están en su sitio y copia
+    sólo el run más corto a un búfer temporal.
+    """
+    # Los elementos de A que no superan a B[0] ya están en su posición final
+    inicio = bisect_right(lista, lista[medio], inicio, medio)
+    if inicio == medio:
+        return
+    # Los elementos de B que no son menores que A[-1] ya están en su posición final
+    fin = bisect_left(lista, lista[medio - 1], medio, fin)
+
+    if medio - inicio <= fin - medio:
+        _fusionar_bajo(lista, inicio, medio, fin)
+    else:
+        _fusionar_alto(lista, inicio, medio, fin)
+
+def _fusionar_bajo(lista, inicio, medio, fin):
+    """
+    Fusión de izquierda a derecha, con el run A (el más corto) copiado a un búfer.
+    Si un run gana MIN_GALOPE veces seguidas, se entra en modo galope: se busca
+    con bisect hasta dónde sigue ganando y se copia ese bloque de una vez.
+    """
+    temporal = lista[inicio:medio]
+    longitud_a = len(temporal)
+    i, j, k = 0, medio, inicio
+    victorias_a = victorias_b = 0
+
+    while i < longitud_a and j < fin:
+        if lista[j] < temporal[i]:
+            lista[k] = lista[j]
             j += 1
-            k += 1
-            
-    return lista
+            victorias_b += 1
+            victorias_a = 0
+        else:
+            lista[k] = temporal[i]
+            i += 1
+            victorias_a += 1
+            victorias_b = 0
+        k += 1
+
+        if victorias_a >= MIN_GALOPE or victorias_b >= MIN_GALOPE:
+            # Modo galope: alternamos bloques de A y de B mientras sean largos
+            while i < longitud_a and j < fin:
+                # Bloque de A que no supera a B[j]
+                limite = bisect_right(temporal, lista[j], i, longitud_a)
+                copia_a = limite - i
+                lista[k:k + copia_a] = temporal[i:limite]
+                k += copia_a
+                i = limite
+                if i == longitud_a:
+                    break
+                # Ahora B[j] < A[i]
+                lista[k] = lista[j]
+                k += 1
+                j += 1
+                if j == fin:
+                    break
+                # Bloque de B estrictamente menor que A[i]
+                limite = bisect_left(lista, temporal[i], j, fin)
+                copia_b = limite - j
+                lista[k:k + copia_b] = lista[j:limite]
+                k += copia_b
+                j = limite
+                if j == fin:
+                    break
+                # Ahora A[i] <= B[j]
+                lista[k] = temporal[i]
+                k += 1
+                i += 1
+                if copia_a < MIN_GALOPE and copia_b < MIN_GALOPE:
+                    break
+            victorias_a = victorias_b = 0
+
+    # Lo que quede de A se copia al final; lo que quede de B ya está en su sitio
+    if i < longitud_a:
+        lista[k:k + longitud_a - i] = temporal[i:]
+
+def _fusionar_alto(lista, inicio, medio, fin):
+    """
+    Fusión de derecha a izquierda, con el run B (el más corto) copiado a un búfer.
+    Simétrica a _fusionar_bajo, incluido el modo galope.
+    """
+    temporal = lista[medio:fin]
+    i, j, k = medio - 1, len(temporal) - 1, fin - 1
+    victorias_a = victorias_b = 0
+
+    while i >= inicio and j >= 0:
+        # Ante empate gana B, que debe quedar detrás para mantener la estabilidad
+        if temporal[j] < lista[i]:
+            lista[k] = lista[i]
+            i -= 1
+            victorias_a += 1
+            victorias_b = 0
+        else:
+            lista[k] = temporal[j]
+            j -= 1
+            victorias_b += 1
+            victorias_a = 0
+        k -= 1
+
+        if victorias_a >= MIN_GALOPE or victorias_b >= MIN_GALOPE:
+            # Modo galope
+            while i >= inicio and j >= 0:
+                # Bloque final de A estrictamente mayor que B[j]
+                limite = bisect_right(lista, temporal[j], inicio, i + 1)
+                copia_a = i + 1 - limite
+                lista[k - copia_a + 1:k + 1] = lista[limite:i + 1]
+                k -= copia_a
+                i = limite - 1
+                if i < inicio:
+                    break
+                # Ahora A[i] <= B[j]
+                lista[k] = temporal[j]
+                k -= 1
+                j -= 1
+                if j < 0:
+                    break
+                # Bloque final de B que no es menor que A[i]
+                limite = bisect_left(temporal, lista[i], 0, j + 1)
+                copia_b = j + 1 - limite
+                lista[k - copia_b + 1:k + 1] = temporal[limite:j + 1]
+                k -= copia_b
+                j = limite - 1
+                if j < 0:
+                    break
+                # Ahora B[j] < A[i]
+                lista[k] = lista[i]
+                k -= 1
+                i -= 1
+                if copia_a < MIN_GALOPE and copia_b < MIN_GALOPE:
+                    break
+            victorias_a = victorias_b = 0
+
+    # Lo que quede de B se copia al principio; lo que quede de A ya está en su sitio
+    if j >= 0:
+        lista[inicio:inicio + j + 1] = temporal[:j + 1]
 
 # Ejemplo de Uso
 if __name__ == '__main__':
@@ -51,3 +629,13 @@ if __name__ == '__main__':
     print("Datos originales:", datos)
     lista_ordenada = merge_sort(datos)
     print("MergeSort:", lista_ordenada)
+
+    datos = [1, 2, 3, 10, 11, 12, 9, 8, 7, 4, 5, 6]
+    print("Datos originales:", datos)
+    lista_ordenada = tim_sort(datos)
+    print("MergeSort adaptativo (TimSort):", lista_ordenada)
+
+    datos = [38, 27, 43, 3, 9, 82, 10, 3, 27, 64]
+    print("Datos originales:", datos)
+    lista_ordenada = merge_sort_en_sitio(datos)
+    print("MergeSort in-place por bloques:", lista_ordenada)
@@ -1,75 +1,749 @@
 # ==============================================================================
 # 7. RadixSort
+#
+# LSD RadixSort de base ancha (256 o 65536) con desplazamientos y máscaras.
+# Admite enteros negativos, calcula los histogramas de todos los dígitos en un
+# único recorrido, omite los dígitos que son iguales en todas las claves y
+# alterna entre dos búferes array.array('q') en lugar de copiar de vuelta.
+# Además de listas, ordena in-place cualquier objeto con protocolo de búfer
+# (array.array, bytearray, memoryview, numpy.ndarray) sin convertirlo en una
+# lista de objetos int; con NumPy, el histograma y el reparto son vectorizados.
+#
+# Incluye también msd_radix_sort: un MSD RadixSort in-place (American Flag
+# Sort) para claves str/bytes, que examina cada byte de cada clave una sola vez.
+#
+# Por último, codificar_clave convierte claves arbitrarias (reales, enteros,
+# cadenas, columnas descendentes y tuplas de todo ello) en bytes cuyo orden
+# lexicográfico es el de las claves, y radix_sort_compuesto las ordena con
+# RadixSort sin ninguna comparación entre objetos Python.
+#
+# counting_sort y bucket_sort son motores independientes para enteros de rango
+# pequeño (O(n + rango), sin comparaciones) y para reales repartidos de forma
+# (más o menos) uniforme, con cubetas adaptadas a un histograma de muestra.
 # ==============================================================================
 
-def _counting_sort_radix(lista, exp):
+import importlib.util
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from contextlib import nullcontext
+from itertools import chain, repeat
+from math import isfinite
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy es opcional: sólo acelera la ordenación de numpy.ndarray
+    np = None
+
+# Rango de un entero con signo de 64 bits (lo que cabe en array('q'))
+MIN_INT64 = -(1 << 63)
+MAX_INT64 = (1 << 63) - 1
+# Por debajo de este tamaño las cubetas del MSD RadixSort se ordenan por Inserción
+UMBRAL_MSD = 32
+# Ocupación media buscada en las cubetas de bucket_sort
+OCUPACION_CUBETA = 2
+# Muestra (tamaño y tramos del histograma) con la que bucket_sort decide si
+# las claves son uniformes, y cuánto puede exceder un tramo lo esperado
+TAMANO_MUESTRA_CUBETAS = 1024
+SEGMENTOS_MUESTRA = 32
+FACTOR_SESGO = 2
+# Tabla de bytes.translate que invierte cada byte (b -> 255 - b)
+_INVERTIR_BYTES = bytes(range(255, -1, -1))
+
+# --- Carga de Módulos ---
+
+# Utilidades comunes (ordenar_con_clave, insercion_binaria, como_vista...).
+# El nombre de 000_Comun.py empieza por un dígito: no se puede usar 'import'
+_spec = importlib.util.spec_from_file_location(
+    '_interno_000_Comun', os.path.join(os.path.dirname(os.path.abspath(__file__)), '000_Comun.py'))
+_comun = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_comun)
+
+def _posiciones_iniciales(conteo, inicio=0):
+    """
+    Convierte un histograma en la posición inicial de cada cubeta dentro de
+    la salida (suma acumulada exclusiva), desplazada por 'inicio'.
+    """
+    posiciones = [0] * len(conteo)
+    total = inicio
+    for digito, cantidad in enumerate(conteo):
+        posiciones[digito] = total
+        total += cantidad
+    return posiciones
+
+def _counting_sort_radix(origen, destino, conteo, desplazamiento, mascara, minimo,
+                         observador=None):
     """
     Función auxiliar de Ordenamiento por Conteo para RadixSort.
-    Ordena la lista basándose en el dígito representado por 'exp'.
+    Distribuye 'origen' en 'destino' de forma estable según el dígito
+    ((valor - minimo) >> desplazamiento) & mascara, usando el histograma
+    'conteo' ya calculado para ese dígito.
+    """
+    # 1. Convertir el histograma en la posición inicial de cada dígito
+    # dentro de la salida (suma acumulada exclusiva)
+    posiciones = _posiciones_iniciales(conteo)
+
+    # 2. Colocar cada elemento en su posición. Recorrer de izquierda a derecha
+    # con posiciones iniciales mantiene la estabilidad.
+    for valor in origen:
+        digito = ((valor - minimo) >> desplazamiento) & mascara
+        destino[posiciones[digito]] = valor
+        posiciones[digito] += 1
+
+    if observador is not None:
+        observador.registrar('_counting_sort_radix', movimientos=len(origen),
+                             cubetas_ocupadas=len(conteo) - conteo.count(0))
+
+    return destino
+
+def radix_sort(lista, base=256, key=None, reverse=False, observador=None):
+    """
+    Ordena una lista de números enteros (también negativos) utilizando RadixSort.
+    Procesa dígitos de 'base' (una potencia de dos, p. ej. 256 o 65536) de
+    derecha a izquierda (LSD Radix Sort). Un entero de 64 bits necesita como
+    mucho 8 pasadas en base 256 y 4 en base 65536.
+    Con 'key' (que debe devolver enteros) se ordenan registros arbitrarios;
+    'reverse' se comporta como en sorted().
+    Con un 'observador' (ver 009_Instrumentacion.py) informa de cada pasada y
+    separa el tiempo de las fases 'histograma' y 'distribucion'.
+    'lista' puede ser también un objeto con protocolo de búfer de enteros
+    (array.array, bytearray, memoryview, numpy.ndarray), que se ordena in-place
+    conservando su tipo, sus saltos (strides) y su disposición en memoria.
+    """
+    if base < 2 or base & (base - 1):
+        raise ValueError("La base debe ser una potencia de dos (p. ej. 256 o 65536).")
+    vista = _comun.como_vista(lista)
+    if vista is not None:
+        return _radix_sort_bufer(lista, vista, base, key, reverse, observador)
+    if not lista:
+        return []
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(
+            lista, key, reverse,
+            lambda claves: radix_sort(claves, base, observador=observador))
+        return lista
+    return _radix_sort_lsd(lista, base, observador)
+
+def _radix_sort_lsd(lista, base, observador=None):
+    """
+    Núcleo de radix_sort: ordena in-place los enteros de 'lista' (una lista o
+    una memoryview de enteros) con pasadas LSD de 'base'.
     """
     n = len(lista)
-    # Lista de salida temporal
-    salida = [0] * n
-    # Array de conteo (para dígitos 0 a 9)
-    conteo = [0] * 10
-
-    # 1. Contar la frecuencia de cada dígito en la posición actual
-    for i in range(n):
-        # Obtener el dígito actual: (lista[i] // exp) % 10
-        indice = (lista[i] // exp) % 10
+    bits = base.bit_length() - 1
+    mascara = base - 1
+    # Sin observador las fases no se cronometran (nullcontext, una vez por fase)
+    fase = observador.fase if observador is not None else lambda nombre: nullcontext()
+
+    # 1. Restar el mínimo convierte todas las claves en enteros no negativos
+    # sin alterar su orden (los negativos quedan delante) y además reduce el
+    # número de dígitos a los que realmente hace falta procesar.
+    minimo = min(lista)
+    maximo = max(lista)
+    num_digitos = max(1, -(-(maximo - minimo).bit_length() // bits))
+    desplazamientos = [d * bits for d in range(num_digitos)]
+
+    # 2. Un único recorrido calcula el histograma de todos los dígitos
+    conteos = [[0] * base for _ in range(num_digitos)]
+    pares = list(zip(conteos, desplazamientos))
+    with fase('histograma'):
+        for valor in lista:
+            clave = valor - minimo
+            for conteo, desplazamiento in pares:
+                conteo[(clave >> desplazamiento) & mascara] += 1
+
+    # 3. Un dígito en el que todas las claves coinciden no reordena nada: se omite
+    pasadas = [(conteo, desplazamiento) for conteo, desplazamiento in pares
+               if max(conteo) != n]
+    if observador is not None:
+        observador.registrar('radix_sort', digitos=num_digitos,
+                             digitos_omitidos=num_digitos - len(pasadas))
+    if not pasadas:
+        return lista
+
+    # 4. Dos búferes compactos de enteros de 64 bits (o listas si las claves no
+    # caben). Con un búfer de entrada se usa su mismo formato, que siempre cabe.
+    if isinstance(lista, memoryview):
+        formato = lista.format.lstrip('@')
+        buferes = (array(formato, bytes(lista.itemsize * n)),
+                   array(formato, bytes(lista.itemsize * n)))
+    elif MIN_INT64 <= minimo and maximo <= MAX_INT64:
+        buferes = (array('q', bytes(8 * n)), array('q', bytes(8 * n)))
+    else:
+        buferes = ([0] * n, [0] * n)
+
+    # 5. Una pasada de conteo por dígito, alternando (ping-pong) entre búferes.
+    # La primera lee directamente de la lista original.
+    origen = lista
+    with fase('distribucion'):
+        for indice, (conteo, desplazamiento) in enumerate(pasadas):
+            destino = buferes[indice % 2]
+            _counting_sort_radix(origen, destino, conteo, desplazamiento, mascara, minimo,
+                                 observador)
+            origen = destino
+
+        # 6. Volcar el resultado en la lista original (ordenación in-place)
+        lista[:] = origen
+    return lista
+
+# --- Entrada por Protocolo de Búfer (array.array, memoryview, NumPy) ---
+
+def _radix_sort_bufer(datos, vista, base, key, reverse, observador):
+    """
+    radix_sort sobre un objeto con protocolo de búfer. Los enteros se leen y
+    se escriben a través de la memoryview: nunca existe una lista con todos
+    ellos como objetos int (salvo con 'key', cuyas claves lo son de todos modos).
+    """
+    # 1. Un numpy.ndarray de enteros usa la versión vectorizada
+    if np is not None and isinstance(datos, np.ndarray) and datos.dtype.kind in 'iu':
+        if key is None and not reverse:
+            _radix_sort_numpy(datos, base, observador)
+            return datos
+
+    formato = vista.format.lstrip('@')
+    if formato not in _comun.FORMATOS_ENTEROS:
+        raise TypeError(f"radix_sort sólo ordena enteros (formato de búfer {vista.format!r}).")
+    if len(vista) < 2:
+        return datos
+
+    # 2. Con 'key'/'reverse' se ordena por clave y se escribe el resultado de vuelta
+    if key is not None or reverse:
+        valores = _comun.ordenar_con_clave(vista.tolist(), key, reverse,
+                                           lambda claves: radix_sort(claves, base, observador=observador))
+        vista[:] = array(formato, valores)
+        return datos
+
+    # 3. Sin clave, el núcleo LSD trabaja directamente sobre la vista
+    _radix_sort_lsd(vista, base, observador)
+    return datos
+
+def _radix_sort_numpy(arreglo, base, observador=None):
+    """
+    LSD RadixSort vectorizado para un numpy.ndarray 1-D de enteros, in-place.
+    Por cada dígito: histograma con np.bincount (para omitir los dígitos
+    comunes a todas las claves) y reparto estable con np.argsort(kind='stable')
+    sobre dígitos de 8 o 16 bits, que NumPy resuelve con su propio counting
+    sort. Al final se aplica la permutación sobre el arreglo original, que
+    conserva su dtype, sus strides y su disposición en memoria.
+    """
+    n = arreglo.size
+    if n < 2:
+        return arreglo
+    bits = base.bit_length() - 1
+    mascara = np.uint64(base - 1)
+    tipo_digito = np.uint8 if bits <= 8 else np.uint16 if bits <= 16 else np.int64
+
+    # 1. Claves sin signo que conservan el orden: en los enteros con signo se
+    # invierte el bit más alto. Restar el mínimo reduce los dígitos necesarios.
+    if arreglo.dtype.kind == 'i':
+        claves = arreglo.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    else:
+        claves = arreglo.astype(np.uint64)
+    claves -= claves.min()
+    num_digitos = max(1, -(-int(claves.max()).bit_length() // bits))
+
+    omitidos = 0
+    orden = np.arange(n)
+    for d in range(num_digitos):
+        digitos = ((claves >> np.uint64(d * bits)) & mascara).astype(tipo_digito)
+        # 2. Histograma vectorizado: un dígito igual en todas las claves se omite
+        conteo = np.bincount(digitos, minlength=base)
+        if conteo.max() == n:
+            omitidos += 1
+            continue
+        # 3. Reparto estable por el dígito
+        permutacion = np.argsort(digitos, kind='stable')
+        orden = orden[permutacion]
+        claves = claves[permutacion]
+
+    if observador is not None:
+        observador.registrar('radix_sort', digitos=num_digitos, digitos_omitidos=omitidos)
+
+    # 4. Aplicar la permutación final sobre el arreglo original
+    arreglo[...] = arreglo[orden]
+    return arreglo
+
+# --- Ordenamiento por Conteo y por Cubetas ---
+
+def _reparto_estable(indices, num_cubetas):
+    """
+    Reparto estable por cubetas (el núcleo del Ordenamiento por Conteo):
+    'indices[i]' es la cubeta del elemento i. Devuelve (orden, conteo), donde
+    orden[j] es la posición original del elemento que va en la posición j y
+    conteo el histograma de las cubetas.
+    """
+    # 1. Histograma
+    conteo = [0] * num_cubetas
+    for indice in indices:
         conteo[indice] += 1
 
-    # 2. Modificar el array de conteo para que contenga la posición real
-    # de este dígito en la lista de salida (acumulativo)
-    for i in range(1, 10):
-        conteo[i] += conteo[i - 1]
-
-    # 3. Construir la lista de salida
-    # Recorremos la lista original de atrás hacia adelante para mantener la estabilidad
-    i = n - 1
-    while i >= 0:
-        # Obtener el dígito actual
-        indice = (lista[i] // exp) % 10
-        # Colocar el elemento en su posición correcta en la salida
-        salida[conteo[indice] - 1] = lista[i]
-        # Decrementar el conteo para el siguiente elemento con el mismo dígito
-        conteo[indice] -= 1
-        i -= 1
-
-    # 4. Copiar la lista de salida a la lista original
-    for i in range(n):
-        lista[i] = salida[i]
-        
+    # 2. Posición inicial de cada cubeta; recorrer de izquierda a derecha
+    # mantiene el orden original dentro de cada cubeta (estabilidad)
+    posiciones = _posiciones_iniciales(conteo)
+    orden = [0] * len(indices)
+    for original, indice in enumerate(indices):
+        orden[posiciones[indice]] = original
+        posiciones[indice] += 1
+    return orden, conteo
+
+def counting_sort(lista, lo=None, hi=None, key=None, reverse=False, observador=None):
+    """
+    Ordena in-place enteros (o registros por una clave entera) con
+    Ordenamiento por Conteo: un histograma de hi - lo + 1 cubetas y un reparto
+    estable, en O(n + rango) y sin ninguna comparación entre elementos.
+    'lo' y 'hi' son los límites inclusivos de las claves (si se omiten se
+    calculan con min/max); una clave fuera de ellos es un ValueError.
+    Conviene cuando el rango es pequeño frente a n (p. ej. 0..65535).
+    'key' y 'reverse' se comportan como en sorted(); el orden es estable.
+    'lista' puede ser también un objeto con protocolo de búfer de enteros.
+    """
+    vista = _comun.como_vista(lista)
+    if vista is not None:
+        formato = vista.format.lstrip('@')
+        if formato not in _comun.FORMATOS_ENTEROS:
+            raise TypeError(f"counting_sort sólo ordena enteros (formato de búfer {vista.format!r}).")
+        if len(vista) > 1:
+            vista[:] = array(formato, counting_sort(vista.tolist(), lo, hi, key, reverse, observador))
+        return lista
+    n = len(lista)
+    if n < 2:
+        return lista
+    claves = lista if key is None else [key(elemento) for elemento in lista]
+
+    # 1. Límites de las claves
+    minimo = min(claves)
+    maximo = max(claves)
+    lo = minimo if lo is None else lo
+    hi = maximo if hi is None else hi
+    if minimo < lo or maximo > hi:
+        raise ValueError(f"Hay claves fuera del rango [{lo}, {hi}].")
+    num_cubetas = hi - lo + 1
+    if observador is not None:
+        observador.registrar('counting_sort', movimientos=n, cubetas=num_cubetas)
+
+    # 2. Sin clave, los enteros iguales son indistinguibles: basta con contar
+    # cada valor y reescribirlo tantas veces como apareció
+    if key is None:
+        conteo = [0] * num_cubetas
+        for valor in lista:
+            conteo[valor - lo] += 1
+        valores = range(lo, hi + 1)
+        if reverse:
+            conteo.reverse()
+            valores = reversed(valores)
+        lista[:] = chain.from_iterable(repeat(valor, cantidad)
+                                       for valor, cantidad in zip(valores, conteo) if cantidad)
+        return lista
+
+    # 3. Con clave, reparto estable de los registros. Con reverse=True la
+    # cubeta se cuenta desde 'hi': el orden es descendente y sigue siendo estable.
+    if reverse:
+        indices = [hi - clave for clave in claves]
+    else:
+        indices = [clave - lo for clave in claves]
+    orden, _ = _reparto_estable(indices, num_cubetas)
+    lista[:] = [lista[original] for original in orden]
     return lista
 
-def radix_sort(lista):
+def bucket_sort(lista, key=None, reverse=False, observador=None):
     """
-    Ordena una lista de números enteros no negativos utilizando el algoritmo de RadixSort.
-    Funciona procesando dígitos individuales de derecha a izquierda (LSD Radix Sort).
+    Ordena in-place números reales (o registros por una clave real) con
+    Ordenamiento por Cubetas: cada clave se asigna a una de ~n/OCUPACION_CUBETA
+    cubetas con una función monótona, se reparten de forma estable con
+    Ordenamiento por Conteo y cada cubeta se termina con Inserción binaria.
+    Con claves uniformes el coste esperado es O(n).
+    El número y los límites de las cubetas se adaptan a partir del histograma
+    de una muestra: si es uniforme, la asignación es lineal en [min, max]; si
+    no, el rango se trocea por cuantiles de la muestra y cada trozo reparte
+    linealmente sus propias cubetas, de modo que los datos sesgados no
+    colapsen en unas pocas cubetas.
+    Si las escalas de la asignación no son finitas (claves subnormales casi
+    iguales) se ordena por comparación.
+    'key' y 'reverse' se comportan como en sorted(); el orden es estable.
+    'lista' puede ser también un objeto con protocolo de búfer de reales.
     """
-    if not lista:
-        return []
+    vista = _comun.como_vista(lista)
+    if vista is not None:
+        formato = vista.format.lstrip('@')
+        if formato not in _comun.FORMATOS_ENTEROS + _comun.FORMATOS_REALES:
+            raise TypeError(f"bucket_sort sólo ordena números (formato de búfer {vista.format!r}).")
+        if len(vista) > 1:
+            vista[:] = array(formato, bucket_sort(vista.tolist(), key, reverse, observador))
+        return lista
+    n = len(lista)
+    if n < 2:
+        return lista
+    fase = observador.fase if observador is not None else lambda nombre: nullcontext()
+    claves = lista if key is None else [key(elemento) for elemento in lista]
+    # Ordenar las claves negadas en ascendente es el orden descendente estable
+    if reverse:
+        claves = [-clave for clave in claves]
+
+    # 1. Límites: con todas las claves iguales no hay nada que hacer
+    minimo = min(claves)
+    maximo = max(claves)
+    if not isfinite(minimo) or not isfinite(maximo):
+        raise ValueError("bucket_sort necesita claves finitas.")
+    if minimo == maximo:
+        return lista
+
+    # 2. Asignar una cubeta a cada clave. La cubeta extra del final recibe
+    # sólo las claves iguales al máximo. Un NaN no es finito pero puede no
+    # ser ni el mínimo ni el máximo: se detecta al convertir su cubeta a int.
+    num_cubetas = max(1, n // OCUPACION_CUBETA)
+    with fase('histograma'):
+        try:
+            limites = _limites_por_muestra(claves, minimo, maximo)
+            if limites is None:
+                indices = _indices_lineales(claves, minimo, maximo, num_cubetas)
+            else:
+                indices = _indices_por_tramos(claves, limites, num_cubetas)
+                if indices is not None:
+                    indices, num_cubetas = indices
+        except ValueError:
+            raise ValueError("bucket_sort necesita claves finitas.") from None
+    if indices is None:
+        _ordenar_por_comparacion(lista, claves, key is None and not reverse)
+        return lista
+
+    # 3. Reparto estable por cubetas
+    with fase('distribucion'):
+        orden, conteo = _reparto_estable(indices, num_cubetas + 1)
+        claves = [claves[original] for original in orden]
+        valores = None if key is None and not reverse else [lista[original] for original in orden]
+
+    # 4. Inserción binaria (estable) dentro de cada cubeta
+    with fase('insercion'):
+        inicio = 0
+        for cantidad in conteo:
+            if cantidad > 1:
+                _insercion_claves(claves, valores, inicio, inicio + cantidad)
+            inicio += cantidad
+
+    if observador is not None:
+        observador.registrar('bucket_sort', movimientos=n, cubetas=num_cubetas + 1,
+                             cubetas_ocupadas=len(conteo) - conteo.count(0),
+                             tramos=0 if limites is None else len(limites) - 1)
+        observador.maximo('bucket_sort', 'ocupacion', max(conteo))
 
-    # 1. Encontrar el número máximo para saber cuántos dígitos procesar
-    max_val = max(lista)
-    
-    # 2. Inicializar el exponente (exp) a 1 (para el dígito de las unidades)
-    exp = 1
-    
-    # 3. Iterar mientras el exponente sea menor o igual al valor máximo
-    while max_val // exp > 0:
-        # Llamar a la función de ordenamiento por conteo (Counting Sort)
-        # para ordenar la lista basada en el dígito actual (determinado por exp)
-        lista = _counting_sort_radix(lista, exp)
-        # Mover al siguiente dígito (decenas, centenas, etc.)
-        exp *= 10
-        
+    lista[:] = claves if valores is None else valores
+    return lista
+
+def _escala(cubetas, desde, hasta):
+    """
+    Factor que lleva las claves de [desde, hasta] a [0, cubetas]. Se calcula
+    sobre las mitades de los límites, de modo que 'hasta - desde' no desborda
+    aunque las claves lleguen a ±1.8e308: la cubeta de una clave es
+    int((clave / 2 - desde / 2) * escala). Devuelve None si el factor no es
+    finito (una anchura subnormal) o se anula al dividir los límites.
+    """
+    anchura = hasta / 2 - desde / 2
+    if not anchura > 0:
+        return None
+    escala = cubetas / anchura
+    return escala if isfinite(escala) else None
+
+def _indices_lineales(claves, minimo, maximo, num_cubetas):
+    """
+    Cubeta de cada clave con la asignación lineal de [minimo, maximo] en
+    [0, num_cubetas], limitada a ese intervalo por el redondeo. Devuelve None
+    si la escala no es finita.
+    """
+    escala = _escala(num_cubetas, minimo, maximo)
+    if escala is None:
+        return None
+    mitad = minimo / 2
+    return _acotar([int((clave * 0.5 - mitad) * escala) for clave in claves], num_cubetas)
+
+def _acotar(indices, ultimo):
+    """
+    Limita los índices de cubeta a [0, ultimo] (el redondeo podría sacar
+    alguno). Se comprueba antes con min/max, en C, para no pagar el
+    recorte por elemento en el caso normal.
+    """
+    if indices and (min(indices) < 0 or max(indices) > ultimo):
+        indices = [max(0, min(indice, ultimo)) for indice in indices]
+    return indices
+
+def _ordenar_por_comparacion(lista, claves, sin_clave):
+    """Alternativa de bucket_sort: ordenación estable por comparación de las claves."""
+    if sin_clave:
+        lista.sort()
+        return
+    orden = sorted(range(len(lista)), key=claves.__getitem__)
+    lista[:] = [lista[original] for original in orden]
+
+def _limites_por_muestra(claves, minimo, maximo):
+    """
+    Histograma de una muestra de las claves en SEGMENTOS_MUESTRA tramos de
+    igual anchura. Si ningún tramo supera FACTOR_SESGO veces lo esperado con
+    claves uniformes devuelve None; si no, devuelve los límites de
+    SEGMENTOS_MUESTRA tramos de igual frecuencia (cuantiles de la muestra),
+    empezando en 'minimo' y terminando en 'maximo'.
+    """
+    n = len(claves)
+    paso = max(1, n // TAMANO_MUESTRA_CUBETAS)
+    muestra = claves[::paso]
+
+    # 1. Histograma de la muestra (sin escala finita, la asignación lineal
+    # tampoco la tendrá: se deja que la decida)
+    escala = _escala(SEGMENTOS_MUESTRA, minimo, maximo)
+    if escala is None:
+        return None
+    histograma = [0] * SEGMENTOS_MUESTRA
+    mitad = minimo / 2
+    ultimo = SEGMENTOS_MUESTRA - 1
+    for clave in muestra:
+        histograma[max(0, min(int((clave / 2 - mitad) * escala), ultimo))] += 1
+    if max(histograma) <= FACTOR_SESGO * len(muestra) / SEGMENTOS_MUESTRA:
+        return None
+
+    # 2. Cuantiles de la muestra como límites de los tramos
+    muestra.sort()
+    m = len(muestra)
+    interiores = [muestra[k * m // SEGMENTOS_MUESTRA] for k in range(1, SEGMENTOS_MUESTRA)]
+    return [minimo] + interiores + [maximo]
+
+def _indices_por_tramos(claves, limites, num_cubetas):
+    """
+    Cubeta de cada clave con una función lineal a trozos y monótona: cada uno
+    de los tramos [limites[s], limites[s + 1]) recibe el mismo número de
+    cubetas, repartidas linealmente dentro del tramo. Devuelve (indices,
+    total de cubetas); como en la asignación lineal, el máximo cae en la
+    cubeta extra 'total'. Devuelve None si la escala de algún tramo no es
+    finita (ver _escala).
+    """
+    tramos = len(limites) - 1
+    por_tramo = max(1, num_cubetas // tramos)
+    total = tramos * por_tramo
+    bases = [s * por_tramo for s in range(tramos)]
+    # Un tramo de anchura cero (cuantiles repetidos) usa una sola cubeta
+    escalas = []
+    for s in range(tramos):
+        if limites[s + 1] > limites[s]:
+            escala = _escala(por_tramo, limites[s], limites[s + 1])
+            if escala is None:
+                return None
+            escalas.append(escala)
+        else:
+            escalas.append(0.0)
+    mitades = [limite / 2 for limite in limites]
+    interiores = limites[1:-1]
+    indices = []
+    for clave in claves:
+        s = bisect_right(interiores, clave)
+        indices.append(bases[s] + int((clave * 0.5 - mitades[s]) * escalas[s]))
+    return _acotar(indices, total), total
+
+# --- MSD RadixSort (American Flag Sort) para cadenas ---
+
+def msd_radix_sort(lista, key=None, reverse=False):
+    """
+    Ordena in-place una lista de str o de bytes con MSD RadixSort (American Flag).
+    Distribuye por el byte en la posición 'profundidad' y desciende a cada cubeta
+    con la profundidad siguiente: los prefijos comunes se examinan una sola vez
+    en lugar de volver a compararse en cada comparación.
+    Las cadenas str se ordenan por su codificación UTF-8, que preserva el orden
+    de los puntos de código. Con 'key' (que debe devolver str o bytes) se
+    ordenan registros arbitrarios; 'reverse' se comporta como en sorted().
+    """
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(lista, key, reverse, msd_radix_sort)
+        return lista
+
+    n = len(lista)
+    if n < 2:
+        return lista
+
+    if isinstance(lista[0], str):
+        # Las claves son los bytes UTF-8; 'valores' se permuta en paralelo
+        claves = [cadena.encode('utf-8', 'surrogatepass') for cadena in lista]
+        valores = lista
+    else:
+        claves = lista
+        valores = None
+
+    # Pila explícita de cubetas pendientes: (inicio, fin, profundidad)
+    pila = [(0, n, 0)]
+    while pila:
+        inicio, fin, profundidad = pila.pop()
+        tamano = fin - inicio
+
+        # 1. Las cubetas pequeñas se terminan por Inserción
+        if tamano < UMBRAL_MSD:
+            _insercion_claves(claves, valores, inicio, fin)
+            continue
+
+        # 2. Histograma del byte actual. La cubeta 0 es para las claves que
+        # ya terminaron; el byte b va a la cubeta b + 1.
+        conteo = [0] * 257
+        for i in range(inicio, fin):
+            clave = claves[i]
+            conteo[clave[profundidad] + 1 if profundidad < len(clave) else 0] += 1
+
+        # 3. Si todas caen en la misma cubeta, no hay nada que mover:
+        # o son todas iguales, o comparten el byte y se pasa al siguiente
+        if conteo[0] == tamano:
+            continue
+        if max(conteo) == tamano:
+            pila.append((inicio, fin, profundidad + 1))
+            continue
+
+        # 4. Permutación in-place por ciclos (American Flag)
+        limites = _posiciones_iniciales(conteo, inicio)
+        siguiente = limites[:]
+        for cubeta in range(257):
+            final_cubeta = limites[cubeta] + conteo[cubeta]
+            while siguiente[cubeta] < final_cubeta:
+                posicion = siguiente[cubeta]
+                clave = claves[posicion]
+                destino = clave[profundidad] + 1 if profundidad < len(clave) else 0
+                if destino == cubeta:
+                    siguiente[cubeta] += 1
+                else:
+                    # Enviamos la clave a su cubeta y revisamos la que llega a cambio
+                    otra = siguiente[destino]
+                    claves[posicion], claves[otra] = claves[otra], clave
+                    if valores is not None:
+                        valores[posicion], valores[otra] = valores[otra], valores[posicion]
+                    siguiente[destino] += 1
+
+        # 5. Descender a cada cubeta con más de un elemento (la cubeta 0 ya
+        # contiene sólo claves idénticas)
+        for cubeta in range(1, 257):
+            if conteo[cubeta] > 1:
+                pila.append((limites[cubeta], limites[cubeta] + conteo[cubeta], profundidad + 1))
+
+    return lista
+
+def _insercion_claves(claves, valores, inicio, fin):
+    """
+    Inserción binaria de claves[inicio:fin], moviendo 'valores' en paralelo.
+    Las claves de la cubeta comparten su prefijo, cuya comparación hace
+    CPython en C al comparar los bytes completos.
+    """
+    for i in range(inicio + 1, fin):
+        clave = claves[i]
+        posicion = bisect_right(claves, clave, inicio, i)
+        if posicion < i:
+            claves[posicion + 1:i + 1] = claves[posicion:i]
+            claves[posicion] = clave
+            if valores is not None:
+                valor = valores[i]
+                valores[posicion + 1:i + 1] = valores[posicion:i]
+                valores[posicion] = valor
+
+# --- Codificación de Claves que Preserva el Orden ---
+
+def _codificar_numero(valor):
+    """
+    Entero sin signo de 64 bits con el mismo orden que 'valor':
+    - int (de 64 bits con signo): se invierte el bit de signo.
+    - float (IEEE-754): los positivos invierten el bit de signo y los
+      negativos todos sus bits, de modo que -inf < ... < -0 < 0 < ... < inf.
+    """
+    if isinstance(valor, int):
+        if not MIN_INT64 <= valor <= MAX_INT64:
+            raise OverflowError("Las claves enteras deben caber en 64 bits con signo.")
+        return valor - MIN_INT64
+    # -0.0 == 0.0, así que deben codificarse igual
+    bits = struct.unpack('>Q', struct.pack('>d', valor + 0.0))[0]
+    if bits >> 63:
+        return bits ^ 0xFFFFFFFFFFFFFFFF
+    return bits | 0x8000000000000000
+
+def _codificar_columna(valor):
+    """
+    Bytes que preservan el orden de un valor simple. Los números ocupan 8
+    bytes fijos; las cadenas (UTF-8) y los bytes escapan cada 0x00 como
+    0x00 0xFF y terminan en 0x00 0x00, de modo que una cadena queda antes que
+    cualquier otra que la extienda y las columnas se pueden concatenar.
+    """
+    if isinstance(valor, (int, float)):
+        return _codificar_numero(valor).to_bytes(8, 'big')
+    if isinstance(valor, str):
+        valor = valor.encode('utf-8', 'surrogatepass')
+    if isinstance(valor, (bytes, bytearray)):
+        return bytes(valor).replace(b'\x00', b'\x00\xff') + b'\x00\x00'
+    raise TypeError(f"Tipo de clave no admitido: {type(valor).__name__}")
+
+def codificar_clave(clave, descendente=False):
+    """
+    Convierte 'clave' en bytes cuyo orden lexicográfico es el de las claves.
+    'clave' puede ser un int (de 64 bits), un float, un str, unos bytes o una
+    tupla de ellos (se concatenan sus columnas). 'descendente' es un booleano
+    o, para tuplas, una secuencia con uno por columna: las columnas
+    descendentes invierten todos sus bytes.
+    Una misma columna debe tener el mismo tipo en todas las claves (no se
+    pueden mezclar int y float).
+    """
+    if isinstance(clave, tuple):
+        if isinstance(descendente, bool):
+            descendente = (descendente,) * len(clave)
+        return b''.join(_codificar_columna(valor).translate(_INVERTIR_BYTES) if desc
+                        else _codificar_columna(valor)
+                        for valor, desc in zip(clave, descendente))
+    codigo = _codificar_columna(clave)
+    return codigo.translate(_INVERTIR_BYTES) if descendente else codigo
+
+def radix_sort_compuesto(lista, key=None, descendente=False):
+    """
+    Ordena in-place 'lista' por claves compuestas sin comparar objetos Python:
+    cada clave (key(elemento), o el elemento) se codifica con codificar_clave
+    y se ordena con RadixSort. Si la clave es sólo numérica, su codificación
+    de ancho fijo se trata como un entero y se usa el LSD RadixSort; si tiene
+    cadenas, los bytes se ordenan con el MSD RadixSort.
+    'descendente' funciona como en codificar_clave (p. ej. (True, False, False)
+    para ordenar por (puntuación desc, nombre, id)). El orden es estable.
+    """
+    if len(lista) < 2:
+        return lista
+    claves = lista if key is None else [key(elemento) for elemento in lista]
+
+    # 1. Codificar cada clave una sola vez
+    codigos = [codificar_clave(clave, descendente) for clave in claves]
+
+    # 2. Claves sólo numéricas (de ancho fijo): como enteros, con el LSD
+    # RadixSort (en base 65536 si ocupan más de 8 bytes: la mitad de pasadas)
+    columnas = claves[0] if isinstance(claves[0], tuple) else (claves[0],)
+    if all(isinstance(valor, (int, float)) for valor in columnas):
+        enteros = [int.from_bytes(codigo, 'big') for codigo in codigos]
+        base = 65536 if len(codigos[0]) > 8 else 256
+        lista[:] = _comun.ordenar_con_claves_calculadas(lista, enteros, False,
+                                                        lambda c: radix_sort(c, base))
+        return lista
+
+    # 3. Claves con cadenas: los bytes, con el MSD RadixSort
+    lista[:] = _comun.ordenar_con_claves_calculadas(lista, codigos, False, msd_radix_sort)
     return lista
 
 # Ejemplo de Uso
 if __name__ == '__main__':
-    # RadixSort funciona mejor con enteros no negativos
-    datos = [170, 45, 75, 90, 802, 24, 2, 66] 
+    datos = [170, 45, 75, 90, 802, 24, 2, 66, -5, -170]
     print("Datos originales:", datos)
     lista_ordenada = radix_sort(datos)
     print("RadixSort:", lista_ordenada)
+
+    rutas = ['/api/v1/users', '/api/v1/orders', '/api/v2/users', '/static/app.js', '/api/v1/']
+    print("Rutas originales:", rutas)
+    print("MSD RadixSort:", msd_radix_sort(rutas))
+
+    codigos = [404, 200, 200, 500, 301, 200, 404]
+    print("Códigos originales:", codigos)
+    print("Ordenamiento por Conteo:", counting_sort(codigos, 0, 599))
+
+    reales = [0.78, 0.17, 0.39, 0.26, 0.72, 0.94, 0.21, 0.12, 0.23, 0.68]
+    print("Reales originales:", reales)
+    print("Ordenamiento por Cubetas:", bucket_sort(reales))
+
+    # Casos límite de las escalas de las cubetas: rango que desborda y subnormales
+    for extremos in ([-1e308, 1e308, 0.0], [5e-324, 0.0, 1e-323, 5e-324, 2e-323] * 40):
+        assert bucket_sort(list(extremos)) == sorted(extremos)
+        assert bucket_sort(list(extremos), reverse=True) == sorted(extremos, reverse=True)
+
+    # (puntuación desc, nombre, id) sin comparaciones entre tuplas
+    registros = [(0.5, 'ana', 3), (2.25, 'luis', 1), (0.5, 'ana', 1), (-1.0, 'eva', 2), (2.25, 'bea', 7)]
+    print("Registros originales:", registros)
+    print("RadixSort compuesto:", radix_sort_compuesto(registros, descendente=(True, False, False)))
@@ -0,0 +1,274 @@
+# ==============================================================================
+# 13. Despachador de Ordenamiento (elección del algoritmo por entrada)
+#
+# Punto de entrada único 'ordenar' que toma una muestra barata de los datos
+# (tamaño, tipo, rango de enteros, runs naturales, duplicados e inversiones)
+# y elige el motor más rápido de 001_Interno para esa entrada concreta.
+# Cada decisión puede registrarse para auditarla después.
+# ==============================================================================
+
+import importlib.util
+import os
+from math import isfinite
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Por debajo de este tamaño no merece la pena perfilar: Inserción binaria
+UMBRAL_PEQUENO = 64
+# Número de ventanas contiguas (y su longitud) usadas para estimar los runs
+NUM_VENTANAS = 16
+LONGITUD_VENTANA = 64
+# Tamaño de la muestra para estimar duplicados e inversiones
+TAMANO_MUESTRA = 48
+# Longitud media de run a partir de la cual se considera la entrada "casi ordenada"
+LONGITUD_RUN_ADAPTATIVO = 64
+# Proporción de valores distintos en la muestra por debajo de la cual hay "muchos duplicados"
+PROPORCION_DUPLICADOS = 0.5
+# Prefijo común medio (en caracteres) a partir del cual compensa el MSD RadixSort
+PREFIJO_MSD = 8
+# Ordenamiento por Conteo mientras el rango de los enteros no supere este
+# múltiplo de n (su coste es O(n + rango))
+RANGO_CONTEO_POR_ELEMENTO = 8
+
+# Rango de un entero con signo de 64 bits (lo que admite radix_sort con array('q'))
+MIN_INT64 = -(1 << 63)
+MAX_INT64 = (1 << 63) - 1
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_despachador_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_comun = cargar_modulo('000_Comun.py')
+_insercion = cargar_modulo('001_Insertion_Sort.py')
+_quick = cargar_modulo('005_Quick_Sort.py')
+_merge = cargar_modulo('006_Merge_Sort.py')
+_radix = cargar_modulo('007_Radix_Sort.py')
+
+# --- Perfilado de la Entrada ---
+
+def _indices_muestra(n, cantidad):
+    """Índices repartidos uniformemente por [0, n) (muestreo determinista)."""
+    if n <= cantidad:
+        return range(n)
+    paso = n / cantidad
+    return [int(i * paso) for i in range(cantidad)]
+
+def _estimar_runs(datos):
+    """
+    Estima el número de runs naturales (los que aprovechan natural_merging en
+    002_Natu_Merg.py y generar_runs en 002_Externo/006_Runs_Memoria.py) mirando
+    sólo unas ventanas contiguas: la proporción de "roturas" dentro de las
+    ventanas se extrapola a toda la entrada. Se cuentan tanto los runs
+    ascendentes como los descendentes, y se devuelve el menor.
+    """
+    n = len(datos)
+    longitud = min(LONGITUD_VENTANA, n)
+    descensos = ascensos = comparaciones = 0
+    for inicio in _indices_muestra(n - longitud + 1, NUM_VENTANAS):
+        for i in range(inicio + 1, inicio + longitud):
+            if datos[i] < datos[i - 1]:
+                descensos += 1
+            elif datos[i - 1] < datos[i]:
+                ascensos += 1
+        comparaciones += longitud - 1
+
+    if comparaciones == 0:
+        return 1
+    roturas = min(descensos, ascensos) / comparaciones
+    return 1 + round(roturas * (n - 1))
+
+def _estimar_inversiones(muestra):
+    """
+    Proporción de pares (i < j) de la muestra con muestra[i] > muestra[j]:
+    0 para datos ordenados, ~0.5 para aleatorios y 1 para invertidos.
+    """
+    m = len(muestra)
+    if m < 2:
+        return 0.0
+    inversiones = 0
+    for i in range(m - 1):
+        valor = muestra[i]
+        for j in range(i + 1, m):
+            if muestra[j] < valor:
+                inversiones += 1
+    return inversiones / (m * (m - 1) // 2)
+
+def _prefijo_comun_medio(muestra):
+    """Longitud media del prefijo común entre vecinos de la muestra ordenada."""
+    ordenada = sorted(muestra)
+    if len(ordenada) < 2:
+        return 0
+    total = 0
+    for a, b in zip(ordenada, ordenada[1:]):
+        comun = 0
+        limite = min(len(a), len(b))
+        while comun < limite and a[comun] == b[comun]:
+            comun += 1
+        total += comun
+    return total / (len(ordenada) - 1)
+
+def perfilar(datos):
+    """
+    Calcula el perfil de la entrada a partir de muestras baratas.
+    Sólo recorre todos los datos (en C, con min/max/all) cuando la muestra
+    indica enteros o reales, para confirmar el tipo y obtener el rango exacto.
+    """
+    n = len(datos)
+    muestra = [datos[i] for i in _indices_muestra(n, TAMANO_MUESTRA)]
+    perfil = {'n': n, 'tipo': 'mixto', 'minimo': None, 'maximo': None, 'nan': 0}
+
+    # 1. Tipo de los elementos
+    if muestra and all(isinstance(x, int) for x in muestra) and \
+            all(isinstance(x, int) for x in datos):
+        perfil['tipo'] = 'int'
+        perfil['minimo'] = min(datos)
+        perfil['maximo'] = max(datos)
+    elif muestra and all(isinstance(x, str) for x in muestra):
+        perfil['tipo'] = 'str'
+    elif muestra and all(isinstance(x, (bytes, bytearray)) for x in muestra):
+        perfil['tipo'] = 'bytes'
+    elif muestra and all(isinstance(x, float) for x in muestra) and \
+            all(isinstance(x, float) for x in datos):
+        perfil['tipo'] = 'float'
+        perfil['minimo'] = min(datos)
+        perfil['maximo'] = max(datos)
+        # Con NaN, min y max dependen de dónde esté: hay que contarlos
+        perfil['nan'] = sum(1 for x in datos if x != x)
+
+    # 2. Orden existente: runs naturales e inversiones
+    perfil['runs_estimados'] = _estimar_runs(datos)
+    perfil['inversiones'] = _estimar_inversiones(muestra)
+
+    # 3. Duplicados: proporción de valores distintos en la muestra
+    try:
+        perfil['distintos'] = len(set(muestra)) / len(muestra) if muestra else 1.0
+    except TypeError:
+        perfil['distintos'] = 1.0
+
+    # 4. Prefijo común (sólo cadenas)
+    if perfil['tipo'] in ('str', 'bytes'):
+        perfil['prefijo_comun'] = _prefijo_comun_medio(muestra)
+
+    return perfil
+
+# --- Elección del Algoritmo ---
+
+def elegir_algoritmo(perfil):
+    """
+    Devuelve (nombre_algoritmo, motivo) para un perfil dado.
+    El orden de las reglas refleja qué motor gana en cada situación.
+    """
+    n = perfil['n']
+
+    # 1. Entradas pequeñas: el coste de perfilar no compensa
+    if n < UMBRAL_PEQUENO:
+        return 'insertion_sort', f"n={n} < {UMBRAL_PEQUENO}"
+
+    # 2. Entradas casi ordenadas (o casi invertidas): MergeSort adaptativo ~O(n)
+    longitud_media = n / perfil['runs_estimados']
+    if longitud_media >= LONGITUD_RUN_ADAPTATIVO:
+        return 'tim_sort', f"runs largos (longitud media estimada {longitud_media:.0f})"
+    if perfil['inversiones'] <= 0.01 or perfil['inversiones'] >= 0.99:
+        return 'tim_sort', f"inversiones estimadas {perfil['inversiones']:.3f}"
+
+    # 3. Enteros: Conteo si el rango es pequeño; si no, RadixSort (64 bits)
+    if perfil['tipo'] == 'int':
+        rango = perfil['maximo'] - perfil['minimo']
+        if rango < RANGO_CONTEO_POR_ELEMENTO * n:
+            return 'counting_sort', f"enteros con rango pequeño {rango}"
+        if MIN_INT64 <= perfil['minimo'] and perfil['maximo'] <= MAX_INT64:
+            return 'radix_sort', f"enteros con rango {rango}"
+
+    # 4. Reales: Ordenamiento por Cubetas (que adapta sus cubetas a la
+    # distribución), si no hay NaN y el rango es finito
+    if perfil['tipo'] == 'float' and not perfil['nan'] and \
+            isfinite(perfil['maximo'] - perfil['minimo']):
+        return 'bucket_sort', f"reales en [{perfil['minimo']:.3g}, {perfil['maximo']:.3g}]"
+
+    # 5. Cadenas con prefijos comunes largos: MSD RadixSort
+    if perfil['tipo'] in ('str', 'bytes') and perfil['prefijo_comun'] >= PREFIJO_MSD:
+        return 'msd_radix_sort', f"prefijo común medio {perfil['prefijo_comun']:.1f}"
+
+    # 6. Muchos duplicados: QuickSort con partición de tres vías
+    if perfil['distintos'] < PROPORCION_DUPLICADOS:
+        return 'quick_sort', f"muchos duplicados ({perfil['distintos']:.2f} distintos en la muestra)"
+
+    # 7. Caso general
+    return 'quick_sort', "caso general"
+
+def _motor(nombre, n):
+    """Función que ordena in-place una lista de valores con el algoritmo 'nombre'."""
+    if nombre == 'insertion_sort':
+        return _insercion.insertion_sort
+    if nombre == 'tim_sort':
+        return _merge.tim_sort
+    if nombre == 'radix_sort':
+        # La base 65536 sólo compensa su histograma con entradas grandes
+        base = 65536 if n >= 1 << 14 else 256
+        return lambda lista: _radix.radix_sort(lista, base)
+    if nombre == 'counting_sort':
+        return _radix.counting_sort
+    if nombre == 'bucket_sort':
+        return _radix.bucket_sort
+    if nombre == 'msd_radix_sort':
+        return _radix.msd_radix_sort
+    return _quick.quick_sort
+
+# --- Punto de Entrada ---
+
+def ordenar(datos, key=None, reverse=False, registro=None):
+    """
+    Ordena 'datos' eligiendo el algoritmo según un perfil de la entrada.
+    Si 'datos' es una lista se ordena in-place; cualquier otro iterable se
+    convierte antes en lista. 'key' y 'reverse' se comportan como en sorted():
+    el perfil se calcula sobre las claves, que se calculan una sola vez.
+    Si se pasa una lista en 'registro', se le añade la decisión tomada
+    (algoritmo, motivo y perfil) para poder auditarla.
+    """
+    lista = datos if isinstance(datos, list) else list(datos)
+
+    # 1. Las claves se calculan una vez y son lo que se perfila y se ordena
+    claves = lista if key is None else [key(elemento) for elemento in lista]
+
+    # 2. Perfilar y elegir
+    perfil = perfilar(claves)
+    algoritmo, motivo = elegir_algoritmo(perfil)
+    if registro is not None:
+        registro.append({'algoritmo': algoritmo, 'motivo': motivo, 'perfil': perfil})
+
+    # 3. Ordenar con el motor elegido
+    motor = _motor(algoritmo, len(lista))
+    if key is None and not reverse:
+        motor(lista)
+    else:
+        lista[:] = _comun.ordenar_con_claves_calculadas(lista, list(claves), reverse, motor)
+    return lista
+
+# Ejemplo de Uso
+if __name__ == '__main__':
+    import random
+
+    entradas = {
+        'pequeña': [64, 25, 12, 22, 11],
+        'enteros aleatorios': [random.randint(-10**6, 10**6) for _ in range(5000)],
+        'casi ordenada': list(range(5000)) + [3, 1, 2],
+        'pocos valores': [random.choice([200, 404, 500]) for _ in range(5000)],
+        'rutas': [f"/api/v1/usuarios/{random.randint(0, 999)}" for _ in range(5000)],
+        'reales': [random.random() for _ in range(5000)],
+    }
+    registro = []
+    for nombre, datos in entradas.items():
+        ordenar(datos, registro=registro)
+        assert datos == sorted(datos)
+        decision = registro[-1]
+        print(f"{nombre:>20}: {decision['algoritmo']:<15} ({decision['motivo']})")
@@ -0,0 +1,181 @@
+# ==============================================================================
+# 14. Instrumentación de los Algoritmos (Observador de Métricas)
+#
+# Los algoritmos de 001_Interno aceptan un parámetro opcional 'observador'.
+# Con observador=None (el caso normal) no se ejecuta nada adicional dentro de
+# los bucles internos. Con un Observador, cada llamada instrumentada le informa
+# al terminar de sus totales (comparaciones, movimientos, intercambios,
+# profundidad...), que se calculan a partir de los índices finales en lugar de
+# contarse elemento a elemento, y los algoritmos cronometran sus fases
+# (partición/recursión, construcción/recorrido, histograma/distribución...).
+# ==============================================================================
+
+import importlib.util
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+class Observador:
+    """
+    Acumula las métricas que le envían los algoritmos instrumentados.
+    - metricas[origen][nombre]: suma de lo informado por cada llamada a 'origen'
+    - llamadas[origen]: número de llamadas que informaron desde 'origen'
+    - maximos[origen][nombre]: máximo observado (p. ej. profundidad de recursión)
+    - tiempos[fase]: segundos exclusivos de cada fase (sin sus fases anidadas)
+    - pico_memoria: pico de memoria en bytes medido con tracemalloc
+    """
+
+    def __init__(self):
+        self.metricas = {}
+        self.llamadas = {}
+        self.maximos = {}
+        self.tiempos = {}
+        self.pico_memoria = None
+        # Pila de fases abiertas: [nombre, instante desde el que se le cuenta tiempo]
+        self._fases = []
+
+    # --- Contadores ---
+
+    def registrar(self, origen, **cantidades):
+        """Suma las cantidades informadas por una llamada a 'origen'."""
+        self.llamadas[origen] = self.llamadas.get(origen, 0) + 1
+        totales = self.metricas.setdefault(origen, {})
+        for nombre, cantidad in cantidades.items():
+            totales[nombre] = totales.get(nombre, 0) + cantidad
+
+    def maximo(self, origen, nombre, valor):
+        """Guarda el máximo de 'nombre' visto en 'origen'."""
+        maximos = self.maximos.setdefault(origen, {})
+        if valor > maximos.get(nombre, valor - 1):
+            maximos[nombre] = valor
+
+    def total(self, nombre):
+        """Suma de la métrica 'nombre' sobre todos los orígenes."""
+        return sum(totales.get(nombre, 0) for totales in self.metricas.values())
+
+    # --- Cronómetros por Fase ---
+
+    @contextmanager
+    def fase(self, nombre):
+        """
+        Cronometra un bloque como la fase 'nombre'. Las fases pueden anidarse:
+        mientras una fase interna está abierta, el tiempo deja de contar para
+        la externa, de modo que cada fase acumula sólo su tiempo exclusivo
+        (p. ej. 'recursion' no incluye el tiempo pasado en 'particion').
+        """
+        ahora = time.perf_counter()
+        if self._fases:
+            # Pausar la fase externa
+            externa = self._fases[-1]
+            self._acumular(externa[0], ahora - externa[1])
+        actual = [nombre, ahora]
+        self._fases.append(actual)
+        try:
+            yield
+        finally:
+            ahora = time.perf_counter()
+            self._fases.pop()
+            self._acumular(nombre, ahora - actual[1])
+            if self._fases:
+                # Reanudar la fase externa
+                self._fases[-1][1] = ahora
+
+    def _acumular(self, nombre, segundos):
+        self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + segundos
+
+    # --- Memoria ---
+
+    @contextmanager
+    def memoria(self):
+        """
+        Mide con tracemalloc el pico de memoria del bloque y lo guarda en
+        'pico_memoria'. Si tracemalloc ya estaba activo, sólo reinicia su pico
+        y lo deja activo al salir.
+        """
+        ya_activo = tracemalloc.is_tracing()
+        if ya_activo:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            self.pico_memoria = tracemalloc.get_traced_memory()[1] - base
+            if not ya_activo:
+                tracemalloc.stop()
+
+    # --- Informe ---
+
+    def informe(self):
+        """Devuelve un resumen legible de todas las métricas acumuladas."""
+        lineas = []
+        for origen in sorted(self.llamadas):
+            valores = ", ".join(f"{nombre}={cantidad}"
+                                for nombre, cantidad in sorted(self.metricas[origen].items()))
+            maximos = ", ".join(f"{nombre}_max={valor}"
+                                for nombre, valor in sorted(self.maximos.get(origen, {}).items()))
+            detalle = ", ".join(parte for parte in (valores, maximos) if parte)
+            lineas.append(f"  {origen} (x{self.llamadas[origen]}): {detalle}")
+        # Los orígenes que sólo informaron de máximos
+        for origen in sorted(set(self.maximos) - set(self.llamadas)):
+            maximos = ", ".join(f"{nombre}_max={valor}"
+                                for nombre, valor in sorted(self.maximos[origen].items()))
+            lineas.append(f"  {origen}: {maximos}")
+        for nombre, segundos in sorted(self.tiempos.items(), key=lambda par: -par[1]):
+            lineas.append(f"  fase {nombre}: {segundos * 1000:.2f} ms")
+        if self.pico_memoria is not None:
+            lineas.append(f"  pico de memoria: {self.pico_memoria / 1024:.1f} KiB")
+        return "\n".join(lineas)
+
+def medir(algoritmo, lista, memoria=True, **opciones):
+    """
+    Ejecuta algoritmo(lista, observador=..., **opciones) con un Observador
+    nuevo (y, si 'memoria', midiendo el pico con tracemalloc).
+    Devuelve (resultado, observador).
+    """
+    observador = Observador()
+    if memoria:
+        with observador.memoria():
+            resultado = algoritmo(lista, observador=observador, **opciones)
+    else:
+        resultado = algoritmo(lista, observador=observador, **opciones)
+    return resultado, observador
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_instrumentacion_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+# Ejemplo de Uso
+if __name__ == '__main__':
+    import random
+
+    algoritmos = [
+        ('002_Selection_Sort.py', 'selection_sort', 500),
+        ('003_Intercambio.py', 'bubble_sort', 500),
+        ('004_Orden_Arb.py', 'tree_sort', 20000),
+        ('005_Quick_Sort.py', 'quick_sort', 20000),
+        ('006_Merge_Sort.py', 'merge_sort', 20000),
+        ('007_Radix_Sort.py', 'radix_sort', 20000),
+        ('007_Radix_Sort.py', 'bucket_sort', 20000),
+    ]
+    for archivo, nombre, n in algoritmos:
+        algoritmo = getattr(cargar_modulo(archivo), nombre)
+        datos = [random.randint(-10**6, 10**6) for _ in range(n)]
+        resultado, observador = medir(algoritmo, datos)
+        assert resultado == sorted(datos)
+        print(f"{nombre} (n={n}):")
+        print(observador.informe())
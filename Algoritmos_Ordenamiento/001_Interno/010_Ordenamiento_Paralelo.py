@@ -0,0 +1,398 @@
+# ==============================================================================
+# 15. Ordenamiento Paralelo (multiproceso con memoria compartida)
+#
+# Reparte la entrada en P trozos dentro de un búfer de
+# multiprocessing.shared_memory (enteros de 64 bits o reales dobles), ordena
+# cada trozo en un proceso con los motores de 001_Interno (quick_sort,
+# merge_sort o radix_sort) y los combina en paralelo de una de dos formas:
+#   - 'muestreo': Sample Sort por muestreo regular (PSRS). Cada trozo ordenado
+#     aporta P muestras, se eligen P-1 divisores y cada proceso fusiona la
+#     franja de valores que le toca de todos los trozos.
+#   - 'arbol': árbol de fusiones. En cada ronda, grupos de GRADO_FUSION runs
+#     contiguos se fusionan en paralelo con fusionar_multiples_runs (de
+#     003_Balan_Multi_Merg.py) alternando entre dos búferes compartidos.
+# Los procesos leen y escriben directamente en la memoria compartida: entre
+# procesos sólo viajan índices y muestras, nunca los datos elemento a elemento.
+# ==============================================================================
+
+import importlib.util
+import multiprocessing
+import os
+import pickle
+import queue
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from multiprocessing import shared_memory
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Por debajo de este tamaño el coste de crear procesos no compensa
+UMBRAL_PARALELO = 1 << 15
+# Número de runs que fusiona cada proceso en una ronda del árbol de fusiones
+GRADO_FUSION = 4
+# Elementos que cada proceso acumula antes de escribir su fusión en el búfer compartido
+BLOQUE_FUSION = 1 << 14
+# Segundos entre comprobaciones de procesos muertos mientras se esperan resultados
+INTERVALO_ESPERA = 0.5
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(ruta_relativa):
+    """
+    Carga un módulo del proyecto a partir de su ruta relativa a este directorio.
+    Es necesario porque los nombres de archivo empiezan por dígitos y no se
+    pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, ruta_relativa)
+    nombre = os.path.splitext(os.path.basename(ruta_relativa))[0]
+    spec = importlib.util.spec_from_file_location(f"_paralelo_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_comun = cargar_modulo('000_Comun.py')
+_quick = cargar_modulo('005_Quick_Sort.py')
+_merge = cargar_modulo('006_Merge_Sort.py')
+_radix = cargar_modulo('007_Radix_Sort.py')
+_multivia = cargar_modulo(os.path.join('..', '002_Externo', '003_Balan_Multi_Merg.py'))
+
+MOTORES = {
+    'quick_sort': _quick.quick_sort,
+    'merge_sort': _merge.merge_sort,
+    'radix_sort': _radix.radix_sort,
+}
+
+# --- Ejecución en Paralelo ---
+
+def _contexto():
+    """
+    Contexto de multiprocessing. Se prefiere 'fork': los procesos heredan los
+    motores ya cargados y las tareas no necesitan serializarse (los módulos de
+    este proyecto se cargan con importlib y no se pueden importar por nombre).
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def _trabajador(tarea, indice, argumentos, cola):
+    """
+    Ejecuta tarea(*argumentos) y envía (indice, resultado, None) al proceso
+    principal, o (indice, None, excepción) si la tarea falla, para que éste
+    no se quede esperando un resultado que nunca llegará.
+    """
+    try:
+        resultado = tarea(*argumentos)
+    except BaseException as excepcion:
+        try:
+            # La cola serializa en otro hilo y allí un fallo se perdería
+            pickle.dumps(excepcion)
+        except Exception:
+            excepcion = RuntimeError(f"{type(excepcion).__name__}: {excepcion}")
+        cola.put((indice, None, excepcion))
+    else:
+        cola.put((indice, resultado, None))
+
+def _en_paralelo(tarea, lista_argumentos):
+    """
+    Lanza un proceso por cada tupla de 'lista_argumentos' y devuelve la lista
+    de resultados en el mismo orden. Los resultados deben ser pequeños
+    (muestras o nada): los datos se intercambian por memoria compartida.
+    Si una tarea lanza una excepción, o un proceso muere sin responder, se
+    terminan los demás y se propaga el error.
+    """
+    if len(lista_argumentos) == 1:
+        return [tarea(*lista_argumentos[0])]
+
+    contexto = _contexto()
+    cola = contexto.Queue()
+    procesos = [contexto.Process(target=_trabajador, args=(tarea, indice, argumentos, cola))
+                for indice, argumentos in enumerate(lista_argumentos)]
+    resultados = [None] * len(procesos)
+    pendientes = set(range(len(procesos)))
+    try:
+        for proceso in procesos:
+            proceso.start()
+
+        # Recoger los resultados antes de esperar a los procesos (la cola
+        # podría bloquearlos si nadie la vacía)
+        while pendientes:
+            try:
+                indice, resultado, excepcion = cola.get(timeout=INTERVALO_ESPERA)
+            except queue.Empty:
+                # Un proceso que terminó con error sin enviar nada (p. ej.
+                # matado por el sistema) ya no responderá
+                for indice in pendientes:
+                    codigo = procesos[indice].exitcode
+                    if codigo is not None and codigo != 0:
+                        raise RuntimeError(f"Un proceso de ordenamiento terminó con código {codigo}")
+                continue
+            if excepcion is not None:
+                raise excepcion
+            resultados[indice] = resultado
+            pendientes.discard(indice)
+    finally:
+        # Tras un error, los procesos que sigan vivos ya no hacen falta
+        for proceso in procesos:
+            if proceso.is_alive() and pendientes:
+                proceso.terminate()
+        for proceso in procesos:
+            if proceso.pid is not None:
+                proceso.join()
+        cola.close()
+    for proceso in procesos:
+        if proceso.exitcode != 0:
+            raise RuntimeError(f"Un proceso de ordenamiento terminó con código {proceso.exitcode}")
+    return resultados
+
+# --- Tareas de los Procesos ---
+
+def _abrir(nombre, tipo):
+    """Se conecta a un bloque de memoria compartida y devuelve (bloque, vista tipada)."""
+    bloque = shared_memory.SharedMemory(name=nombre)
+    return bloque, bloque.buf.cast(tipo)
+
+def _cerrar(bloque, *vistas):
+    """
+    Libera las vistas y desconecta el proceso del bloque (sin destruirlo).
+    Si se llega aquí por una excepción del motor, su traceback puede retener
+    vistas sobre el bloque: entonces el bloque se deja abierto (el proceso va
+    a terminar) para que el error que se propague sea el original.
+    """
+    for vista in vistas:
+        vista.release()
+    try:
+        bloque.close()
+    except BufferError:
+        if sys.exc_info()[1] is None:
+            raise
+
+def _ordenar_trozo(nombre, tipo, inicio, fin, motor, num_muestras):
+    """
+    Ordena in-place vista[inicio:fin] con el 'motor' indicado y devuelve
+    'num_muestras' muestras regulares del trozo ya ordenado (para el Sample Sort).
+    Los motores aceptan memoryviews (protocolo de búfer), así que el trozo se
+    ordena directamente en la memoria compartida, sin copiarlo a una lista.
+    """
+    bloque, vista = _abrir(nombre, tipo)
+    trozo = vista[inicio:fin]
+    try:
+        MOTORES[motor](trozo)
+        paso = len(trozo) / num_muestras
+        return [trozo[int(k * paso)] for k in range(num_muestras)] if len(trozo) else []
+    finally:
+        _cerrar(bloque, trozo, vista)
+
+def _fusionar_franjas(nombre_origen, nombre_destino, tipo, franjas, desplazamiento):
+    """
+    Lee las franjas [inicio, fin) de origen (cada una ya ordenada), las fusiona
+    con fusionar_multiples_runs y escribe el resultado en destino a partir de
+    'desplazamiento'. Las franjas se leen directamente de la memoria
+    compartida y el resultado se escribe por bloques de BLOQUE_FUSION
+    elementos: el proceso nunca tiene sus franjas enteras como objetos.
+    """
+    origen_bloque, origen = _abrir(nombre_origen, tipo)
+    destino_bloque, destino = _abrir(nombre_destino, tipo)
+    runs = [origen[inicio:fin] for inicio, fin in franjas if fin > inicio]
+    try:
+        if len(runs) == 1:
+            destino[desplazamiento:desplazamiento + len(runs[0])] = runs[0]
+        elif runs:
+            # fusionar_multiples_runs devuelve un iterador (árbol de perdedores)
+            fusionado = _multivia.fusionar_multiples_runs(runs)
+            for bloque in iter(lambda: array(tipo, islice(fusionado, BLOQUE_FUSION)), array(tipo)):
+                destino[desplazamiento:desplazamiento + len(bloque)] = bloque
+                desplazamiento += len(bloque)
+    finally:
+        _cerrar(origen_bloque, *runs, origen)
+        _cerrar(destino_bloque, destino)
+
+# --- Combinación de los Trozos Ordenados ---
+
+def _combinar_por_muestreo(bloques, tipo, trozos, muestras):
+    """
+    Sample Sort por muestreo regular: elige P-1 divisores entre las P·P
+    muestras, corta cada trozo ordenado por los divisores (búsqueda binaria
+    directamente sobre la memoria compartida) y cada proceso fusiona su franja.
+    Devuelve el índice del búfer con el resultado.
+    """
+    p = len(trozos)
+    entrada, salida = bloques
+    vista = entrada.buf.cast(tipo)
+    try:
+        # 1. Divisores: muestras regulares de la lista de todas las muestras
+        todas = sorted(muestra for muestras_trozo in muestras for muestra in muestras_trozo)
+        divisores = [todas[j * len(todas) // p] for j in range(1, p)]
+
+        # 2. Cortes de cada trozo: cortes[i][j] es donde empieza la franja j del trozo i
+        cortes = []
+        for inicio, fin in trozos:
+            cortes.append([inicio] + [bisect_right(vista, divisor, inicio, fin)
+                                      for divisor in divisores] + [fin])
+    finally:
+        vista.release()
+
+    # 3. Cada franja j reúne la parte j de todos los trozos; su posición en la
+    # salida es la suma de los tamaños de las franjas anteriores
+    tareas = []
+    desplazamiento = 0
+    for j in range(p):
+        franjas = [(corte[j], corte[j + 1]) for corte in cortes]
+        tareas.append((entrada.name, salida.name, tipo, franjas, desplazamiento))
+        desplazamiento += sum(fin - inicio for inicio, fin in franjas)
+    _en_paralelo(_fusionar_franjas, tareas)
+    return 1
+
+def _combinar_por_arbol(bloques, tipo, trozos):
+    """
+    Árbol de fusiones: en cada ronda los runs se agrupan de GRADO_FUSION en
+    GRADO_FUSION y cada grupo (contiguo en el búfer) se fusiona en un proceso,
+    escribiendo en el otro búfer. Devuelve el índice del búfer con el resultado.
+    """
+    runs = list(trozos)
+    actual = 0
+    while len(runs) > 1:
+        origen, destino = bloques[actual], bloques[1 - actual]
+        grupos = [runs[i:i + GRADO_FUSION] for i in range(0, len(runs), GRADO_FUSION)]
+        _en_paralelo(_fusionar_franjas,
+                     [(origen.name, destino.name, tipo, grupo, grupo[0][0]) for grupo in grupos])
+        runs = [(grupo[0][0], grupo[-1][1]) for grupo in grupos]
+        actual = 1 - actual
+    return actual
+
+# --- Punto de Entrada ---
+
+def _tipo_de(lista):
+    """
+    Código de array para la lista ('q' enteros de 64 bits, 'd' reales) o
+    None si no se puede guardar en un búfer compartido.
+    """
+    if all(type(x) is int for x in lista):
+        if min(lista) >= _radix.MIN_INT64 and max(lista) <= _radix.MAX_INT64:
+            return 'q'
+        return None
+    if all(type(x) is float for x in lista):
+        return 'd'
+    return None
+
+def ordenar_paralelo(lista, procesos=None, motor='quick_sort', combinacion='muestreo',
+                     key=None, reverse=False):
+    """
+    Ordena in-place una lista de enteros (de 64 bits) o de reales usando
+    'procesos' procesos (por defecto, todos los núcleos).
+    'motor' es el algoritmo con el que cada proceso ordena su trozo
+    ('quick_sort', 'merge_sort' o 'radix_sort', éste sólo para enteros) y
+    'combinacion' cómo se unen los trozos ('muestreo' o 'arbol').
+    Las entradas pequeñas, con un solo proceso o de otros tipos se ordenan
+    con el motor en este mismo proceso. 'key' y 'reverse' se comportan como
+    en sorted() (las claves calculadas son lo que se ordena en paralelo).
+    Si un proceso falla se propaga su excepción, y los bloques de memoria
+    compartida se destruyen igualmente.
+    """
+    if motor not in MOTORES:
+        raise ValueError(f"Motor desconocido: {motor!r}")
+    if combinacion not in ('muestreo', 'arbol'):
+        raise ValueError(f"Combinación desconocida: {combinacion!r}")
+    if key is not None or reverse:
+        lista[:] = _comun.ordenar_con_clave(
+            lista, key, reverse,
+            lambda claves: ordenar_paralelo(claves, procesos, motor, combinacion))
+        return lista
+
+    n = len(lista)
+    p = procesos or os.cpu_count() or 1
+    tipo = _tipo_de(lista) if n else None
+    if n < UMBRAL_PARALELO or p < 2 or tipo is None:
+        return MOTORES[motor](lista)
+    if motor == 'radix_sort' and tipo != 'q':
+        raise ValueError("radix_sort sólo ordena enteros.")
+
+    # 1. Copiar la entrada a memoria compartida y reservar el segundo búfer
+    tamano = n * array(tipo).itemsize
+    bloques = []
+    try:
+        for _ in range(2):
+            bloques.append(shared_memory.SharedMemory(create=True, size=tamano))
+        with bloques[0].buf.cast(tipo) as vista:
+            vista[:] = array(tipo, lista)
+
+        # 2. Ordenar los P trozos en paralelo
+        trozos = [(i * n // p, (i + 1) * n // p) for i in range(p)]
+        muestras = _en_paralelo(_ordenar_trozo,
+                                [(bloques[0].name, tipo, inicio, fin, motor, p)
+                                 for inicio, fin in trozos])
+
+        # 3. Combinar los trozos ordenados
+        if combinacion == 'muestreo':
+            resultado = _combinar_por_muestreo(bloques, tipo, trozos, muestras)
+        else:
+            resultado = _combinar_por_arbol(bloques, tipo, trozos)
+
+        # 4. Volcar el resultado en la lista original
+        with bloques[resultado].buf.cast(tipo) as vista:
+            lista[:] = vista.tolist()
+    finally:
+        # Los bloques se destruyen siempre, aunque un proceso haya fallado
+        for bloque in bloques:
+            try:
+                bloque.close()
+            finally:
+                bloque.unlink()
+
+    return lista
+
+# --- Medición de la Aceleración ---
+
+def medir_aceleracion(n=2_000_000, nucleos=(1, 2, 4, 8, 16), motor='quick_sort',
+                      repeticiones=3, semilla=42):
+    """
+    Mide el tiempo de ordenar_paralelo con cada número de procesos de
+    'nucleos' y ambas combinaciones, y la aceleración respecto a ordenar con
+    el mismo motor en un solo proceso. Devuelve una lista de diccionarios.
+    """
+    import random
+    import time
+
+    generador = random.Random(semilla)
+    datos = [generador.randint(-10**12, 10**12) for _ in range(n)]
+
+    def mejor_tiempo(funcion):
+        mejor = float('inf')
+        for _ in range(repeticiones):
+            copia = list(datos)
+            inicio = time.perf_counter()
+            funcion(copia)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return mejor
+
+    base = mejor_tiempo(MOTORES[motor])
+    resultados = [{'procesos': 1, 'combinacion': '-', 'segundos': base, 'aceleracion': 1.0}]
+    for procesos in nucleos:
+        if procesos < 2:
+            continue
+        for combinacion in ('muestreo', 'arbol'):
+            segundos = mejor_tiempo(
+                lambda lista: ordenar_paralelo(lista, procesos, motor, combinacion))
+            resultados.append({'procesos': procesos, 'combinacion': combinacion,
+                               'segundos': segundos, 'aceleracion': base / segundos})
+    return resultados
+
+# Ejemplo de Uso
+if __name__ == '__main__':
+    import random
+
+    datos = [random.randint(-10**9, 10**9) for _ in range(200_000)]
+    esperado = sorted(datos)
+    for combinacion in ('muestreo', 'arbol'):
+        copia = list(datos)
+        ordenar_paralelo(copia, procesos=4, combinacion=combinacion)
+        assert copia == esperado
+        print(f"ordenar_paralelo ({combinacion}): correcto con 4 procesos")
+
+    # Aceleración respecto a un solo proceso (con tantos núcleos como haya)
+    disponibles = os.cpu_count() or 1
+    nucleos = [p for p in (1, 2, 4, 8, 16) if p <= disponibles]
+    for fila in medir_aceleracion(n=1_000_000, nucleos=nucleos, repeticiones=1):
+        print(f"{fila['procesos']:>3} procesos ({fila['combinacion']:>8}): "
+              f"{fila['segundos']:.2f} s  x{fila['aceleracion']:.2f}")
@@ -2,12 +2,33 @@
 # 8. Fusión Directa (Straight Merging) - Simulación Conceptual
 #
 # Algoritmo de ordenamiento externo. Simula el proceso de fusión de runs
-# de longitud fija (comenzando en 1) que se duplica en cada pasada.
+# de longitud fija que se duplica en cada pasada. La entrada nunca se carga
+# entera: los runs iniciales son bloques del tamaño del presupuesto de memoria
+# y las pasadas los fusionan en streaming (ver 006_Runs_Memoria.py).
 # ==============================================================================
 
+import importlib.util
 import os
 import random
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_externo_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_runs = cargar_modulo('006_Runs_Memoria.py')
+
 # --- Funciones Auxiliares para Simulación de Archivos ---
 
 def crear_archivo_datos(nombre_archivo, num_elementos=10):
@@ -16,123 +37,62 @@ def crear_archivo_datos(nombre_archivo, num_elementos=10):
         datos = [str(random.randint(1, 100)) for _ in range(num_elementos)]
         f.write('\n'.join(datos) + '\n')
 
-def leer_datos_archivo(nombre_archivo):
-    """Lee todos los números enteros de un archivo."""
-    try:
-        with open(nombre_archivo, 'r') as f:
-            datos = [int(line.strip()) for line in f if line.strip()]
-        return datos
-    except FileNotFoundError:
-        return []
-
-def escribir_runs_a_archivo(nombre_archivo, runs):
-    """Escribe una lista de runs (secuencias ordenadas) a un archivo."""
-    with open(nombre_archivo, 'w') as f:
-        for run in runs:
-            # Escribimos los elementos del run, separados por comas
-            f.write(','.join(map(str, run)) + '\n')
-            
-def leer_runs_de_archivo(nombre_archivo):
-    """Lee runs (secuencias ordenadas) de un archivo."""
-    runs = []
-    try:
-        with open(nombre_archivo, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    # Convertimos la línea de texto (separada por comas) a una lista de enteros
-                    run = [int(x) for x in line.split(',')]
-                    runs.append(run)
-        return runs
-    except FileNotFoundError:
-        return []
-
-def fusionar_dos_runs(run1, run2):
-    """Fusión simple de dos runs ordenados en un nuevo run ordenado."""
-    i = j = 0
-    run_fusionado = []
-    
-    # Mientras haya elementos en ambos runs
-    while i < len(run1) and j < len(run2):
-        if run1[i] <= run2[j]:
-            run_fusionado.append(run1[i])
-            i += 1
-        else:
-            run_fusionado.append(run2[j])
-            j += 1
-            
-    # Agregar los elementos restantes
-    run_fusionado.extend(run1[i:])
-    run_fusionado.extend(run2[j:])
-    
-    return run_fusionado
-
 # --- Algoritmo Principal ---
 
-def straight_merging(archivo_entrada, archivo_salida, archivos_trabajo=['T1.txt', 'T2.txt']):
+def straight_merging(archivo_entrada, archivo_salida, archivos_trabajo=['T1.txt', 'T2.txt'],
+                     memoria=_runs.MEMORIA_POR_DEFECTO):
     """
-    Simula la Fusión Directa.
-    Comienza con runs de longitud 1 y duplica la longitud en cada pasada.
+    Simula la Fusión Directa con memoria acotada.
+    Los runs iniciales son bloques de la entrada que caben en 'memoria' (todos
+    de la misma longitud salvo el último), leídos en streaming y ordenados en
+    memoria. Cada pasada fusiona pares de runs consecutivos, duplicando su
+    longitud, y lee los runs de disco elemento a elemento.
+    Devuelve el número de elementos ordenados.
     """
     print("--- Fusión Directa (Straight Merging) ---")
     
-    # Paso 1: Distribución inicial de runs de longitud 1
-    datos = leer_datos_archivo(archivo_entrada)
-    if not datos:
+    # Paso 1: Generación de runs iniciales (un bloque de memoria cada vez)
+    # Bloques de lectura y escritura de las fusiones de dos vías
+    tamano_bloque = _runs.tamano_bloque_fusion(memoria, 2)
+    runs = _runs.ArchivoRuns(archivos_trabajo[0], tamano_bloque=tamano_bloque)
+    for bloque in _runs.generar_runs(archivo_entrada, memoria):
+        runs.escribir_run(bloque)
+    runs.cerrar()
+    if not runs:
         print("El archivo de entrada está vacío.")
-        return []
-        
-    # Cada elemento es un run de longitud 1
-    runs_iniciales = [[x] for x in datos]
-    
-    # Escribimos los runs iniciales en el primer archivo de trabajo
-    escribir_runs_a_archivo(archivos_trabajo[0], runs_iniciales)
+        return 0
+    total = runs.elementos()
     
-    longitud_run = 1
+    longitud_run = runs.runs[0][1]
     pasada = 0
     
-    while longitud_run < len(datos):
+    while len(runs) > 1:
         pasada += 1
-        print(f"\nPasada {pasada}: Longitud de Run = {longitud_run}")
+        print(f"\nPasada {pasada}: {len(runs)} runs de longitud {longitud_run}")
         
-        # Alternamos los archivos de entrada y salida
-        archivo_entrada_pasada = archivos_trabajo[(pasada - 1) % 2]
-        archivo_salida_pasada = archivos_trabajo[pasada % 2]
+        # Alternamos los archivos de trabajo; la última pasada (dos runs)
+        # escribe directamente en el archivo de salida
+        archivo_salida_pasada = archivo_salida if len(runs) <= 2 else archivos_trabajo[pasada % 2]
+        # Los archivos de trabajo son binarios; la salida final se escribe como texto
+        runs_salida = _runs.ArchivoRuns(archivo_salida_pasada,
+                                        texto=archivo_salida_pasada == archivo_salida,
+                                        tamano_bloque=tamano_bloque)
         
-        runs_a_fusionar = leer_runs_de_archivo(archivo_entrada_pasada)
-        runs_salida = []
-        
-        # Fusionamos pares de runs
-        i = 0
-        while i < len(runs_a_fusionar):
-            run1 = runs_a_fusionar[i]
-            # Tomamos el segundo run, si existe
-            run2 = runs_a_fusionar[i + 1] if i + 1 < len(runs_a_fusionar) else []
-            
-            run_fusionado = fusionar_dos_runs(run1, run2)
-            runs_salida.append(run_fusionado)
-            
-            # Avanzamos dos posiciones (un par de runs)
-            i += 2
-                
-        # Escribimos los runs fusionados en el archivo de salida
-        escribir_runs_a_archivo(archivo_salida_pasada, runs_salida)
-        print(f"Runs fusionados en {archivo_salida_pasada}: {runs_salida}")
+        # Fusionamos pares de runs en streaming
+        for i in range(0, len(runs), 2):
+            runs_salida.escribir_run(_runs.fusionar_en_streaming(runs.leer_runs(i, i + 2)))
+        runs_salida.cerrar()
+        print(f"Runs fusionados en {archivo_salida_pasada}: {len(runs_salida)}")
         
+        runs = runs_salida
         # Duplicamos la longitud del run para la siguiente pasada
         longitud_run *= 2
         
-    # El resultado final está en el último archivo de salida
-    archivo_final = archivos_trabajo[(pasada) % 2]
-    runs_finales = leer_runs_de_archivo(archivo_final)
-    
-    if runs_finales:
-        resultado = runs_finales[0]
-        # Escribimos el resultado final en el archivo de salida
-        escribir_runs_a_archivo(archivo_salida, [resultado])
-        print(f"\nResultado final escrito en {archivo_salida}: {resultado}")
-        return resultado
-    return []
+    # Con un único run inicial, se copia del archivo de trabajo a la salida
+    if runs.nombre != archivo_salida:
+        _runs.escribir_salida(archivo_salida, runs.leer_run(0))
+    print(f"\nResultado final escrito en {archivo_salida}: {total} elementos")
+    return total
 
 # --- Ejemplo de Uso y Limpieza ---
 
@@ -148,10 +108,10 @@ if __name__ == '__main__':
             os.remove(f)
 
     # Crear datos de entrada
-    crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=10)
+    crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=1000)
     
-    # Ejecutar el algoritmo
-    straight_merging(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, ARCHIVOS_TRABAJO)
+    # Ejecutar el algoritmo (4 KiB de memoria: runs iniciales de ~85 elementos)
+    straight_merging(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, ARCHIVOS_TRABAJO, memoria='4KB')
     
     # Limpieza final
     for f in archivos_a_limpiar:
@@ -2,12 +2,32 @@
 # 9. Fusión Natural (Natural Merging) - Simulación Conceptual
 #
 # Algoritmo de ordenamiento externo. Utiliza runs de longitud variable
-# (runs naturales) en lugar de runs de longitud fija.
+# (runs naturales) en lugar de runs de longitud fija. La entrada se lee en
+# streaming con un presupuesto de memoria (ver 006_Runs_Memoria.py).
 # ==============================================================================
 
+import importlib.util
 import os
 import random
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_externo_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_runs = cargar_modulo('006_Runs_Memoria.py')
+
 # --- Funciones Auxiliares para Simulación de Archivos ---
 
 def crear_archivo_datos(nombre_archivo, num_elementos=10):
@@ -16,95 +36,34 @@ def crear_archivo_datos(nombre_archivo, num_elementos=10):
         datos = [str(random.randint(1, 100)) for _ in range(num_elementos)]
         f.write('\n'.join(datos) + '\n')
 
-def leer_datos_archivo(nombre_archivo):
-    """Lee todos los números enteros de un archivo."""
-    try:
-        with open(nombre_archivo, 'r') as f:
-            datos = [int(line.strip()) for line in f if line.strip()]
-        return datos
-    except FileNotFoundError:
-        return []
-
-def escribir_runs_a_archivo(nombre_archivo, runs):
-    """Escribe una lista de runs (secuencias ordenadas) a un archivo."""
-    with open(nombre_archivo, 'w') as f:
-        for run in runs:
-            # Escribimos los elementos del run, separados por comas
-            f.write(','.join(map(str, run)) + '\n')
-            
-def leer_runs_de_archivo(nombre_archivo):
-    """Lee runs (secuencias ordenadas) de un archivo."""
-    runs = []
-    try:
-        with open(nombre_archivo, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    # Convertimos la línea de texto (separada por comas) a una lista de enteros
-                    run = [int(x) for x in line.split(',')]
-                    runs.append(run)
-        return runs
-    except FileNotFoundError:
-        return []
-
-def fusionar_dos_runs(run1, run2):
-    """Fusión simple de dos runs ordenados en un nuevo run ordenado."""
-    i = j = 0
-    run_fusionado = []
-    
-    # Mientras haya elementos en ambos runs
-    while i < len(run1) and j < len(run2):
-        if run1[i] <= run2[j]:
-            run_fusionado.append(run1[i])
-            i += 1
-        else:
-            run_fusionado.append(run2[j])
-            j += 1
-            
-    # Agregar los elementos restantes
-    run_fusionado.extend(run1[i:])
-    run_fusionado.extend(run2[j:])
-    
-    return run_fusionado
-
-def obtener_runs_naturales(datos):
-    """Identifica y extrae las secuencias ya ordenadas (runs naturales) de los datos."""
-    runs = []
-    if not datos:
-        return runs
-        
-    run_actual = [datos[0]]
-    for i in range(1, len(datos)):
-        if datos[i] >= datos[i-1]:
-            # El elemento actual es mayor o igual, continúa el run
-            run_actual.append(datos[i])
-        else:
-            # El orden se rompe, el run actual termina
-            runs.append(run_actual)
-            run_actual = [datos[i]]
-            
-    # Agregar el último run
-    runs.append(run_actual)
-    return runs
-
 # --- Algoritmo Principal ---
 
-def natural_merging(archivo_entrada, archivo_salida, archivos_trabajo=['T1.txt', 'T2.txt']):
+def natural_merging(archivo_entrada, archivo_salida, archivos_trabajo=['T1.txt', 'T2.txt'],
+                    memoria=_runs.MEMORIA_POR_DEFECTO, metodo='reemplazo'):
     """
-    Simula la Fusión Natural.
+    Simula la Fusión Natural con memoria acotada.
+    La entrada se lee en streaming con el presupuesto 'memoria'. Los runs
+    iniciales se crean por Selección por Reemplazo, que conserva los runs
+    naturales de la entrada aunque superen la memoria (o, con
+    metodo='bloques', ordenando bloques de la memoria). Un run que continúa
+    el anterior (empieza en un valor no menor que su máximo) se le une; lo
+    mismo ocurre con los runs que producen las fusiones.
+    Devuelve el número de elementos ordenados.
     """
     print("--- Fusión Natural (Natural Merging) ---")
     
     # Paso 1: Distribución inicial de runs naturales
-    datos = leer_datos_archivo(archivo_entrada)
-    if not datos:
+    # Bloques de lectura y escritura de las fusiones de dos vías
+    tamano_bloque = _runs.tamano_bloque_fusion(memoria, 2)
+    runs_a_fusionar = _runs.ArchivoRuns(archivos_trabajo[0], tamano_bloque=tamano_bloque)
+    for run in _runs.generar_runs(archivo_entrada, memoria, metodo):
+        runs_a_fusionar.escribir_run(run, natural=True)
+    runs_a_fusionar.cerrar()
+    if not runs_a_fusionar:
         print("El archivo de entrada está vacío.")
-        return []
-        
-    runs_a_fusionar = obtener_runs_naturales(datos)
-    
-    # Escribimos los runs iniciales en el primer archivo de trabajo
-    escribir_runs_a_archivo(archivos_trabajo[0], runs_a_fusionar)
+        return 0
+    print(f"Runs iniciales ({metodo}): {_runs.describir_runs(runs_a_fusionar.longitudes(), memoria)}")
+    total = runs_a_fusionar.elementos()
     
     pasada = 0
     
@@ -112,40 +71,31 @@ def natural_merging(archivo_entrada, archivo_salida, archivos_trabajo=['T1.txt',
         pasada += 1
         print(f"\nPasada {pasada}: {len(runs_a_fusionar)} runs a fusionar.")
         
-        # Alternamos los archivos de entrada y salida
-        archivo_entrada_pasada = archivos_trabajo[(pasada - 1) % 2]
-        archivo_salida_pasada = archivos_trabajo[pasada % 2]
-        
-        runs_a_fusionar = leer_runs_de_archivo(archivo_entrada_pasada)
-        runs_salida = []
+        # Alternamos los archivos de trabajo; la última pasada (dos runs)
+        # escribe directamente en el archivo de salida
+        if len(runs_a_fusionar) <= 2:
+            archivo_salida_pasada = archivo_salida
+        else:
+            archivo_salida_pasada = archivos_trabajo[pasada % 2]
+        # Los archivos de trabajo son binarios; la salida final se escribe como texto
+        runs_salida = _runs.ArchivoRuns(archivo_salida_pasada,
+                                        texto=archivo_salida_pasada == archivo_salida,
+                                        tamano_bloque=tamano_bloque)
         
-        # Fusionamos pares de runs
-        i = 0
-        while i < len(runs_a_fusionar):
-            run1 = runs_a_fusionar[i]
-            run2 = runs_a_fusionar[i + 1] if i + 1 < len(runs_a_fusionar) else []
-            
-            run_fusionado = fusionar_dos_runs(run1, run2)
-            runs_salida.append(run_fusionado)
-            
-            i += 2
-                
-        # Escribimos los runs fusionados en el archivo de salida
-        escribir_runs_a_archivo(archivo_salida_pasada, runs_salida)
-        print(f"Runs fusionados en {archivo_salida_pasada}: {runs_salida}")
+        # Fusionamos pares de runs en streaming
+        for i in range(0, len(runs_a_fusionar), 2):
+            run_fusionado = _runs.fusionar_en_streaming(runs_a_fusionar.leer_runs(i, i + 2))
+            runs_salida.escribir_run(run_fusionado, natural=True)
+        runs_salida.cerrar()
+        print(f"Runs fusionados en {archivo_salida_pasada}: {len(runs_salida)}")
         
         runs_a_fusionar = runs_salida
         
-    # El resultado final está en el último archivo de salida
-    archivo_final = archivos_trabajo[(pasada) % 2]
-    runs_finales = leer_runs_de_archivo(archivo_final)
-    
-    if runs_finales:
-        resultado = runs_finales[0]
-        escribir_runs_a_archivo(archivo_salida, [resultado])
-        print(f"\nResultado final escrito en {archivo_salida}: {resultado}")
-        return resultado
-    return []
+    # El resultado final es el único run que queda
+    if runs_a_fusionar.nombre != archivo_salida:
+        _runs.escribir_salida(archivo_salida, runs_a_fusionar.leer_run(0))
+    print(f"\nResultado final escrito en {archivo_salida}: {total} elementos")
+    return total
 
 # --- Ejemplo de Uso y Limpieza ---
 
@@ -164,8 +114,8 @@ if __name__ == '__main__':
     with open(ARCHIVO_ENTRADA, 'w') as f:
         f.write('10\n20\n5\n15\n25\n30\n1\n2\n3\n')
     
-    # Ejecutar el algoritmo
-    natural_merging(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, ARCHIVOS_TRABAJO)
+    # Ejecutar el algoritmo (un presupuesto de 96 bytes: runs de 2 elementos)
+    natural_merging(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, ARCHIVOS_TRABAJO, memoria=96)
     
     # Limpieza final
     for f in archivos_a_limpiar:
@@ -2,12 +2,31 @@
 # 10. Fusión de Múltiples Vías Balanceada (Balanced Multiway Merging) - Simulación Conceptual
 #
 # Algoritmo de ordenamiento externo. Utiliza k archivos de entrada y k de salida
-# para fusionar k runs a la vez (k-way merge).
+# para fusionar k runs a la vez (k-way merge). La entrada se lee en streaming
+# con un presupuesto de memoria (ver 006_Runs_Memoria.py).
 # ==============================================================================
 
+import importlib.util
 import os
 import random
-import heapq # Necesario para la fusión de múltiples vías
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_externo_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_runs = cargar_modulo('006_Runs_Memoria.py')
 
 # --- Funciones Auxiliares para Simulación de Archivos ---
 
@@ -17,94 +36,49 @@ def crear_archivo_datos(nombre_archivo, num_elementos=15):
         datos = [str(random.randint(1, 100)) for _ in range(num_elementos)]
         f.write('\n'.join(datos) + '\n')
 
-def leer_datos_archivo(nombre_archivo):
-    """Lee todos los números enteros de un archivo."""
-    try:
-        with open(nombre_archivo, 'r') as f:
-            datos = [int(line.strip()) for line in f if line.strip()]
-        return datos
-    except FileNotFoundError:
-        return []
-
-def escribir_runs_a_archivo(nombre_archivo, runs):
-    """Escribe una lista de runs (secuencias ordenadas) a un archivo."""
-    with open(nombre_archivo, 'w') as f:
-        for run in runs:
-            # Escribimos los elementos del run, separados por comas
-            f.write(','.join(map(str, run)) + '\n')
-            
-def leer_runs_de_archivo(nombre_archivo):
-    """Lee runs (secuencias ordenadas) de un archivo."""
-    runs = []
-    try:
-        with open(nombre_archivo, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    # Convertimos la línea de texto (separada por comas) a una lista de enteros
-                    run = [int(x) for x in line.split(',')]
-                    runs.append(run)
-        return runs
-    except FileNotFoundError:
-        return []
-
 def fusionar_multiples_runs(runs):
-    """Fusión de k runs ordenados (k-way merge) usando un min-heap."""
-    
-    # Inicializamos el heap con el primer elemento de cada run, junto con el índice del run y del elemento
-    heap = []
-    for i, run in enumerate(runs):
-        if run:
-            # (valor, índice_run, índice_elemento)
-            heapq.heappush(heap, (run[0], i, 0))
-            
-    run_fusionado = []
-    
-    while heap:
-        # Extraemos el elemento más pequeño del heap
-        valor, run_idx, elem_idx = heapq.heappop(heap)
-        run_fusionado.append(valor)
-        
-        # Si el run de donde vino el elemento tiene más elementos
-        if elem_idx + 1 < len(runs[run_idx]):
-            # Agregamos el siguiente elemento de ese run al heap
-            siguiente_valor = runs[run_idx][elem_idx + 1]
-            heapq.heappush(heap, (siguiente_valor, run_idx, elem_idx + 1))
-            
-    return run_fusionado
+    """
+    Fusión de k runs ordenados (k-way merge) con un árbol de perdedores (ver
+    fusionar_en_streaming en 006_Runs_Memoria.py). 'runs' puede contener
+    listas o iteradores, como los lectores por bloques de un ArchivoRuns;
+    devuelve un iterador con los valores fusionados.
+    """
+    return _runs.fusionar_en_streaming(runs)
 
-def distribucion_inicial_runs(datos, archivos_trabajo, tamano_memoria=5):
+def distribucion_inicial_runs(archivo_entrada, archivos_trabajo, memoria=_runs.MEMORIA_POR_DEFECTO,
+                              metodo='reemplazo'):
     """
-    Crea runs ordenados internamente y los distribuye entre los archivos de trabajo.
+    Crea runs ordenados, leyendo la entrada en streaming con el presupuesto
+    'memoria' (por Selección por Reemplazo o por bloques, según 'metodo'), y
+    los distribuye entre los archivos de trabajo. Devuelve los archivos de
+    runs (ArchivoRuns).
     """
-    runs = []
+    # Bloques de escritura del tamaño de los de la primera fusión
+    tamano_bloque = _runs.tamano_bloque_fusion(memoria, len(archivos_trabajo))
+    archivos_runs = [_runs.ArchivoRuns(nombre, tamano_bloque=tamano_bloque)
+                     for nombre in archivos_trabajo]
     
-    # 1. Creación de Runs (Ordenamiento Interno)
-    for i in range(0, len(datos), tamano_memoria):
-        bloque = datos[i:i + tamano_memoria]
-        bloque.sort()
-        runs.append(bloque)
-        
-    # 2. Distribución de Runs
-    num_archivos = len(archivos_trabajo)
-    archivos_runs = [[] for _ in range(num_archivos)]
-    
-    for i, run in enumerate(runs):
+    # 1. Creación de Runs y 2. Distribución de Runs
+    for i, run in enumerate(_runs.generar_runs(archivo_entrada, memoria, metodo)):
         # Distribuimos los runs de forma alternada (Round-Robin)
-        indice_archivo = i % num_archivos
-        archivos_runs[indice_archivo].append(run)
-        
-    # Escribimos los runs distribuidos a los archivos de trabajo
-    for i, nombre_archivo in enumerate(archivos_trabajo):
-        escribir_runs_a_archivo(nombre_archivo, archivos_runs[i])
+        archivos_runs[i % len(archivos_runs)].escribir_run(run)
         
-    return runs
+    for archivo in archivos_runs:
+        archivo.cerrar()
+    return archivos_runs
 
 # --- Algoritmo Principal ---
 
-def balanced_multiway_merging(archivo_entrada, archivo_salida, k=3):
+def balanced_multiway_merging(archivo_entrada, archivo_salida, k=3, memoria=_runs.MEMORIA_POR_DEFECTO,
+                              metodo='reemplazo'):
     """
-    Simula la Fusión de Múltiples Vías Balanceada (k-way merge).
+    Simula la Fusión de Múltiples Vías Balanceada (k-way merge) con memoria
+    acotada. En cada pasada, la fusión j-ésima toma el run j-ésimo de cada uno
+    de los k archivos de entrada y reparte el resultado entre los k de salida;
+    los k lectores y el escritor usan bloques de memoria/(k+1) bytes como
+    mucho (ver tamano_bloque_fusion).
+    Los runs iniciales se crean por Selección por Reemplazo (o por bloques,
+    con metodo='bloques'). Devuelve el número de elementos ordenados.
     """
     print(f"--- Fusión de Múltiples Vías Balanceada (k={k}) ---")
     
@@ -112,15 +86,17 @@ def balanced_multiway_merging(archivo_entrada, archivo_salida, k=3):
     archivos_A = [f'A{i}_bmm.txt' for i in range(k)]
     archivos_B = [f'B{i}_bmm.txt' for i in range(k)]
     
-    datos = leer_datos_archivo(archivo_entrada)
-    if not datos:
+    # Paso 1: Distribución inicial de runs
+    archivos_entrada = distribucion_inicial_runs(archivo_entrada, archivos_A, memoria, metodo)
+    num_runs = sum(len(archivo) for archivo in archivos_entrada)
+    if num_runs == 0:
         print("El archivo de entrada está vacío.")
-        return []
+        return 0
+    longitudes = [longitud for archivo in archivos_entrada for longitud in archivo.longitudes()]
+    print(f"Runs iniciales ({metodo}): {_runs.describir_runs(longitudes, memoria)}")
+    total = sum(archivo.elementos() for archivo in archivos_entrada)
+    tamano_bloque = _runs.tamano_bloque_fusion(memoria, k)
         
-    # Paso 1: Distribución inicial de runs
-    runs_iniciales = distribucion_inicial_runs(datos, archivos_A, tamano_memoria=5)
-    num_runs = len(runs_iniciales)
-    
     pasada = 0
     
     # Alternamos entre los conjuntos de archivos A y B
@@ -128,49 +104,36 @@ def balanced_multiway_merging(archivo_entrada, archivo_salida, k=3):
         pasada += 1
         print(f"\nPasada {pasada}: {num_runs} runs a fusionar.")
         
-        # Determinamos los archivos de entrada y salida para esta pasada
-        archivos_entrada = archivos_A if pasada % 2 != 0 else archivos_B
-        archivos_salida = archivos_B if pasada % 2 != 0 else archivos_A
-        
-        # Leemos todos los runs de los archivos de entrada
-        runs_entrada = []
-        for nombre_archivo in archivos_entrada:
-            runs_entrada.extend(leer_runs_de_archivo(nombre_archivo))
-            
-        runs_salida_distribuidos = [[] for _ in range(k)]
+        # La última pasada (k runs o menos) escribe en el archivo de salida
+        if num_runs <= k:
+            nombres_salida = [archivo_salida]
+        else:
+            nombres_salida = archivos_B if pasada % 2 != 0 else archivos_A
+        archivos_salida = [_runs.ArchivoRuns(nombre, texto=nombre == archivo_salida,
+                                             tamano_bloque=tamano_bloque)
+                           for nombre in nombres_salida]
         
-        # Fusionamos k runs a la vez y distribuimos el resultado
-        i = 0
-        j = 0 # Índice para distribuir en los archivos de salida
+        # Fusionamos k runs a la vez (uno de cada archivo) y distribuimos el resultado
         num_runs = 0
-        while i < len(runs_entrada):
-            # Tomamos k runs para fusionar
-            runs_a_fusionar = runs_entrada[i:i + k]
+        for j in range(max(len(archivo) for archivo in archivos_entrada)):
+            runs_a_fusionar = [archivo.leer_run(j) for archivo in archivos_entrada if j < len(archivo)]
             
-            # Realizamos la fusión de múltiples vías
+            # Realizamos la fusión de múltiples vías en streaming y
+            # distribuimos el run fusionado (Round-Robin)
             run_fusionado = fusionar_multiples_runs(runs_a_fusionar)
-            
-            # Distribuimos el run fusionado al archivo de salida 'j'
-            runs_salida_distribuidos[j].append(run_fusionado)
+            archivos_salida[j % len(archivos_salida)].escribir_run(run_fusionado)
             num_runs += 1
             
-            i += k
-            j = (j + 1) % k # Round-Robin para los archivos de salida
-            
-        # Escribimos los runs fusionados en los archivos de salida
-        for idx, nombre_archivo in enumerate(archivos_salida):
-            escribir_runs_a_archivo(nombre_archivo, runs_salida_distribuidos[idx])
+        for archivo in archivos_salida:
+            archivo.cerrar()
+        archivos_entrada = archivos_salida
             
     # El resultado final es el único run que queda
-    archivo_final = archivos_A[0] if pasada % 2 == 0 else archivos_B[0]
-    runs_finales = leer_runs_de_archivo(archivo_final)
-    
-    if runs_finales:
-        resultado = runs_finales[0]
-        escribir_runs_a_archivo(archivo_salida, [resultado])
-        print(f"\nResultado final escrito en {archivo_salida}: {resultado}")
-        return resultado
-    return []
+    archivo_final = next(archivo for archivo in archivos_entrada if archivo)
+    if archivo_final.nombre != archivo_salida:
+        _runs.escribir_salida(archivo_salida, archivo_final.leer_run(0))
+    print(f"\nResultado final escrito en {archivo_salida}: {total} elementos")
+    return total
 
 # --- Ejemplo de Uso y Limpieza ---
 
@@ -187,10 +150,10 @@ if __name__ == '__main__':
             os.remove(f)
 
     # Crear datos de entrada
-    crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=15)
+    crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=1000)
     
-    # Ejecutar el algoritmo
-    balanced_multiway_merging(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, k=K)
+    # Ejecutar el algoritmo (4 KiB de memoria: runs iniciales de ~85 elementos)
+    balanced_multiway_merging(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, k=K, memoria='4KB')
     
     # Limpieza final
     for f in archivos_a_limpiar:
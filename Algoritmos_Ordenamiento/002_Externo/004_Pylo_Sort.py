@@ -1,14 +1,33 @@
 # ==============================================================================
-# 11. Ordenamiento Polifásico (Polyphase Sort) - Simulación Conceptual
+# 11. Ordenamiento Polifásico (Polyphase Sort)
 #
 # Algoritmo de ordenamiento externo. Se basa en la distribución inicial de runs
-# según números de Fibonacci generalizados y la fusión de runs de los archivos
-# no vacíos al archivo vacío.
+# según números de Fibonacci generalizados (completada con runs ficticios) y
+# la fusión de runs de los archivos no vacíos al archivo vacío. La entrada se
+# lee en streaming con un presupuesto de memoria (ver 006_Runs_Memoria.py).
 # ==============================================================================
 
+import importlib.util
 import os
 import random
-import heapq # Necesario para la fusión de múltiples vías
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_externo_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_runs = cargar_modulo('006_Runs_Memoria.py')
 
 # --- Funciones Auxiliares para Simulación de Archivos ---
 
@@ -18,179 +37,163 @@ def crear_archivo_datos(nombre_archivo, num_elementos=15):
         datos = [str(random.randint(1, 100)) for _ in range(num_elementos)]
         f.write('\n'.join(datos) + '\n')
 
-def leer_datos_archivo(nombre_archivo):
-    """Lee todos los números enteros de un archivo."""
-    try:
-        with open(nombre_archivo, 'r') as f:
-            datos = [int(line.strip()) for line in f if line.strip()]
-        return datos
-    except FileNotFoundError:
-        return []
-
-def escribir_runs_a_archivo(nombre_archivo, runs):
-    """Escribe una lista de runs (secuencias ordenadas) a un archivo."""
-    with open(nombre_archivo, 'w') as f:
-        for run in runs:
-            # Escribimos los elementos del run, separados por comas
-            f.write(','.join(map(str, run)) + '\n')
-            
-def leer_runs_de_archivo(nombre_archivo):
-    """Lee runs (secuencias ordenadas) de un archivo."""
-    runs = []
-    try:
-        with open(nombre_archivo, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    # Convertimos la línea de texto (separada por comas) a una lista de enteros
-                    run = [int(x) for x in line.split(',')]
-                    runs.append(run)
-        return runs
-    except FileNotFoundError:
-        return []
-
 def fusionar_multiples_runs(runs):
-    """Fusión de k runs ordenados (k-way merge) usando un min-heap."""
-    
-    heap = []
-    for i, run in enumerate(runs):
-        if run:
-            heapq.heappush(heap, (run[0], i, 0))
-            
-    run_fusionado = []
-    
-    while heap:
-        valor, run_idx, elem_idx = heapq.heappop(heap)
-        run_fusionado.append(valor)
-        
-        if elem_idx + 1 < len(runs[run_idx]):
-            siguiente_valor = runs[run_idx][elem_idx + 1]
-            heapq.heappush(heap, (siguiente_valor, run_idx, elem_idx + 1))
-            
-    return run_fusionado
+    """
+    Fusión de k runs ordenados (k-way merge) con un árbol de perdedores (ver
+    fusionar_en_streaming en 006_Runs_Memoria.py). 'runs' puede contener
+    listas o iteradores, como los lectores por bloques de un ArchivoRuns;
+    devuelve un iterador con los valores fusionados.
+    """
+    return _runs.fusionar_en_streaming(runs)
 
-def distribucion_inicial_runs_simple(datos, archivos_trabajo, tamano_memoria=5):
+def distribucion_polifasica(archivo_entrada, archivos_trabajo, memoria=_runs.MEMORIA_POR_DEFECTO,
+                            metodo='reemplazo'):
     """
-    Crea runs ordenados internamente y los distribuye entre los archivos de trabajo.
-    (Simplificación de la distribución de Fibonacci para el concepto)
+    Crea runs ordenados, leyendo la entrada en streaming con el presupuesto
+    'memoria' (por Selección por Reemplazo o por bloques, según 'metodo'), y
+    los reparte entre los T-1 primeros archivos de trabajo según una
+    distribución de Fibonacci perfecta (Knuth, algoritmo D). El último
+    archivo queda vacío para recibir la primera fusión.
+    En el nivel 1 cada archivo debe recibir un run; al subir de nivel, el
+    número de runs del archivo j pasa a ser a[0] + a[j+1] (para 3 archivos:
+    1-1, 2-1, 3-2, 5-3, 8-5...). Lo que falta para completar el nivel se
+    rellena con runs ficticios (vacíos), que no se escriben: sólo se cuentan.
+    Devuelve (archivos de runs, runs ficticios de cada archivo, nivel).
     """
-    runs = []
-    
-    # 1. Creación de Runs (Ordenamiento Interno)
-    for i in range(0, len(datos), tamano_memoria):
-        bloque = datos[i:i + tamano_memoria]
-        bloque.sort()
-        runs.append(bloque)
-        
-    # 2. Distribución de Runs (Simulación de distribución Fibonacci para 3 archivos)
-    # Una distribución ideal para 3 archivos (k=3) sería 5, 3, 2 runs.
-    # Aquí distribuimos los runs disponibles de forma que uno quede "vacío" o con menos runs.
-    num_archivos = len(archivos_trabajo)
-    archivos_runs = [[] for _ in range(num_archivos)]
+    vias = len(archivos_trabajo) - 1
+    # Bloques de escritura del tamaño de los de las fusiones
+    tamano_bloque = _runs.tamano_bloque_fusion(memoria, vias)
+    archivos_runs = [_runs.ArchivoRuns(nombre, tamano_bloque=tamano_bloque)
+                     for nombre in archivos_trabajo]
     
-    # Distribuimos los runs en proporciones aproximadas (ejemplo: 50%, 30%, 20%)
-    total_runs = len(runs)
+    # a[j]: runs del archivo j en la distribución perfecta del nivel actual;
+    # ficticios[j]: los que aún le faltan (el último elemento es un centinela)
+    a = [1] * vias + [0]
+    ficticios = [1] * vias + [0]
+    nivel = 1
+    j = 0
     
-    # Usamos una distribución simple para el ejemplo conceptual
-    for i, run in enumerate(runs):
-        indice_archivo = i % (num_archivos - 1) # Distribuimos en todos menos el último
-        archivos_runs[indice_archivo].append(run)
-        
-    # Escribimos los runs distribuidos a los archivos de trabajo
-    for i, nombre_archivo in enumerate(archivos_trabajo):
-        escribir_runs_a_archivo(nombre_archivo, archivos_runs[i])
+    for i, run in enumerate(_runs.generar_runs(archivo_entrada, memoria, metodo)):
+        if i > 0:
+            # 1. Elegir el archivo: el siguiente si le faltan más runs que a
+            #    éste, o volver al primero
+            if ficticios[j] < ficticios[j + 1]:
+                j += 1
+            elif ficticios[j] == 0:
+                # 2. Nivel completo: pasar a la siguiente distribución perfecta
+                nivel += 1
+                z = a[0]
+                for t in range(vias):
+                    ficticios[t] = z + a[t + 1] - a[t]
+                    a[t] = z + a[t + 1]
+                j = 0
+            else:
+                j = 0
+        # 3. Escribir el run; deja de ser ficticio
+        archivos_runs[j].escribir_run(run)
+        ficticios[j] -= 1
         
-    return runs
+    for archivo in archivos_runs:
+        archivo.cerrar()
+    if not any(archivos_runs):
+        ficticios = [0] * len(archivos_runs)
+    return archivos_runs, ficticios, nivel
 
 # --- Algoritmo Principal ---
 
-def polyphase_sort_concepto(archivo_entrada, archivo_salida, num_archivos=3):
+def polyphase_sort_concepto(archivo_entrada, archivo_salida, num_archivos=3,
+                            memoria=_runs.MEMORIA_POR_DEFECTO, metodo='reemplazo'):
     """
-    Simula el concepto de Ordenamiento Polifásico.
+    Ordenamiento Polifásico con num_archivos (T) archivos y memoria acotada.
+    Los runs iniciales (por Selección por Reemplazo o, con metodo='bloques',
+    por bloques) se reparten con una distribución de Fibonacci perfecta,
+    completada con runs ficticios. Cada fase fusiona, del primer run
+    pendiente de cada uno de los T-1 archivos de entrada, tantas veces como
+    runs tiene el archivo que menos tiene; ése se vacía y pasa a ser el
+    archivo de salida de la fase siguiente. Los runs ficticios se consumen
+    antes que los reales; si todos los de una fusión lo son, el resultado
+    es otro run ficticio.
+    La posición de lectura de cada archivo y los runs ficticios se llevan en
+    memoria, así que los runs pendientes nunca se releen ni se reescriben:
+    cada fase lee y escribe sólo los elementos que fusiona. Cada fusión lee
+    sus runs y escribe el resultado por bloques de memoria/num_archivos bytes
+    como mucho (ver tamano_bloque_fusion).
+    Devuelve el número de elementos ordenados.
     """
-    print(f"--- Ordenamiento Polifásico (Concepto con {num_archivos} archivos) ---")
+    print(f"--- Ordenamiento Polifásico ({num_archivos} archivos) ---")
+    if num_archivos < 3:
+        raise ValueError("El Ordenamiento Polifásico necesita al menos 3 archivos.")
     
     # Archivos de trabajo
     archivos_trabajo = [f'P{i}_pps.txt' for i in range(num_archivos)]
     
-    datos = leer_datos_archivo(archivo_entrada)
-    if not datos:
+    # Paso 1: Distribución de Fibonacci con runs ficticios
+    archivos_runs, ficticios, nivel = distribucion_polifasica(archivo_entrada, archivos_trabajo,
+                                                              memoria, metodo)
+    total = sum(archivo.elementos() for archivo in archivos_runs)
+    if total == 0:
         print("El archivo de entrada está vacío.")
-        return []
-        
-    # Paso 1: Distribución inicial (Simplificada)
-    runs_iniciales = distribucion_inicial_runs_simple(datos, archivos_trabajo, tamano_memoria=5)
+        return 0
+    longitudes = [longitud for archivo in archivos_runs for longitud in archivo.longitudes()]
+    print(f"Runs iniciales ({metodo}): {_runs.describir_runs(longitudes, memoria)}")
+    print(f"Distribución de nivel {nivel}: "
+          f"{[len(archivo) + f for archivo, f in zip(archivos_runs, ficticios)]} "
+          f"(ficticios: {ficticios})")
     
-    # El archivo de salida inicial (el "vacío" o el que recibe la fusión)
+    # Posición de lectura (primer run pendiente) de cada archivo
+    posiciones = [0] * num_archivos
     archivo_salida_idx = num_archivos - 1
+    elementos_fusionados = 0
+    fase = 0
     
-    pasada = 0
-    
-    while sum(len(leer_runs_de_archivo(f)) for f in archivos_trabajo) > 1:
-        pasada += 1
-        print(f"\nPasada {pasada}")
-        
-        # Archivos de entrada: todos excepto el de salida
+    # Paso 2: Fases de fusión hasta que sólo quede un run
+    while True:
         archivos_entrada_idx = [i for i in range(num_archivos) if i != archivo_salida_idx]
+        pendientes = {i: len(archivos_runs[i]) - posiciones[i] + ficticios[i]
+                      for i in archivos_entrada_idx}
+        fusiones = min(pendientes.values())
+        fase += 1
         
-        runs_entrada_list = [leer_runs_de_archivo(archivos_trabajo[i]) for i in archivos_entrada_idx]
-        
-        # En Polyphase, se fusiona el número mínimo de runs disponibles en los archivos de entrada
-        # Aquí, por simplicidad, fusionaremos el número de runs del archivo con menos runs
-        min_runs = min(len(r) for r in runs_entrada_list)
+        # La última fase (un run en cada archivo de entrada) escribe
+        # directamente en el archivo de salida final
+        if all(pendiente == 1 for pendiente in pendientes.values()):
+            archivos_runs[archivo_salida_idx] = _runs.ArchivoRuns(
+                archivo_salida, texto=True, tamano_bloque=archivos_runs[archivo_salida_idx].tamano_bloque)
+        salida = archivos_runs[archivo_salida_idx]
         
-        runs_salida = []
+        for _ in range(fusiones):
+            # Un run de cada archivo de entrada: primero sus ficticios
+            runs_a_fusionar = []
+            for idx in archivos_entrada_idx:
+                if ficticios[idx]:
+                    ficticios[idx] -= 1
+                else:
+                    runs_a_fusionar.append(archivos_runs[idx].leer_run(posiciones[idx]))
+                    posiciones[idx] += 1
+            if runs_a_fusionar:
+                elementos_fusionados += salida.escribir_run(fusionar_multiples_runs(runs_a_fusionar))
+            else:
+                ficticios[archivo_salida_idx] += 1
+        salida.cerrar()
+        print(f"Fase {fase}: {fusiones} fusiones de {len(archivos_entrada_idx)} vías en {salida.nombre}"
+              f" ({ficticios[archivo_salida_idx]} ficticias)")
         
-        # Fusionamos 'min_runs' veces
-        for i in range(min_runs):
-            # Tomamos el i-ésimo run de cada archivo de entrada
-            runs_a_fusionar = [r[i] for r in runs_entrada_list]
-            
-            # Realizamos la fusión de múltiples vías
-            run_fusionado = fusionar_multiples_runs(runs_a_fusionar)
-            runs_salida.append(run_fusionado)
-            
-        # Escribimos los runs fusionados en el archivo de salida
-        escribir_runs_a_archivo(archivos_trabajo[archivo_salida_idx], runs_salida)
-        print(f"Runs fusionados en {archivos_trabajo[archivo_salida_idx]}: {runs_salida}")
-        
-        # Actualizamos los archivos de entrada (eliminando los runs que se fusionaron)
-        for idx, runs_list in zip(archivos_entrada_idx, runs_entrada_list):
-            runs_restantes = runs_list[min_runs:]
-            escribir_runs_a_archivo(archivos_trabajo[idx], runs_restantes)
-            
-        # El archivo de salida se convierte en un archivo de entrada
-        # El archivo que se vació (el que tenía los runs que se fusionaron) se convierte en el nuevo archivo de salida
-        # (Esta es la parte clave del Polyphase: el archivo que se vacía se convierte en el de salida)
-        
-        # Buscamos el archivo que se vació (el que tiene 0 runs restantes)
-        nuevo_archivo_salida_idx = -1
-        for idx in archivos_entrada_idx:
-            if not leer_runs_de_archivo(archivos_trabajo[idx]):
-                nuevo_archivo_salida_idx = idx
-                break
-        
-        if nuevo_archivo_salida_idx != -1:
-            archivo_salida_idx = nuevo_archivo_salida_idx
-        else:
-            # Si no se vació ninguno (lo cual es un caso límite en la simulación simple),
-            # alternamos al siguiente archivo de trabajo.
-            archivo_salida_idx = (archivo_salida_idx + 1) % num_archivos
-            
-    # El resultado final está en el único archivo que queda con runs
-    archivo_final = ""
-    for f in archivos_trabajo:
-        runs_finales = leer_runs_de_archivo(f)
-        if runs_finales:
-            archivo_final = f
+        if salida.nombre == archivo_salida:
             break
+        
+        # El archivo de entrada que se ha vaciado pasa a ser el de salida
+        # (ésta es la parte clave del Polyphase); los demás siguen desde su
+        # posición actual
+        vaciado = next(idx for idx in archivos_entrada_idx if pendientes[idx] == fusiones)
+        archivos_runs[vaciado].vaciar()
+        posiciones[vaciado] = 0
+        archivo_salida_idx = vaciado
             
-    if archivo_final:
-        resultado = leer_runs_de_archivo(archivo_final)[0]
-        escribir_runs_a_archivo(archivo_salida, [resultado])
-        print(f"\nResultado final escrito en {archivo_salida}: {resultado}")
-        return resultado
-    return []
+    print(f"\nResultado final escrito en {archivo_salida}: {total} elementos")
+    print(f"Elementos leídos y escritos en las fusiones: {elementos_fusionados} "
+          f"({elementos_fusionados / total:.2f} pasadas sobre los datos, "
+          f"{elementos_fusionados * _runs.TAMANO_VALOR} bytes en binario)")
+    return total
 
 # --- Ejemplo de Uso y Limpieza ---
 
@@ -207,10 +210,10 @@ if __name__ == '__main__':
             os.remove(f)
 
     # Crear datos de entrada
-    crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=15)
+    crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=1000)
     
-    # Ejecutar el algoritmo
-    polyphase_sort_concepto(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, num_archivos=NUM_ARCHIVOS)
+    # Ejecutar el algoritmo (4 KiB de memoria: runs iniciales de ~85 elementos)
+    polyphase_sort_concepto(ARCHIVO_ENTRADA, ARCHIVO_SALIDA, num_archivos=NUM_ARCHIVOS, memoria='4KB')
     
     # Limpieza final
     for f in archivos_a_limpiar:
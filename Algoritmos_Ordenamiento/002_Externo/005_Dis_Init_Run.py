@@ -3,12 +3,33 @@
 #
 # Esta es la fase inicial de la mayoría de los algoritmos de ordenamiento externo.
 # Consiste en crear 'runs' (secuencias ordenadas) en memoria y distribuirlos
-# en los archivos de trabajo externos.
+# en los archivos de trabajo externos. La entrada se lee en streaming, en
+# bloques del tamaño del presupuesto de memoria (ver 006_Runs_Memoria.py), y
+# los runs se crean por Selección por Reemplazo, que los alarga a ~2M.
 # ==============================================================================
 
+import importlib.util
 import os
 import random
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga un módulo hermano de este directorio. Es necesario porque los nombres
+    de archivo empiezan por dígitos y no se pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO, nombre_archivo)
+    nombre = os.path.splitext(nombre_archivo)[0]
+    spec = importlib.util.spec_from_file_location(f"_externo_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+_runs = cargar_modulo('006_Runs_Memoria.py')
+
 # --- Funciones Auxiliares para Simulación de Archivos ---
 
 def crear_archivo_datos(nombre_archivo, num_elementos=20):
@@ -17,77 +38,41 @@ def crear_archivo_datos(nombre_archivo, num_elementos=20):
         datos = [str(random.randint(1, 100)) for _ in range(num_elementos)]
         f.write('\n'.join(datos) + '\n')
 
-def leer_datos_archivo(nombre_archivo):
-    """Lee todos los números enteros de un archivo."""
-    try:
-        with open(nombre_archivo, 'r') as f:
-            datos = [int(line.strip()) for line in f if line.strip()]
-        return datos
-    except FileNotFoundError:
-        return []
-
-def escribir_runs_a_archivo(nombre_archivo, runs):
-    """Escribe una lista de runs (secuencias ordenadas) a un archivo."""
-    with open(nombre_archivo, 'w') as f:
-        for run in runs:
-            # Escribimos los elementos del run, separados por comas
-            f.write(','.join(map(str, run)) + '\n')
-            
-def leer_runs_de_archivo(nombre_archivo):
-    """Lee runs (secuencias ordenadas) de un archivo."""
-    runs = []
-    try:
-        with open(nombre_archivo, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    # Convertimos la línea de texto (separada por comas) a una lista de enteros
-                    run = [int(x) for x in line.split(',')]
-                    runs.append(run)
-        return runs
-    except FileNotFoundError:
-        return []
-
 # --- Algoritmo Principal ---
 
-def distribucion_inicial_runs(archivo_entrada, archivos_trabajo, tamano_memoria=5):
+def distribucion_inicial_runs(archivo_entrada, archivos_trabajo, memoria=_runs.MEMORIA_POR_DEFECTO,
+                              metodo='reemplazo'):
     """
-    Simula la fase de Distribución de Secuencias Iniciales.
+    Simula la fase de Distribución de Secuencias Iniciales con memoria acotada.
+    La entrada se lee en streaming: sólo caben en memoria M elementos, los
+    que permite 'memoria' (p. ej. '512MB'). Los runs se crean por Selección
+    por Reemplazo (metodo='reemplazo', runs de ~2M con datos aleatorios) u
+    ordenando bloques de M elementos (metodo='bloques').
+    Devuelve los archivos de runs (ArchivoRuns), con el directorio de runs de
+    cada uno, e informa de las estadísticas de longitud de los runs.
     """
     print("--- Distribución de Secuencias Iniciales ---")
     
-    datos = leer_datos_archivo(archivo_entrada)
-    if not datos:
-        print("El archivo de entrada está vacío.")
-        return []
-        
-    runs = []
-    
-    # 1. Creación de Runs (Ordenamiento Interno)
-    print(f"Creando runs con un tamaño de memoria de {tamano_memoria} elementos...")
-    for i in range(0, len(datos), tamano_memoria):
-        # Leemos un bloque de datos que cabe en la "memoria"
-        bloque = datos[i:i + tamano_memoria]
-        # Ordenamos el bloque internamente (simulando QuickSort o HeapSort)
-        bloque.sort()
-        runs.append(bloque)
-        
-    print(f"Runs creados: {runs}")
-    
-    # 2. Distribución de Runs
-    num_archivos = len(archivos_trabajo)
-    archivos_runs = [[] for _ in range(num_archivos)]
+    archivos_runs = [_runs.ArchivoRuns(nombre) for nombre in archivos_trabajo]
+    num_archivos = len(archivos_runs)
     
+    # 1. Creación de Runs (Selección por Reemplazo u Ordenamiento Interno)
+    print(f"Creando runs ({metodo}) con un presupuesto de memoria de "
+          f"{_runs.interpretar_memoria(memoria)} bytes (M = {_runs.elementos_en_memoria(memoria)} elementos)...")
     print(f"Distribuyendo runs en {num_archivos} archivos de trabajo...")
-    for i, run in enumerate(runs):
-        # Distribuimos los runs de forma alternada (Round-Robin)
-        indice_archivo = i % num_archivos
-        archivos_runs[indice_archivo].append(run)
+    for i, run in enumerate(_runs.generar_runs(archivo_entrada, memoria, metodo)):
+        # 2. Distribución de Runs: de forma alternada (Round-Robin)
+        archivos_runs[i % num_archivos].escribir_run(run)
         
-    # Escribimos los runs distribuidos a los archivos de trabajo
-    for i, nombre_archivo in enumerate(archivos_trabajo):
-        escribir_runs_a_archivo(nombre_archivo, archivos_runs[i])
-        print(f"Runs escritos en {nombre_archivo}: {archivos_runs[i]}")
+    for archivo in archivos_runs:
+        archivo.cerrar()
+        print(f"Runs escritos en {archivo.nombre}: {len(archivo)} "
+              f"(longitudes {[run[1] for run in archivo.runs]})")
+    if not any(archivos_runs):
+        print("El archivo de entrada está vacío.")
+    else:
+        longitudes = [longitud for archivo in archivos_runs for longitud in archivo.longitudes()]
+        print(f"Runs iniciales: {_runs.describir_runs(longitudes, memoria)}")
         
     return archivos_runs
 
@@ -106,8 +91,9 @@ if __name__ == '__main__':
     # Crear datos de entrada
     crear_archivo_datos(ARCHIVO_ENTRADA, num_elementos=15)
     
-    # Ejecutar el algoritmo
-    distribucion_inicial_runs(ARCHIVO_ENTRADA, ARCHIVOS_TRABAJO, tamano_memoria=4)
+    # Ejecutar el algoritmo (un presupuesto de 192 bytes: M = 4 elementos)
+    distribucion_inicial_runs(ARCHIVO_ENTRADA, ARCHIVOS_TRABAJO, memoria=192, metodo='bloques')
+    distribucion_inicial_runs(ARCHIVO_ENTRADA, ARCHIVOS_TRABAJO, memoria=192, metodo='reemplazo')
     
     # Limpieza final
     for f in archivos_a_limpiar:
@@ -0,0 +1,547 @@
+# ==============================================================================
+# 16. Runs en Disco con Memoria Acotada
+#
+# Infraestructura común de los ordenamientos externos (008 a 012): ninguno
+# carga la entrada completa en memoria. La entrada se lee en streaming por
+# bloques cuyo tamaño sale de un presupuesto de memoria en bytes
+# (p. ej. memoria='512MB'); cada bloque se ordena en memoria y se vuelca a un
+# archivo de runs binario (enteros de 64 bits con un directorio de runs en la
+# cabecera). Las fases de fusión leen esos runs también en streaming, bloque a
+# bloque a través de mmap, así que la memoria usada no depende del tamaño de
+# la entrada sino sólo del presupuesto, y nunca se vuelve a interpretar texto.
+#
+# Los runs iniciales pueden generarse también por Selección por Reemplazo:
+# con la misma memoria, los runs miden de media el doble (2M) con datos
+# aleatorios, y una entrada casi ordenada produce un único run.
+#
+# La fusión de k runs usa un árbol de perdedores (torneo): unas log2(k)
+# comparaciones por elemento, sin crear tuplas. Cada lector de run y el
+# escritor de la salida usan un bloque de memoria/(k+1) bytes (con un tope),
+# así que una fusión ocupa k bloques de lectura más uno de escritura, no el
+# tamaño de los runs.
+# ==============================================================================
+
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from heapq import heapify, heappop, heapreplace
+from itertools import islice
+
+# Presupuesto de memoria por defecto para la generación de runs
+MEMORIA_POR_DEFECTO = '64MB'
+# Bytes que ocupa en memoria cada entero de un bloque: el objeto int (28-32 B),
+# su puntero en la lista (8 B) y el búfer temporal de list.sort (hasta 4 B)
+BYTES_POR_ELEMENTO = 48
+# Elementos que se formatean y escriben de una vez al volcar un run de texto
+LOTE_ESCRITURA = 1024
+
+# Selección por Reemplazo: cada entrada del montículo es un único entero con
+# la etiqueta de run en los bits altos y el valor (desplazado para que no sea
+# negativo) en los 64 bits bajos, así que se compara en C sin crear tuplas.
+# Ocupa lo mismo que un elemento de un bloque (BYTES_POR_ELEMENTO).
+DESPLAZAMIENTO_VALOR = 1 << 63
+MASCARA_VALOR = (1 << 64) - 1
+METODOS_RUNS = ('bloques', 'reemplazo')
+
+# Formato binario de los archivos de runs (ver ArchivoRuns)
+FIRMA = b'RUNS'
+VERSION_FORMATO = 1
+TAMANO_VALOR = 8
+# Firma, versión, bytes por valor, número de runs, posición del directorio, elementos
+CABECERA = struct.Struct('<4sHHQQQ')
+# Posición, longitud, mínimo y máximo de cada run
+ENTRADA_DIRECTORIO = struct.Struct('<QQqq')
+# Bytes que se escriben, o se proyectan con mmap al leer, de una vez
+TAMANO_BLOQUE = 1 << 16
+# Tope del bloque de cada lector en una fusión: bloques mayores ya no
+# reducen las llamadas a mmap y write de forma apreciable
+TAMANO_BLOQUE_MAXIMO = 1 << 20
+VALORES_POR_BLOQUE = TAMANO_BLOQUE // TAMANO_VALOR
+GRANULARIDAD_MMAP = mmap.ALLOCATIONGRANULARITY
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+_UNIDADES = {'': 1, 'B': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+# --- Presupuesto de Memoria ---
+
+def interpretar_memoria(memoria):
+    """
+    Convierte un presupuesto de memoria en bytes. Admite un entero (bytes) o
+    una cadena con unidad binaria: '512MB', '64 KiB', '2G', '1024'.
+    """
+    if isinstance(memoria, int):
+        bytes_memoria = memoria
+    else:
+        coincidencia = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*', str(memoria).upper())
+        if coincidencia is None:
+            raise ValueError(f"Presupuesto de memoria no válido: {memoria!r} (p. ej. '512MB').")
+        cantidad, unidad = coincidencia.groups()
+        bytes_memoria = int(float(cantidad) * _UNIDADES[unidad])
+    if bytes_memoria <= 0:
+        raise ValueError("El presupuesto de memoria debe ser positivo.")
+    return bytes_memoria
+
+def elementos_en_memoria(memoria):
+    """Número de enteros que caben a la vez en memoria con el presupuesto dado."""
+    return max(1, interpretar_memoria(memoria) // BYTES_POR_ELEMENTO)
+
+def tamano_bloque_fusion(memoria, vias):
+    """
+    Bytes del bloque de cada lector (y del escritor) en una fusión de 'vias'
+    runs: el presupuesto se reparte entre los 'vias' lectores y la salida,
+    hasta TAMANO_BLOQUE_MAXIMO. Es múltiplo de la granularidad de mmap, con
+    ésta como mínimo.
+    """
+    bloque = min(interpretar_memoria(memoria) // (vias + 1), TAMANO_BLOQUE_MAXIMO)
+    return max(GRANULARIDAD_MMAP, bloque - bloque % GRANULARIDAD_MMAP)
+
+# --- Lectura en Streaming de la Entrada ---
+
+def leer_valores(archivo_entrada):
+    """
+    Iterador sobre los enteros del archivo de entrada (uno por línea; las
+    líneas vacías se ignoran). Un archivo inexistente no da valores.
+    """
+    try:
+        archivo = open(archivo_entrada, 'rb')
+    except FileNotFoundError:
+        return
+    with archivo:
+        for linea in archivo:
+            if not linea.isspace():
+                yield int(linea)
+
+def leer_bloques(archivo_entrada, elementos):
+    """
+    Lee el archivo de entrada en bloques de hasta 'elementos' enteros. Todos
+    los bloques se devuelven en la misma lista, que se vacía antes de leer el
+    siguiente: así nunca hay dos bloques en memoria a la vez, pero cada
+    bloque debe consumirse antes de pedir el siguiente.
+    """
+    valores = leer_valores(archivo_entrada)
+    bloque = []
+    while True:
+        bloque.extend(islice(valores, elementos))
+        if not bloque:
+            return
+        yield bloque
+        bloque.clear()
+
+def generar_runs(archivo_entrada, memoria=MEMORIA_POR_DEFECTO, metodo='bloques'):
+    """
+    Generación de runs iniciales con memoria acotada (generador de runs):
+    - metodo='bloques': lee la entrada en bloques que caben en 'memoria' y
+      ordena cada uno en memoria. Da runs de longitud M (los enteros que
+      caben en el presupuesto).
+    - metodo='reemplazo': Selección por Reemplazo (ver seleccion_por_reemplazo),
+      con runs de longitud media 2M en datos aleatorios.
+    Cada run debe volcarse a disco (consumirse entero) antes de pedir el
+    siguiente: los bloques reutilizan la misma lista y los runs por
+    reemplazo se producen en streaming desde el mismo montículo.
+    """
+    if metodo == 'reemplazo':
+        yield from seleccion_por_reemplazo(archivo_entrada, memoria)
+        return
+    if metodo != 'bloques':
+        raise ValueError(f"Método de generación de runs desconocido: {metodo!r} (use {METODOS_RUNS}).")
+    for bloque in leer_bloques(archivo_entrada, elementos_en_memoria(memoria)):
+        bloque.sort()
+        yield bloque
+
+# --- Selección por Reemplazo ---
+
+def seleccion_por_reemplazo(archivo_entrada, memoria=MEMORIA_POR_DEFECTO):
+    """
+    Generación de runs por Selección por Reemplazo: un montículo de mínimos
+    con los M registros que caben en 'memoria'. Se extrae el mínimo, se
+    escribe en el run actual y su hueco lo ocupa el siguiente registro de la
+    entrada; si éste es menor que el último escrito ya no cabe en el run
+    actual y se etiqueta para el siguiente (la etiqueta ordena antes que el
+    valor). El run termina cuando todo el montículo pertenece al siguiente.
+    Con datos aleatorios los runs miden de media 2M; con datos ordenados o
+    casi ordenados (desorden menor que M), un único run.
+    Devuelve un generador de runs; cada run es un iterador que debe
+    consumirse entero antes de pedir el siguiente.
+    """
+    entrada = leer_valores(archivo_entrada)
+
+    # 1. Llenar el montículo con los M primeros registros (etiqueta 0)
+    monticulo = [_codificar_entrada(0, valor)
+                 for valor in islice(entrada, elementos_en_memoria(memoria))]
+    heapify(monticulo)
+
+    # 2. Un run por etiqueta, hasta vaciar el montículo
+    etiqueta = 0
+    while monticulo:
+        yield _run_por_reemplazo(monticulo, entrada, etiqueta)
+        etiqueta += 1
+
+def _codificar_entrada(etiqueta, valor):
+    """Entrada del montículo: (etiqueta, valor) empaquetados en un entero."""
+    desplazado = valor + DESPLAZAMIENTO_VALOR
+    if not 0 <= desplazado <= MASCARA_VALOR:
+        raise OverflowError("La Selección por Reemplazo admite enteros de 64 bits con signo.")
+    return (etiqueta << 64) | desplazado
+
+def _run_por_reemplazo(monticulo, entrada, etiqueta):
+    """Valores del run 'etiqueta': extrae mínimos mientras sean de ese run."""
+    limite = (etiqueta + 1) << 64
+    while monticulo and monticulo[0] < limite:
+        valor = (monticulo[0] & MASCARA_VALOR) - DESPLAZAMIENTO_VALOR
+        siguiente = next(entrada, None)
+        if siguiente is None:
+            # La entrada se agotó: el montículo sólo se vacía
+            heappop(monticulo)
+        else:
+            # El siguiente registro entra en este run sólo si no es menor
+            # que el valor que se acaba de escribir
+            etiqueta_siguiente = etiqueta if siguiente >= valor else etiqueta + 1
+            heapreplace(monticulo, _codificar_entrada(etiqueta_siguiente, siguiente))
+        yield valor
+
+def estadisticas_runs(longitudes, memoria=None):
+    """
+    Resumen de las longitudes de unos runs: número de runs, elementos,
+    longitud mínima, media y máxima y, si se da 'memoria', la longitud media
+    en múltiplos de M (los elementos que caben en el presupuesto).
+    """
+    longitudes = list(longitudes)
+    if not longitudes:
+        return {'runs': 0, 'elementos': 0}
+    total = sum(longitudes)
+    estadisticas = {
+        'runs': len(longitudes),
+        'elementos': total,
+        'longitud_minima': min(longitudes),
+        'longitud_media': total / len(longitudes),
+        'longitud_maxima': max(longitudes),
+    }
+    if memoria is not None:
+        estadisticas['media_en_memorias'] = estadisticas['longitud_media'] / elementos_en_memoria(memoria)
+    return estadisticas
+
+def describir_runs(longitudes, memoria=None):
+    """Una línea legible con estadisticas_runs (para los informes por pantalla)."""
+    e = estadisticas_runs(longitudes, memoria)
+    if not e['runs']:
+        return "0 runs"
+    texto = (f"{e['runs']} runs de longitud media {e['longitud_media']:.1f} "
+             f"(mín. {e['longitud_minima']}, máx. {e['longitud_maxima']})")
+    if 'media_en_memorias' in e:
+        texto += f", {e['media_en_memorias']:.2f} M"
+    return texto
+
+# --- Archivos de Runs ---
+
+class ArchivoRuns:
+    """
+    Archivo de trabajo con runs (secuencias ordenadas) escritos uno tras otro.
+    Formato binario (por defecto):
+    - Cabecera de TAMANO_CABECERA bytes: firma b'RUNS', versión, bytes por
+      valor, número de runs, posición del directorio y total de elementos.
+    - Los valores de cada run, como enteros de 64 bits con signo little-endian
+      de ancho fijo, escritos y leídos por bloques de TAMANO_BLOQUE bytes.
+    - Al cerrar, el directorio de runs: por cada run, su posición en bytes,
+      su longitud, su mínimo y su máximo (ENTRADA_DIRECTORIO).
+    La lectura recorre cada run bloque a bloque a través de mmap y
+    memoryview, sin interpretar texto, y salta directamente al run k.
+    El directorio también se lleva en memoria (self.runs, con listas
+    [posición, longitud, mínimo, máximo]): los algoritmos pueden contar o
+    descartar runs sin releer el archivo, y ArchivoRuns.abrir lo recupera de
+    un archivo ya escrito.
+    Con texto=True el archivo es de texto, un entero por línea y sin
+    cabecera (el directorio sólo está en memoria): es el formato de entrada,
+    así que un archivo de texto con un solo run sirve de archivo de salida.
+    'tamano_bloque' (bytes) es el tamaño del bloque de escritura y, por
+    defecto, el de la ventana de lectura de cada run (ver tamano_bloque_fusion).
+    """
+
+    def __init__(self, nombre, texto=False, tamano_bloque=TAMANO_BLOQUE):
+        self.nombre = nombre
+        self.texto = texto
+        self.tamano_bloque = tamano_bloque
+        self.runs = []
+        self._escritura = None
+        # Vaciar el archivo (puede quedar de una ejecución anterior)
+        self.vaciar()
+
+    @classmethod
+    def abrir(cls, nombre, tamano_bloque=TAMANO_BLOQUE):
+        """Abre un archivo de runs binario ya escrito, leyendo su directorio."""
+        archivo_runs = cls.__new__(cls)
+        archivo_runs.nombre = nombre
+        archivo_runs.texto = False
+        archivo_runs.tamano_bloque = tamano_bloque
+        archivo_runs._escritura = None
+        with open(nombre, 'rb') as archivo:
+            firma, version, bytes_valor, num_runs, posicion_directorio, _ = \
+                CABECERA.unpack(archivo.read(CABECERA.size))
+            if firma != FIRMA or version != VERSION_FORMATO or bytes_valor != TAMANO_VALOR:
+                raise ValueError(f"{nombre} no es un archivo de runs válido.")
+            archivo.seek(posicion_directorio)
+            directorio = archivo.read(num_runs * ENTRADA_DIRECTORIO.size)
+        archivo_runs.runs = [list(entrada) for entrada in ENTRADA_DIRECTORIO.iter_unpack(directorio)]
+        archivo_runs._fin = posicion_directorio
+        return archivo_runs
+
+    def __len__(self):
+        return len(self.runs)
+
+    def elementos(self):
+        """Número total de elementos escritos en el archivo."""
+        return sum(run[1] for run in self.runs)
+
+    def longitudes(self):
+        """Longitud de cada run, en orden."""
+        return [run[1] for run in self.runs]
+
+    # --- Escritura ---
+
+    def escribir_run(self, valores, natural=False):
+        """
+        Añade un run al final del archivo consumiendo 'valores' (un iterable
+        ordenado) por bloques. Con 'natural', si el run empieza en un valor no
+        menor que el máximo del run anterior, ambos forman un solo run (como
+        en la Fusión Natural). Devuelve la longitud escrita.
+        """
+        iterador = iter(valores)
+        primero = next(iterador, None)
+        if primero is None:
+            return 0
+        if self._escritura is None:
+            if self.texto:
+                self._escritura = open(self.nombre, 'ab')
+            else:
+                # Los datos continúan donde acaban los runs (sobre el
+                # directorio, que se vuelve a escribir al cerrar)
+                self._escritura = open(self.nombre, 'r+b')
+                self._escritura.seek(self._fin)
+
+        # 1. Nuevo run, o continuación natural del anterior
+        if natural and self.runs and self.runs[-1][3] <= primero:
+            run = self.runs[-1]
+        else:
+            run = [self._escritura.tell(), 0, primero, primero]
+            self.runs.append(run)
+
+        # 2. Volcar por bloques; el último valor escrito es el máximo del run
+        if self.texto:
+            longitud, ultimo = self._escribir_texto(primero, iterador)
+        else:
+            longitud, ultimo = self._escribir_binario(primero, iterador)
+        run[1] += longitud
+        run[3] = ultimo
+        return longitud
+
+    def _escribir_texto(self, primero, iterador):
+        longitud = 0
+        lote = [primero]
+        lote.extend(islice(iterador, LOTE_ESCRITURA - 1))
+        while lote:
+            self._escritura.write(('\n'.join(map(str, lote)) + '\n').encode())
+            longitud += len(lote)
+            ultimo = lote[-1]
+            lote = list(islice(iterador, LOTE_ESCRITURA))
+        return longitud, ultimo
+
+    def _escribir_binario(self, primero, iterador):
+        longitud = 0
+        valores_por_bloque = max(1, self.tamano_bloque // TAMANO_VALOR)
+        bloque = array('q', [primero])
+        bloque.extend(islice(iterador, valores_por_bloque - 1))
+        while bloque:
+            longitud += len(bloque)
+            ultimo = bloque[-1]
+            if not _LITTLE_ENDIAN:
+                bloque.byteswap()
+            self._escritura.write(bloque)
+            bloque = array('q', islice(iterador, valores_por_bloque))
+        self._fin = self._escritura.tell()
+        return longitud, ultimo
+
+    def cerrar(self):
+        """
+        Termina la escritura (los runs escritos quedan disponibles para leer).
+        En binario escribe el directorio al final de los datos y actualiza la
+        cabecera.
+        """
+        if self._escritura is None:
+            return
+        if not self.texto:
+            self._escritura.seek(self._fin)
+            for run in self.runs:
+                self._escritura.write(ENTRADA_DIRECTORIO.pack(*run))
+            self._escritura.truncate()
+            self._escritura.seek(0)
+            self._escritura.write(self._cabecera())
+        self._escritura.close()
+        self._escritura = None
+
+    def vaciar(self):
+        """Elimina todos los runs para reutilizar el archivo como salida."""
+        if self._escritura is not None:
+            self._escritura.close()
+            self._escritura = None
+        self.runs = []
+        with open(self.nombre, 'wb') as archivo:
+            if not self.texto:
+                archivo.write(self._cabecera())
+        self._fin = 0 if self.texto else CABECERA.size
+
+    def _cabecera(self):
+        return CABECERA.pack(FIRMA, VERSION_FORMATO, TAMANO_VALOR, len(self.runs),
+                             self._fin if self.runs else CABECERA.size, self.elementos())
+
+    # --- Lectura ---
+
+    def leer_run(self, indice, tamano_bloque=None):
+        """
+        Iterador sobre los valores del run 'indice', leídos en streaming desde
+        su posición en el archivo (en binario, por ventanas de mmap de
+        'tamano_bloque' bytes; por defecto, self.tamano_bloque). La posición
+        se toma al llamar, así que el iterador sigue siendo válido si después
+        se descartan runs del directorio.
+        """
+        posicion, longitud, _, _ = self.runs[indice]
+        if self.texto:
+            return self._leer_texto(posicion, longitud)
+        return self._leer_binario(posicion, longitud, tamano_bloque or self.tamano_bloque)
+
+    def leer_runs(self, inicio=0, fin=None):
+        """Lista de iteradores sobre los runs [inicio, fin) (para fusionarlos)."""
+        fin = len(self.runs) if fin is None else min(fin, len(self.runs))
+        return [self.leer_run(indice) for indice in range(inicio, fin)]
+
+    def _leer_texto(self, posicion, longitud):
+        with open(self.nombre, 'rb') as archivo:
+            archivo.seek(posicion)
+            yield from map(int, islice(archivo, longitud))
+
+    def _leer_binario(self, posicion, longitud, tamano_bloque):
+        # Ventanas alineadas a la granularidad de mmap: sólo una ventana del
+        # run está proyectada en memoria a la vez
+        ventana = max(GRANULARIDAD_MMAP, tamano_bloque - tamano_bloque % GRANULARIDAD_MMAP)
+        fin = posicion + longitud * TAMANO_VALOR
+        with open(self.nombre, 'rb') as archivo:
+            while posicion < fin:
+                inicio = posicion - posicion % GRANULARIDAD_MMAP
+                tamano = min(ventana, fin - inicio)
+                with mmap.mmap(archivo.fileno(), tamano, access=mmap.ACCESS_READ, offset=inicio) as mapa, \
+                        memoryview(mapa) as bloque:
+                    if _LITTLE_ENDIAN:
+                        with bloque[posicion - inicio:].cast('q') as valores:
+                            yield from valores
+                    else:
+                        valores = array('q')
+                        valores.frombytes(bloque[posicion - inicio:])
+                        valores.byteswap()
+                        yield from valores
+                posicion = inicio + tamano
+
+def escribir_salida(archivo_salida, valores):
+    """
+    Escribe 'valores' (ordenados) en archivo_salida en el formato de la
+    entrada, un entero por línea. Devuelve el número de elementos escritos.
+    """
+    salida = ArchivoRuns(archivo_salida, texto=True)
+    longitud = salida.escribir_run(valores)
+    salida.cerrar()
+    return longitud
+
+# --- Fusión con Árbol de Perdedores ---
+
+class _FinDeRun:
+    """Centinela de un run agotado: mayor que cualquier valor."""
+    __slots__ = ()
+
+    def __lt__(self, otro):
+        return False
+
+    def __gt__(self, otro):
+        return True
+
+_FIN_DE_RUN = _FinDeRun()
+
+def fusionar_en_streaming(iteradores):
+    """
+    Fusión de k runs en streaming con un árbol de perdedores (torneo):
+    devuelve un iterador con los valores de todos los runs en orden. Acepta
+    listas o iteradores (p. ej. ArchivoRuns.leer_run) y sólo mantiene en
+    memoria el valor actual de cada run.
+    Las hojas k..2k-1 del árbol son los runs; cada nodo interno guarda el
+    run que perdió la comparación en él y la raíz, el ganador. Tras emitir
+    el valor del ganador sólo se rejuega su camino hasta la raíz, contra los
+    perdedores guardados: unas log2(k) comparaciones por elemento, sin
+    tuplas ni reordenar un montículo. Un run agotado pasa a valer
+    _FIN_DE_RUN, que pierde siempre.
+    """
+    fuentes = [iter(iterador) for iterador in iteradores]
+    k = len(fuentes)
+    if k <= 1:
+        return iter(fuentes[0] if fuentes else ())
+    return _torneo(fuentes, k)
+
+def _torneo(fuentes, k):
+    actuales = [next(fuente, _FIN_DE_RUN) for fuente in fuentes]
+
+    # 1. Construir el árbol de abajo arriba: cada nodo juega los ganadores de
+    #    sus dos hijos, guarda al perdedor y sube al ganador
+    perdedores = [0] * k
+    ganadores = [0] * k + list(range(k))
+    for nodo in range(k - 1, 0, -1):
+        izquierdo, derecho = ganadores[2 * nodo], ganadores[2 * nodo + 1]
+        if actuales[derecho] < actuales[izquierdo]:
+            ganadores[nodo], perdedores[nodo] = derecho, izquierdo
+        else:
+            ganadores[nodo], perdedores[nodo] = izquierdo, derecho
+    ganador = ganadores[1]
+    del ganadores
+
+    # 2. Emitir al ganador, avanzar su run y rejugar su camino hasta la raíz
+    fin, siguiente = _FIN_DE_RUN, next
+    while True:
+        valor = actuales[ganador]
+        if valor is fin:
+            return
+        yield valor
+        valor = actuales[ganador] = siguiente(fuentes[ganador], fin)
+        nodo = (ganador + k) >> 1
+        while nodo:
+            rival = perdedores[nodo]
+            if actuales[rival] < valor:
+                perdedores[nodo] = ganador
+                ganador = rival
+                valor = actuales[rival]
+            nodo >>= 1
+
+def eliminar_archivos(nombres):
+    """Borra los archivos de trabajo que existan."""
+    for nombre in nombres:
+        if os.path.exists(nombre):
+            os.remove(nombre)
+
+# Ejemplo de Uso
+if __name__ == '__main__':
+    import random
+
+    ENTRADA = 'datos_runs_memoria.txt'
+    RUNS = 'runs_memoria.txt'
+    with open(ENTRADA, 'w') as f:
+        f.write('\n'.join(str(random.randint(1, 1000)) for _ in range(1000)) + '\n')
+
+    # Presupuesto de 4 KiB: M = 85 enteros en memoria
+    print(f"'4KB' -> M = {elementos_en_memoria('4KB')} elementos")
+    for metodo in METODOS_RUNS:
+        archivo = ArchivoRuns(RUNS)
+        for run in generar_runs(ENTRADA, memoria='4KB', metodo=metodo):
+            archivo.escribir_run(run)
+        archivo.cerrar()
+        print(f"{metodo:>9}: {describir_runs(archivo.longitudes(), '4KB')}")
+    fusionado = list(fusionar_en_streaming(archivo.leer_runs()))
+    assert fusionado == sorted(fusionado) and len(fusionado) == 1000
+    print("Primeros valores fusionados:", fusionado[:10])
+
+    eliminar_archivos([ENTRADA, RUNS])
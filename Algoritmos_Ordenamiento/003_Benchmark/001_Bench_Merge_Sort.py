@@ -0,0 +1,138 @@
+# ==============================================================================
+# Benchmark: MergeSort recursivo (con slicing) vs. MergeSort ascendente (un búfer)
+# vs. MergeSort in-place por bloques (caché de √n)
+#
+# Compara la versión anterior de merge_sort, que crea dos sublistas en cada
+# nivel de recursión, con la versión ascendente de 001_Interno/006_Merge_Sort.py
+# y con merge_sort_en_sitio del mismo archivo.
+# Mide tiempo de pared, memoria pico (tracemalloc) y listas temporales creadas.
+# ==============================================================================
+
+import importlib.util
+import os
+import random
+import time
+import tracemalloc
+
+DIRECTORIO_ALGORITMOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(ruta_relativa):
+    """
+    Carga un módulo a partir de su ruta dentro de Algoritmos_Ordenamiento.
+    Es necesario porque los nombres de archivo empiezan por dígitos y no se
+    pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO_ALGORITMOS, ruta_relativa)
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    spec = importlib.util.spec_from_file_location(f"_bench_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+# --- Versión de Referencia (la implementación recursiva anterior) ---
+
+def merge_sort_recursivo(lista):
+    """MergeSort recursivo original: crea lista[:mitad] y lista[mitad:] en cada nivel."""
+    if len(lista) > 1:
+        mitad = len(lista) // 2
+        sublista_izquierda = lista[:mitad]
+        sublista_derecha = lista[mitad:]
+
+        merge_sort_recursivo(sublista_izquierda)
+        merge_sort_recursivo(sublista_derecha)
+
+        i = j = k = 0
+        while i < len(sublista_izquierda) and j < len(sublista_derecha):
+            if sublista_izquierda[i] < sublista_derecha[j]:
+                lista[k] = sublista_izquierda[i]
+                i += 1
+            else:
+                lista[k] = sublista_derecha[j]
+                j += 1
+            k += 1
+
+        while i < len(sublista_izquierda):
+            lista[k] = sublista_izquierda[i]
+            i += 1
+            k += 1
+
+        while j < len(sublista_derecha):
+            lista[k] = sublista_derecha[j]
+            j += 1
+            k += 1
+
+    return lista
+
+def listas_temporales_recursivo(n):
+    """
+    Número de listas temporales que crea la versión recursiva para n elementos:
+    cada uno de los n - 1 nodos internos del árbol de recursión crea dos sublistas.
+    """
+    return 2 * (n - 1) if n > 1 else 0
+
+def listas_temporales_ascendente(n):
+    """La versión ascendente reserva un único búfer auxiliar de tamaño n."""
+    return 1 if n > 1 else 0
+
+# --- Medición ---
+
+def medir(funcion, datos):
+    """Devuelve (segundos, bytes_pico) de ordenar una copia de 'datos' con 'funcion'."""
+    copia = list(datos)
+
+    # Tiempo de pared (sin tracemalloc, que ralentiza las asignaciones)
+    inicio = time.perf_counter()
+    funcion(copia)
+    segundos = time.perf_counter() - inicio
+
+    # Memoria pico adicional durante la ordenación
+    copia = list(datos)
+    tracemalloc.start()
+    funcion(copia)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return segundos, pico
+
+def ejecutar_benchmark(tamanos=(1_000, 10_000, 100_000), semilla=42):
+    """Ejecuta la comparación para cada tamaño y devuelve una lista de resultados."""
+    modulo = cargar_modulo(os.path.join('001_Interno', '006_Merge_Sort.py'))
+    generador = random.Random(semilla)
+    resultados = []
+
+    for n in tamanos:
+        datos = [generador.randint(0, n) for _ in range(n)]
+        # Todas las versiones deben producir el mismo resultado
+        assert merge_sort_recursivo(list(datos)) == modulo.merge_sort(list(datos)) == \
+            modulo.merge_sort_en_sitio(list(datos)) == sorted(datos)
+
+        t_rec, pico_rec = medir(merge_sort_recursivo, datos)
+        t_asc, pico_asc = medir(modulo.merge_sort, datos)
+        t_sit, pico_sit = medir(modulo.merge_sort_en_sitio, datos)
+        resultados.append({
+            'n': n,
+            'tiempo_recursivo': t_rec,
+            'tiempo_ascendente': t_asc,
+            'tiempo_en_sitio': t_sit,
+            'pico_recursivo': pico_rec,
+            'pico_ascendente': pico_asc,
+            'pico_en_sitio': pico_sit,
+            'listas_recursivo': listas_temporales_recursivo(n),
+            'listas_ascendente': listas_temporales_ascendente(n),
+        })
+
+    return resultados
+
+# Ejemplo de Uso
+if __name__ == '__main__':
+    print(f"{'n':>9} | {'t recursivo':>12} {'t ascendente':>12} {'t en sitio':>12} | "
+          f"{'pico rec.':>10} {'pico asc.':>10} {'pico sitio':>10} | "
+          f"{'listas rec.':>11} {'listas asc.':>11}")
+    for r in ejecutar_benchmark():
+        print(f"{r['n']:>9} | {r['tiempo_recursivo']:>11.4f}s {r['tiempo_ascendente']:>11.4f}s "
+              f"{r['tiempo_en_sitio']:>11.4f}s | "
+              f"{r['pico_recursivo'] / 1024:>8.1f}KB {r['pico_ascendente'] / 1024:>8.1f}KB "
+              f"{r['pico_en_sitio'] / 1024:>8.1f}KB | "
+              f"{r['listas_recursivo']:>11} {r['listas_ascendente']:>11}")
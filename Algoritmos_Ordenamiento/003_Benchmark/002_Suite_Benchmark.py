@@ -0,0 +1,504 @@
+# ==============================================================================
+# Suite de Benchmark reproducible: todos los algoritmos, distribuciones y tamaños
+#
+# Ejecuta los ordenamientos internos (001_Interno) y los procesos externos
+# (002_Externo) sobre distribuciones generadas con semilla fija y guarda en
+# JSON el tiempo de pared, la memoria pico y el throughput de cada caso.
+# El modo 'comparar' confronta dos ejecuciones y señala las regresiones.
+#
+# Uso:
+#   python 002_Suite_Benchmark.py ejecutar --tamanos 1000 10000 --salida base.json
+#   python 002_Suite_Benchmark.py comparar base.json nuevo.json --umbral 0.10
+# ==============================================================================
+
+import argparse
+import contextlib
+import datetime
+import importlib.util
+import io
+import itertools
+import json
+import math
+import operator
+import os
+import platform
+import random
+import signal
+import sys
+import tempfile
+import time
+import tracemalloc
+
+DIRECTORIO_ALGORITMOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Los algoritmos cuadráticos se omiten por encima de este tamaño
+LIMITE_CUADRATICO = 20_000
+# Tamaños por defecto (el usuario puede llegar a 10**7 con --tamanos)
+TAMANOS_INTERNOS = [1_000, 10_000, 100_000]
+TAMANOS_EXTERNOS = [1_000, 10_000]
+# Umbral relativo por defecto para considerar una diferencia como regresión
+UMBRAL_REGRESION = 0.10
+# Tiempo máximo por caso externo (segundos); un proceso colgado no bloquea la suite
+LIMITE_SEGUNDOS_EXTERNO = 300
+# Presupuesto de memoria de los procesos externos: pequeño para que generen
+# varios runs (y se midan sus fusiones) también con los tamaños por defecto
+MEMORIA_EXTERNOS = '64KB'
+# Elementos por bloque al generar las entradas y al verificar las salidas externas
+BLOQUE_GENERACION = 65_536
+
+# --- Carga de Módulos ---
+
+def cargar_modulo(ruta_relativa):
+    """
+    Carga un módulo a partir de su ruta dentro de Algoritmos_Ordenamiento.
+    Es necesario porque los nombres de archivo empiezan por dígitos y no se
+    pueden importar con 'import'.
+    """
+    ruta = os.path.join(DIRECTORIO_ALGORITMOS, ruta_relativa)
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    spec = importlib.util.spec_from_file_location(f"_bench_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+def algoritmos_internos():
+    """Devuelve {nombre: (función, es_cuadrático)} con los ordenamientos internos."""
+    insercion = cargar_modulo(os.path.join('001_Interno', '001_Insertion_Sort.py'))
+    seleccion = cargar_modulo(os.path.join('001_Interno', '002_Selection_Sort.py'))
+    intercambio = cargar_modulo(os.path.join('001_Interno', '003_Intercambio.py'))
+    arbol = cargar_modulo(os.path.join('001_Interno', '004_Orden_Arb.py'))
+    quick = cargar_modulo(os.path.join('001_Interno', '005_Quick_Sort.py'))
+    merge = cargar_modulo(os.path.join('001_Interno', '006_Merge_Sort.py'))
+    radix = cargar_modulo(os.path.join('001_Interno', '007_Radix_Sort.py'))
+    despachador = cargar_modulo(os.path.join('001_Interno', '008_Despachador.py'))
+    return {
+        'insertion_sort': (insercion.insertion_sort, True),
+        'selection_sort': (seleccion.selection_sort, True),
+        'bubble_sort': (intercambio.bubble_sort, True),
+        'tree_sort': (arbol.tree_sort, False),
+        'quick_sort': (quick.quick_sort, False),
+        'merge_sort': (merge.merge_sort, False),
+        'merge_sort_en_sitio': (merge.merge_sort_en_sitio, False),
+        'tim_sort': (merge.tim_sort, False),
+        'radix_sort': (radix.radix_sort, False),
+        'counting_sort': (radix.counting_sort, False),
+        'bucket_sort': (radix.bucket_sort, False),
+        'ordenar': (despachador.ordenar, False),
+    }
+
+def procesos_externos(memoria=MEMORIA_EXTERNOS):
+    """
+    Devuelve {nombre: función(archivo_entrada, archivo_salida)} con los procesos
+    de 002_Externo, con el presupuesto de memoria 'memoria'. Cada función deja
+    la secuencia ordenada en archivo_salida y devuelve el número de elementos,
+    o devuelve None si el proceso sólo genera runs (distribución inicial).
+    """
+    directa = cargar_modulo(os.path.join('002_Externo', '001_Stra_Merg.py'))
+    natural = cargar_modulo(os.path.join('002_Externo', '002_Natu_Merg.py'))
+    multiple = cargar_modulo(os.path.join('002_Externo', '003_Balan_Multi_Merg.py'))
+    polifasico = cargar_modulo(os.path.join('002_Externo', '004_Pylo_Sort.py'))
+    distribucion = cargar_modulo(os.path.join('002_Externo', '005_Dis_Init_Run.py'))
+
+    def distribuir(entrada, salida):
+        distribucion.distribucion_inicial_runs(entrada, ['D1.txt', 'D2.txt', 'D3.txt'], memoria)
+        return None
+
+    return {
+        'straight_merging': lambda entrada, salida: directa.straight_merging(
+            entrada, salida, ['T1.txt', 'T2.txt'], memoria),
+        'natural_merging': lambda entrada, salida: natural.natural_merging(
+            entrada, salida, ['T1.txt', 'T2.txt'], memoria),
+        'balanced_multiway_merging': lambda entrada, salida: multiple.balanced_multiway_merging(
+            entrada, salida, k=3, memoria=memoria),
+        'polyphase_sort': lambda entrada, salida: polifasico.polyphase_sort_concepto(
+            entrada, salida, num_archivos=3, memoria=memoria),
+        'distribucion_inicial_runs': distribuir,
+    }
+
+# --- Distribuciones de Entrada (con semilla) ---
+
+def _zipf(generador, n, exponente=1.2):
+    """
+    Valores con distribución de Zipf sobre un soporte de hasta 10**5 valores,
+    sorteados por bloques (la secuencia es la misma que con un único sorteo).
+    """
+    soporte = min(n, 100_000) or 1
+    acumulados = list(itertools.accumulate(1 / k ** exponente for k in range(1, soporte + 1)))
+    for inicio in range(0, n, BLOQUE_GENERACION):
+        yield from generador.choices(range(soporte), cum_weights=acumulados,
+                                     k=min(BLOQUE_GENERACION, n - inicio))
+
+def _casi_ordenada(generador, n, intercambios):
+    """
+    Secuencia ordenada con 'intercambios' pares de posiciones aleatorias permutados.
+    Sólo se guardan las posiciones intercambiadas, no la secuencia entera.
+    """
+    cambiadas = {}
+    for _ in range(intercambios if n > 1 else 0):
+        i, j = generador.randrange(n), generador.randrange(n)
+        cambiadas[i], cambiadas[j] = cambiadas.get(j, j), cambiadas.get(i, i)
+    return (cambiadas.get(i, i) for i in range(n))
+
+# Cada distribución devuelve un iterable perezoso con sus 'n' valores
+DISTRIBUCIONES = {
+    'uniforme': lambda g, n, k: (g.randint(0, n) for _ in range(n)),
+    'ordenada': lambda g, n, k: range(n),
+    'invertida': lambda g, n, k: range(n, 0, -1),
+    'organo': lambda g, n, k: (min(i, n - 1 - i) for i in range(n)),
+    'pocos_unicos': lambda g, n, k: (g.randint(0, 9) for _ in range(n)),
+    'diente_sierra': lambda g, n, k: (i % max(2, math.isqrt(n)) for i in range(n)),
+    'zipf': lambda g, n, k: _zipf(g, n),
+    'casi_ordenada': lambda g, n, k: _casi_ordenada(g, n, k if k is not None else max(1, n // 100)),
+}
+
+def generar_valores(distribucion, n, semilla, intercambios=None):
+    """
+    Iterador con los 'n' enteros de la distribución indicada, generados sobre
+    la marcha; la misma semilla da los mismos datos.
+    """
+    generador = random.Random(f"{semilla}-{distribucion}-{n}")
+    return iter(DISTRIBUCIONES[distribucion](generador, n, intercambios))
+
+def generar_datos(distribucion, n, semilla, intercambios=None):
+    """Lista con los valores de generar_valores (para los ordenamientos internos)."""
+    return list(generar_valores(distribucion, n, semilla, intercambios))
+
+def _en_bloques(valores, tamano=BLOQUE_GENERACION):
+    """Agrupa el iterador 'valores' en listas de hasta 'tamano' elementos."""
+    return iter(lambda: list(itertools.islice(valores, tamano)), [])
+
+# --- Verificación en Streaming (procesos externos) ---
+
+def _acumular_huella(huella, bloque):
+    """
+    Añade 'bloque' a la huella [número, suma, suma de cuadrados] del multiconjunto.
+    La huella no depende del orden: entrada y salida ordenada deben coincidir,
+    y una salida con elementos perdidos, duplicados o alterados no coincide.
+    """
+    huella[0] += len(bloque)
+    huella[1] += sum(bloque)
+    huella[2] += sum(valor * valor for valor in bloque)
+
+def _escribir_entrada(ruta, valores):
+    """
+    Escribe los valores (un iterador) en 'ruta', uno por línea y bloque a bloque,
+    sin tener nunca la entrada completa en memoria. Devuelve su huella.
+    """
+    huella = [0, 0, 0]
+    with open(ruta, 'w') as f:
+        for bloque in _en_bloques(valores):
+            _acumular_huella(huella, bloque)
+            f.write('\n'.join(map(str, bloque)) + '\n')
+    return huella
+
+def _verificar_salida(ruta, huella):
+    """
+    Lee 'ruta' por bloques y comprueba que es no decreciente y que su huella es
+    la de la entrada. Devuelve True si la salida es correcta.
+    """
+    acumulada = [0, 0, 0]
+    anterior = None
+    with open(ruta) as f:
+        for bloque in _en_bloques(int(linea) for linea in f if linea.strip()):
+            if anterior is not None and bloque[0] < anterior:
+                return False
+            if not all(map(operator.le, bloque, itertools.islice(bloque, 1, None))):
+                return False
+            anterior = bloque[-1]
+            _acumular_huella(acumulada, bloque)
+    return acumulada == huella
+
+# --- Medición ---
+
+def _medir(funcion, preparar, repeticiones, medir_memoria):
+    """
+    Ejecuta funcion(preparar()) 'repeticiones' veces y devuelve
+    (mejor_tiempo, bytes_pico, resultado). La preparación no se cronometra.
+    La memoria pico se mide en una ejecución aparte porque tracemalloc
+    ralentiza las asignaciones.
+    """
+    mejor = math.inf
+    resultado = None
+    for _ in range(repeticiones):
+        argumento = preparar()
+        inicio = time.perf_counter()
+        resultado = funcion(argumento)
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    pico = None
+    if medir_memoria:
+        argumento = preparar()
+        _, pico = _pico_memoria(lambda: funcion(argumento))
+
+    return mejor, pico, resultado
+
+def _pico_memoria(funcion):
+    """
+    Ejecuta funcion() bajo tracemalloc y devuelve (resultado, bytes_pico). Sólo
+    cuentan las asignaciones hechas durante la llamada.
+    """
+    tracemalloc.start()
+    try:
+        resultado = funcion()
+        return resultado, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def ejecutar_internos(tamanos, distribuciones, algoritmos, semilla, repeticiones,
+                      medir_memoria, intercambios=None):
+    """Mide cada algoritmo interno sobre cada distribución y tamaño."""
+    disponibles = algoritmos_internos()
+    resultados = []
+    for n in tamanos:
+        for distribucion in distribuciones:
+            datos = generar_datos(distribucion, n, semilla, intercambios)
+            esperado = sorted(datos)
+            for nombre in algoritmos:
+                funcion, cuadratico = disponibles[nombre]
+                registro = {'tipo': 'interno', 'algoritmo': nombre,
+                            'distribucion': distribucion, 'n': n}
+                if cuadratico and n > LIMITE_CUADRATICO:
+                    registro['omitido'] = f"cuadrático con n > {LIMITE_CUADRATICO}"
+                    resultados.append(registro)
+                    continue
+
+                segundos, pico, salida = _medir(funcion, lambda: list(datos),
+                                                repeticiones, medir_memoria)
+                registro.update({
+                    'segundos': segundos,
+                    'pico_bytes': pico,
+                    'elementos_por_segundo': n / segundos if segundos > 0 else None,
+                    'correcto': salida == esperado,
+                })
+                resultados.append(registro)
+                _informar(registro)
+    return resultados
+
+@contextlib.contextmanager
+def _limite_de_tiempo(segundos):
+    """
+    Lanza TimeoutError si el bloque tarda más de 'segundos'. Usa SIGALRM, por
+    lo que en sistemas sin esa señal (Windows) no impone ningún límite.
+    """
+    if not segundos or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+
+    def agotado(numero, marco):
+        raise TimeoutError(f"más de {segundos} s")
+
+    anterior = signal.signal(signal.SIGALRM, agotado)
+    signal.setitimer(signal.ITIMER_REAL, segundos)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+
+def ejecutar_externos(tamanos, distribuciones, procesos, semilla, repeticiones,
+                      medir_memoria, intercambios=None, limite_segundos=LIMITE_SEGUNDOS_EXTERNO,
+                      memoria=MEMORIA_EXTERNOS):
+    """
+    Mide cada proceso externo. Cada ejecución trabaja en un directorio temporal
+    (los procesos crean sus archivos de trabajo en el directorio actual) y con
+    la salida por pantalla silenciada. La entrada se genera y escribe por
+    bloques a partir de la semilla; su memoria pico se registra aparte
+    ('pico_generacion_bytes') y no entra en la del proceso ('pico_bytes').
+    El resultado se comprueba después de medir, leyendo el archivo de salida en
+    streaming (orden no decreciente y misma huella que la entrada). Los casos
+    que superan 'limite_segundos' se registran con el error en lugar de medidas.
+    """
+    disponibles = procesos_externos(memoria)
+    resultados = []
+    directorio_original = os.getcwd()
+    for n in tamanos:
+        for distribucion in distribuciones:
+            for nombre in procesos:
+                proceso = disponibles[nombre]
+                registro = {'tipo': 'externo', 'algoritmo': nombre,
+                            'distribucion': distribucion, 'n': n}
+                with tempfile.TemporaryDirectory() as temporal:
+                    os.chdir(temporal)
+                    try:
+                        # 1. Generación de la entrada (fuera de las medidas del proceso)
+                        def generar():
+                            valores = generar_valores(distribucion, n, semilla, intercambios)
+                            return _escribir_entrada('entrada.txt', valores)
+
+                        if medir_memoria:
+                            huella, pico_generacion = _pico_memoria(generar)
+                        else:
+                            huella, pico_generacion = generar(), None
+                        bytes_entrada = os.path.getsize('entrada.txt')
+
+                        # 2. Medición del proceso externo
+                        def ejecutar(_):
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                return proceso('entrada.txt', 'salida.txt')
+
+                        with _limite_de_tiempo(limite_segundos):
+                            segundos, pico, salida = _medir(ejecutar, lambda: None,
+                                                            repeticiones, medir_memoria)
+
+                        # 3. Verificación en streaming de la salida
+                        correcto = None if salida is None else _verificar_salida('salida.txt', huella)
+                    except TimeoutError as error:
+                        registro['error'] = f"tiempo agotado ({error})"
+                    finally:
+                        os.chdir(directorio_original)
+
+                if 'error' not in registro:
+                    registro.update({
+                        'segundos': segundos, 'pico_bytes': pico,
+                        'pico_generacion_bytes': pico_generacion,
+                        'elementos_por_segundo': n / segundos if segundos > 0 else None,
+                        'bytes_por_segundo': bytes_entrada / segundos if segundos > 0 else None,
+                        'correcto': correcto,
+                    })
+                resultados.append(registro)
+                _informar(registro)
+    return resultados
+
+def _informar(registro):
+    """Muestra una línea de progreso por stderr (stdout queda libre para el JSON)."""
+    if 'error' in registro:
+        print(f"{registro['algoritmo']:>26} {registro['distribucion']:>14} n={registro['n']:<9} "
+              f"ERROR: {registro['error']}", file=sys.stderr)
+        return
+    pico = registro['pico_bytes']
+    texto_pico = f"{pico / 1024:>10.1f}KB" if pico is not None else f"{'-':>12}"
+    print(f"{registro['algoritmo']:>26} {registro['distribucion']:>14} n={registro['n']:<9} "
+          f"{registro['segundos']:>9.4f}s {texto_pico} correcto={registro['correcto']}",
+          file=sys.stderr)
+
+# --- Comparación de Ejecuciones ---
+
+def comparar(base, nuevo, umbral=UMBRAL_REGRESION):
+    """
+    Compara dos resultados (diccionarios cargados del JSON) caso a caso.
+    Devuelve la lista de diferencias; cada una indica si es una regresión
+    (tiempo o memoria peor que la base en más de 'umbral', relativo).
+    """
+    def clave(r):
+        return (r['tipo'], r['algoritmo'], r['distribucion'], r['n'])
+
+    def medido(r):
+        return 'omitido' not in r and 'error' not in r
+
+    casos_base = {clave(r): r for r in base['resultados']}
+    diferencias = []
+    for r in nuevo['resultados']:
+        anterior = casos_base.get(clave(r))
+        if anterior is None or 'omitido' in r:
+            continue
+        diferencia = {'caso': clave(r), 'regresion': False}
+        if 'error' in r:
+            # Un caso que antes terminaba y ahora falla es una regresión
+            diferencia['regresion'] = medido(anterior)
+            diferencia['error'] = r['error']
+            diferencias.append(diferencia)
+            continue
+        if not medido(anterior):
+            continue
+        for metrica in ('segundos', 'pico_bytes'):
+            if anterior.get(metrica) and r.get(metrica) is not None:
+                razon = r[metrica] / anterior[metrica]
+                diferencia[metrica] = razon
+                if razon > 1 + umbral:
+                    diferencia['regresion'] = True
+        if r.get('correcto') is False and anterior.get('correcto') is not False:
+            diferencia['regresion'] = True
+            diferencia['incorrecto'] = True
+        diferencias.append(diferencia)
+    return diferencias
+
+# --- Línea de Comandos ---
+
+def _metadatos(argumentos):
+    return {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'semilla': argumentos.semilla,
+        'repeticiones': argumentos.repeticiones,
+        'memoria_externos': argumentos.memoria_externos,
+    }
+
+def main(argv=None):
+    analizador = argparse.ArgumentParser(description=__doc__ or "Suite de benchmark de ordenamiento")
+    subcomandos = analizador.add_subparsers(dest='comando', required=True)
+
+    ejecutar = subcomandos.add_parser('ejecutar', help="ejecuta el benchmark y escribe el JSON")
+    ejecutar.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS_INTERNOS)
+    ejecutar.add_argument('--tamanos-externos', type=int, nargs='+', default=TAMANOS_EXTERNOS)
+    ejecutar.add_argument('--distribuciones', nargs='+', default=list(DISTRIBUCIONES),
+                          choices=list(DISTRIBUCIONES))
+    ejecutar.add_argument('--algoritmos', nargs='*', default=None,
+                          help="algoritmos internos (por defecto, todos)")
+    ejecutar.add_argument('--externos', nargs='*', default=None,
+                          help="procesos externos (por defecto, todos)")
+    ejecutar.add_argument('--intercambios', type=int, default=None,
+                          help="k intercambios de 'casi_ordenada' (por defecto n // 100)")
+    ejecutar.add_argument('--semilla', type=int, default=42)
+    ejecutar.add_argument('--repeticiones', type=int, default=3)
+    ejecutar.add_argument('--limite-segundos', type=float, default=LIMITE_SEGUNDOS_EXTERNO,
+                          help="tiempo máximo por caso externo (0 = sin límite)")
+    ejecutar.add_argument('--memoria-externos', default=MEMORIA_EXTERNOS,
+                          help="presupuesto de memoria de los procesos externos (p. ej. 512MB)")
+    ejecutar.add_argument('--sin-memoria', action='store_true',
+                          help="no medir la memoria pico (evita una ejecución extra)")
+    ejecutar.add_argument('--salida', default=None, help="archivo JSON (por defecto, stdout)")
+
+    comparar_cmd = subcomandos.add_parser('comparar', help="compara dos JSON y señala regresiones")
+    comparar_cmd.add_argument('base')
+    comparar_cmd.add_argument('nuevo')
+    comparar_cmd.add_argument('--umbral', type=float, default=UMBRAL_REGRESION)
+
+    argumentos = analizador.parse_args(argv)
+
+    if argumentos.comando == 'ejecutar':
+        algoritmos = argumentos.algoritmos
+        if algoritmos is None:
+            algoritmos = list(algoritmos_internos())
+        externos = argumentos.externos
+        if externos is None:
+            externos = list(procesos_externos())
+
+        resultados = ejecutar_internos(argumentos.tamanos, argumentos.distribuciones, algoritmos,
+                                       argumentos.semilla, argumentos.repeticiones,
+                                       not argumentos.sin_memoria, argumentos.intercambios)
+        resultados += ejecutar_externos(argumentos.tamanos_externos, argumentos.distribuciones,
+                                        externos, argumentos.semilla, argumentos.repeticiones,
+                                        not argumentos.sin_memoria, argumentos.intercambios,
+                                        argumentos.limite_segundos, argumentos.memoria_externos)
+        documento = {'metadatos': _metadatos(argumentos), 'resultados': resultados}
+
+        if argumentos.salida:
+            with open(argumentos.salida, 'w') as f:
+                json.dump(documento, f, indent=2)
+        else:
+            json.dump(documento, sys.stdout, indent=2)
+            print()
+        return 0
+
+    with open(argumentos.base) as f:
+        base = json.load(f)
+    with open(argumentos.nuevo) as f:
+        nuevo = json.load(f)
+    diferencias = comparar(base, nuevo, argumentos.umbral)
+    regresiones = [d for d in diferencias if d['regresion']]
+    for d in diferencias:
+        marca = "REGRESIÓN" if d['regresion'] else "ok"
+        if 'error' in d:
+            print(f"{marca:>10} {'/'.join(map(str, d['caso'])):<60} {d['error']}")
+            continue
+        tiempo = f"{d['segundos']:.2f}x" if 'segundos' in d else "-"
+        memoria = f"{d['pico_bytes']:.2f}x" if 'pico_bytes' in d else "-"
+        print(f"{marca:>10} {'/'.join(map(str, d['caso'])):<60} tiempo {tiempo:>7} memoria {memoria:>7}")
+    print(f"\n{len(regresiones)} regresiones de {len(diferencias)} casos comparados.")
+    # Código de salida distinto de cero para poder usarlo en integración continua
+    return 1 if regresiones else 0
+
+if __name__ == '__main__':
+    sys.exit(main())